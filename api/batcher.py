@@ -0,0 +1,152 @@
+"""
+Opt-in micro-batching of unseeded draws.
+
+Concurrent requests for readings of the same size that arrive within a short
+window are served by one vectorized draw_batch() call instead of one shuffle
+each. Disabled unless TAROT_READER_BATCHING is set (requires NumPy).
+
+Environment variables:
+    TAROT_READER_BATCHING: Set to 1 to enable micro-batching
+    TAROT_READER_BATCH_WINDOW_MS: Collection window in milliseconds (default 0.5)
+    TAROT_READER_BATCH_MAX: Requests that flush a batch early (default 256)
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+DEFAULT_WINDOW = 0.0005
+DEFAULT_MAX_BATCH = 256
+
+
+class DrawBatcher:
+    """
+    Collect draw requests and serve each window with one batch draw.
+    """
+
+    def __init__(
+        self, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH
+    ):
+        """
+        Args:
+            window: Seconds to wait for more requests after the first one
+            max_batch: Pending requests of one size that trigger an
+                       immediate flush
+        """
+        if window < 0 or max_batch < 1:
+            raise ValueError("window must be >= 0 and max_batch at least 1")
+
+        import numpy as np
+
+        self.window = window
+        self.max_batch = max_batch
+        self.requests = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self._pending: Dict[int, List[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._rng = np.random.default_rng()
+
+    async def draw(self, num_cards: int) -> List[Dict[str, Any]]:
+        """
+        Wait for the next batch and return one reading from it.
+
+        Args:
+            num_cards: Cards per reading (1-78)
+
+        Returns:
+            List of card dictionaries with name, meaning, and orientation
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiting = self._pending.setdefault(num_cards, [])
+        waiting.append(future)
+        self.requests += 1
+
+        if len(waiting) >= self.max_batch:
+            self._flush_size(num_cards)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        self._timer = None
+        for num_cards in list(self._pending):
+            self._flush_size(num_cards)
+
+    def _flush_size(self, num_cards: int):
+        from src.batch import decode_batch, draw_batch
+
+        futures = [
+            future
+            for future in self._pending.pop(num_cards, [])
+            if not future.done()  # skip requests cancelled while waiting
+        ]
+        if not futures:
+            return
+
+        try:
+            card_ids, is_reversed = draw_batch(num_cards, len(futures), rng=self._rng)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        for future, cards in zip(futures, decode_batch(card_ids, is_reversed)):
+            future.set_result(cards)
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, len(futures))
+
+    def stats(self) -> Dict[str, Any]:
+        """Settings and counters of the batcher."""
+        return {
+            "enabled": True,
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch": self.requests / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+        }
+
+
+batcher: Optional[DrawBatcher] = None
+
+
+def configure(
+    enabled: Optional[bool] = None,
+    window: Optional[float] = None,
+    max_batch: Optional[int] = None,
+) -> Optional[DrawBatcher]:
+    """
+    Create the process-wide batcher; arguments default to the environment.
+
+    Returns:
+        The batcher, or None when batching is disabled
+    """
+    global batcher
+    env = os.environ
+    if enabled is None:
+        enabled = env.get("TAROT_READER_BATCHING", "") not in ("", "0")
+    if window is None:
+        window = float(env.get("TAROT_READER_BATCH_WINDOW_MS", DEFAULT_WINDOW * 1000))
+        window /= 1000
+    if max_batch is None:
+        max_batch = int(env.get("TAROT_READER_BATCH_MAX", DEFAULT_MAX_BATCH))
+
+    batcher = DrawBatcher(window, max_batch) if enabled else None
+    return batcher
+
+
+async def draw(num_cards: int) -> Optional[List[Dict[str, Any]]]:
+    """Batched reading of num_cards cards, or None to draw live."""
+    if batcher is None:
+        return None
+    return await batcher.draw(num_cards)
+
+
+def stats() -> Dict[str, Any]:
+    """Batcher metrics, or a disabled marker."""
+    if batcher is None:
+        return {"enabled": False}
+    return batcher.stats()
@@ -0,0 +1,124 @@
+"""
+Pre-serialized card catalog responses.
+
+The deck-info, Major/Minor Arcana and per-suit listings never change while
+a deck version is deployed, so each is validated and JSON-encoded once per
+DECK_VERSION and kept as raw bytes with a gzip variant and a strong ETag.
+cached_response() answers from those bytes, with 304 Not Modified for a
+matching If-None-Match.
+"""
+
+import gzip
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple
+
+from fastapi import Request, Response
+
+from src.deck import DECK_VERSION, MAJOR_ARCANA, MINOR_ARCANA
+from api.models import CardDetailResponse, DeckInfoResponse
+
+# Catalog responses may be reused for an hour, then revalidated by ETag
+CACHE_CONTROL = "public, max-age=3600"
+
+SUITS = ["Wands", "Cups", "Swords", "Pentacles"]
+
+
+class CachedBody(NamedTuple):
+    """One serialized response with its gzip variant."""
+
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    gzip_etag: str
+
+
+def _encode(payload: Any) -> CachedBody:
+    # Same separators and escaping as FastAPI's JSONResponse
+    body = json.dumps(
+        payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    return CachedBody(
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+        etag=f'"{digest}"',
+        gzip_etag=f'"{digest}-gzip"',
+    )
+
+
+def _card_details(cards: List[Dict[str, Any]], suit: Any) -> List[Dict[str, Any]]:
+    return [
+        CardDetailResponse(
+            name=card["name"],
+            suit=suit,
+            arcana="major" if suit is None else "minor",
+            upright_meaning=card["upright"],
+            reversed_meaning=card["reversed"],
+        ).model_dump()
+        for card in cards
+    ]
+
+
+@lru_cache(maxsize=None)
+def get_catalog(deck_version: str = DECK_VERSION) -> Dict[str, CachedBody]:
+    """
+    Serialized catalog responses of a deck version.
+
+    Keys are "deck-info", "major-arcana", "minor-arcana" and "suit/<suit>"
+    with the suit in lower case.
+    """
+    suits = {suit: _card_details(MINOR_ARCANA[suit], suit) for suit in SUITS}
+    deck_info = DeckInfoResponse(
+        total_cards=len(MAJOR_ARCANA) + sum(len(cards) for cards in suits.values()),
+        major_arcana=len(MAJOR_ARCANA),
+        minor_arcana=sum(len(cards) for cards in suits.values()),
+        suits=SUITS,
+    )
+    catalog = {
+        "deck-info": _encode(deck_info.model_dump()),
+        "major-arcana": _encode(_card_details(MAJOR_ARCANA, None)),
+        "minor-arcana": _encode([card for cards in suits.values() for card in cards]),
+    }
+    for suit, cards in suits.items():
+        catalog[f"suit/{suit.lower()}"] = _encode(cards)
+    return catalog
+
+
+def _etag_matches(header: str, entry: CachedBody) -> bool:
+    tags = {tag.strip() for tag in header.split(",")}
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    tags |= {tag[2:] for tag in tags if tag.startswith("W/")}
+    return "*" in tags or entry.etag in tags or entry.gzip_etag in tags
+
+
+def _accepts_gzip(header: str) -> bool:
+    for coding in header.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            quality = params.strip().lower()
+            return quality not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def cached_response(request: Request, entry: CachedBody) -> Response:
+    """
+    Answer a request from cached bytes.
+
+    Returns 304 Not Modified when If-None-Match names the entry, the gzip
+    body when the client accepts gzip, and the plain body otherwise.
+    """
+    compressed = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    headers = {
+        "ETag": entry.gzip_etag if compressed else entry.etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, entry):
+        return Response(status_code=304, headers=headers)
+    if compressed:
+        headers["Content-Encoding"] = "gzip"
+        return Response(entry.gzip_body, media_type="application/json", headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
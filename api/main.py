@@ -4,13 +4,35 @@ FastAPI main application.
 Async REST API for tarot readings with automatic OpenAPI documentation.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from api.routers import readings, cards
+from api import batcher, pool, replay
+from api.catalog import get_catalog
+from api.routers import readings, cards, stats, sessions
 from api.models import HealthCheckResponse
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the card catalog and start the optional pools, batcher and replay log."""
+    get_catalog()
+    batcher.configure()
+    tasks = []
+    if pool.configure():
+        tasks.append(asyncio.create_task(pool.refill_forever()))
+    if replay.configure():
+        tasks.append(asyncio.create_task(replay.flush_forever()))
+    yield
+    for task in tasks:
+        task.cancel()
+    replay.close()
+
+
 # Create FastAPI app with metadata
 app = FastAPI(
     title="Tarot Reader API",
@@ -20,6 +42,8 @@ app = FastAPI(
     This API provides:
     - **Tarot Readings**: Single card, 3-card spread, Celtic Cross, and random draws
     - **Card Information**: Browse the complete 78-card deck with meanings
+    - **Statistics**: Exact or simulated probabilities of spread outcomes
+    - **Dealer Sessions**: Deal cards one at a time from a persistent shuffled deck
     - **Personal Seeds**: Influence readings with MBTI types, questions, or traits
     - **Zero Dependencies**: Pure Python implementation with no external requirements
 
@@ -51,6 +75,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware for browser access
@@ -65,6 +90,8 @@ app.add_middleware(
 # Include routers
 app.include_router(readings.router)
 app.include_router(cards.router)
+app.include_router(stats.router)
+app.include_router(sessions.router)
 
 
 @app.get("/", response_model=dict)
@@ -86,6 +113,7 @@ async def root():
                 "three_card": "/api/v1/readings/three",
                 "celtic_cross": "/api/v1/readings/celtic-cross",
                 "random": "/api/v1/readings/random?count=5",
+                "spread": "/api/v1/readings/spread/horseshoe",
             },
             "cards": {
                 "deck_info": "/api/v1/cards/deck-info",
@@ -94,6 +122,15 @@ async def root():
                 "by_suit": "/api/v1/cards/suit/wands",
                 "search": "/api/v1/cards/search/fool",
             },
+            "stats": {
+                "probability": "/api/v1/stats/probability?spread=celtic&group=Major Arcana&count=3",
+                "pool": "/api/v1/stats/pool",
+                "batcher": "/api/v1/stats/batcher",
+            },
+            "sessions": {
+                "create": "POST /api/v1/sessions",
+                "deal": "POST /api/v1/sessions/{session_id}/deal?count=1",
+            },
         },
         "disclaimer": "For entertainment purposes only",
     }
@@ -2,7 +2,7 @@
 Pydantic models for API request/response validation.
 """
 
-from typing import Optional, List, Literal
+from typing import Dict, Optional, List, Literal, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -29,6 +29,51 @@ class CardResponse(BaseModel):
         }
 
 
+class SpreadAnalytics(BaseModel):
+    """Balance and numerology statistics of a reading."""
+
+    groups: Dict[str, int] = Field(
+        ..., description="Cards per group (Major Arcana and each suit)"
+    )
+    elements: Dict[str, int] = Field(
+        ..., description="Minor Arcana cards per element (Fire, Water, Air, Earth)"
+    )
+    element_balance: float = Field(
+        ..., description="Evenness of the elements, from 0 (one element) to 1"
+    )
+    major_ratio: float = Field(..., description="Share of Major Arcana cards")
+    reversed_ratio: float = Field(..., description="Share of reversed cards")
+    repeated_ranks: List[str] = Field(
+        ..., description="Minor Arcana ranks appearing more than once"
+    )
+    numerology_sum: int = Field(
+        ..., description="Sum of Major Arcana numbers and Minor Arcana ranks"
+    )
+    numerology_root: int = Field(
+        ..., description="Numerology sum reduced to a single digit"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "groups": {
+                    "Major Arcana": 1,
+                    "Wands": 1,
+                    "Cups": 1,
+                    "Swords": 0,
+                    "Pentacles": 0,
+                },
+                "elements": {"Fire": 1, "Water": 1, "Air": 0, "Earth": 0},
+                "element_balance": 0.5,
+                "major_ratio": 0.3333,
+                "reversed_ratio": 0.6667,
+                "repeated_ranks": [],
+                "numerology_sum": 7,
+                "numerology_root": 7,
+            }
+        }
+
+
 class ReadingResponse(BaseModel):
     """Response model for a complete reading."""
 
@@ -37,6 +82,9 @@ class ReadingResponse(BaseModel):
     timestamp: str = Field(..., description="ISO format timestamp of reading")
     seed: Optional[str] = Field(None, description="Personal seed used (if any)")
     summary: Optional[str] = Field(None, description="Reading summary or guidance")
+    analytics: Optional[SpreadAnalytics] = Field(
+        None, description="Spread analytics, when requested with analytics=true"
+    )
 
     class Config:
         json_schema_extra = {
@@ -97,6 +145,124 @@ class CardDetailResponse(BaseModel):
         }
 
 
+class ProbabilityResponse(BaseModel):
+    """Response model for spread probability statistics."""
+
+    probability: float = Field(..., description="Probability of the event (0-1)")
+    method: Literal["exact", "simulation"] = Field(
+        ..., description="Whether the value is exact or simulated"
+    )
+    standard_error: float = Field(
+        ..., description="Standard error of the estimate (0 when exact)"
+    )
+    confidence_interval: Tuple[float, float] = Field(
+        ..., description="95% confidence interval of the probability"
+    )
+    trials: Optional[int] = Field(None, description="Simulated spreads, if any")
+    deck_version: str = Field(..., description="Deck version the value applies to")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "probability": 0.5785,
+                "method": "exact",
+                "standard_error": 0.0,
+                "confidence_interval": [0.5785, 0.5785],
+                "trials": None,
+                "deck_version": "c4a3cb23b3bb",
+            }
+        }
+
+
+class PoolInfo(BaseModel):
+    """Settings and counters of one pre-drawn reading pool."""
+
+    num_cards: int = Field(..., description="Cards per pooled reading")
+    size: int = Field(..., description="Maximum readings held")
+    low_water: int = Field(..., description="Refill threshold")
+    batch_size: int = Field(..., description="Readings drawn per refill")
+    available: int = Field(..., description="Readings ready to serve")
+    hits: int = Field(..., description="Readings served from the pool")
+    exhaustions: int = Field(
+        ..., description="Requests that found the pool empty and drew live"
+    )
+    refills: int = Field(..., description="Refill batches drawn")
+
+
+class PoolStatsResponse(BaseModel):
+    """Response model for reading pool metrics."""
+
+    enabled: bool = Field(..., description="Whether reading pools are enabled")
+    pools: List[PoolInfo] = Field(..., description="Metrics per pool")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "enabled": True,
+                "pools": [
+                    {
+                        "num_cards": 1,
+                        "size": 4096,
+                        "low_water": 1024,
+                        "batch_size": 1024,
+                        "available": 3817,
+                        "hits": 120544,
+                        "exhaustions": 0,
+                        "refills": 121,
+                    }
+                ],
+            }
+        }
+
+
+class BatcherStatsResponse(BaseModel):
+    """Response model for draw micro-batching metrics."""
+
+    enabled: bool = Field(..., description="Whether micro-batching is enabled")
+    window_ms: Optional[float] = Field(
+        None, description="Collection window in milliseconds"
+    )
+    max_batch: Optional[int] = Field(
+        None, description="Pending requests that flush a batch early"
+    )
+    requests: Optional[int] = Field(None, description="Requests served by batches")
+    batches: Optional[int] = Field(None, description="Batch draws performed")
+    mean_batch: Optional[float] = Field(None, description="Mean requests per batch")
+    largest_batch: Optional[int] = Field(None, description="Largest batch served")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "enabled": True,
+                "window_ms": 0.5,
+                "max_batch": 256,
+                "requests": 180000,
+                "batches": 2400,
+                "mean_batch": 75.0,
+                "largest_batch": 256,
+            }
+        }
+
+
+class SessionResponse(BaseModel):
+    """Response model for a dealer session."""
+
+    session_id: str = Field(..., description="Session identifier")
+    remaining: int = Field(..., description="Cards left in the session's deck")
+    expires_in: float = Field(
+        ..., description="Seconds of inactivity before the session expires"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "session_id": "3f2b8c1e9a7d4e6f8b0c2d4e6f8a0b1c",
+                "remaining": 78,
+                "expires_in": 1800.0,
+            }
+        }
+
+
 class HealthCheckResponse(BaseModel):
     """Response model for health check endpoint."""
 
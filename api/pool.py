@@ -0,0 +1,84 @@
+"""
+Opt-in pools of pre-drawn readings for unseeded requests.
+
+Disabled unless TAROT_READER_POOL_SIZE is set to a positive number (requires
+NumPy). When enabled, one pool per spread size is created at startup and a
+background task refills pools that drop to their low-water mark, drawing in
+a worker thread so the event loop keeps serving requests.
+
+Environment variables:
+    TAROT_READER_POOL_SIZE: Readings held per pool (0 disables pooling)
+    TAROT_READER_POOL_LOW_WATER: Refill threshold (default: size / 4)
+    TAROT_READER_POOL_BATCH: Readings drawn per refill (default: size / 4)
+    TAROT_READER_POOL_CARDS: Comma-separated spread sizes (default: 1,3,10)
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+# Seconds between checks of the pools' low-water marks
+REFILL_INTERVAL = 0.005
+
+pools: Dict[int, Any] = {}
+
+
+def configure(
+    size: Optional[int] = None,
+    low_water: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    card_counts: Optional[List[int]] = None,
+) -> Dict[int, Any]:
+    """
+    Create and prime the pools; arguments default to the environment.
+
+    Returns:
+        Mapping of cards per reading to ReadingPool (empty when disabled)
+    """
+    env = os.environ
+    size = int(env.get("TAROT_READER_POOL_SIZE", 0)) if size is None else size
+    pools.clear()
+    if size <= 0:
+        return pools
+
+    from src.pool import ReadingPool
+
+    if low_water is None and env.get("TAROT_READER_POOL_LOW_WATER"):
+        low_water = int(env["TAROT_READER_POOL_LOW_WATER"])
+    if batch_size is None and env.get("TAROT_READER_POOL_BATCH"):
+        batch_size = int(env["TAROT_READER_POOL_BATCH"])
+    if card_counts is None:
+        card_counts = [
+            int(count)
+            for count in env.get("TAROT_READER_POOL_CARDS", "1,3,10").split(",")
+        ]
+
+    for num_cards in card_counts:
+        pool = ReadingPool(num_cards, size, low_water, batch_size)
+        pool.fill()
+        pools[num_cards] = pool
+    return pools
+
+
+def pop(num_cards: int) -> Optional[List[Dict[str, Any]]]:
+    """Pre-drawn reading of num_cards cards, or None to draw live."""
+    pool = pools.get(num_cards)
+    return None if pool is None else pool.pop()
+
+
+async def refill_forever(interval: float = REFILL_INTERVAL):
+    """Top up pools below their low-water mark until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        for pool in list(pools.values()):
+            while pool.needs_refill:
+                await loop.run_in_executor(None, pool.refill)
+        await asyncio.sleep(interval)
+
+
+def stats() -> Dict[str, Any]:
+    """Settings and counters of every pool."""
+    return {
+        "enabled": bool(pools),
+        "pools": [pool.stats() for pool in pools.values()],
+    }
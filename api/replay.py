@@ -0,0 +1,87 @@
+"""
+Opt-in replay log of every reading served.
+
+Disabled unless TAROT_READER_REPLAY_LOG names a log directory. When enabled,
+readings that are not served from a pool or batch are drawn from an explicit
+derived seed with draw_from_seed(), so each one can be regenerated and
+verified later with ``python -m src.replay verify DIR``. A background task
+flushes the log; the request path only queues the reading.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Optional, Union
+
+from src.core import _create_personal_seed, _create_time_seed, draw_from_seed
+from src.replay import ReplayLog
+
+# Seconds between background flushes of the replay log
+FLUSH_INTERVAL = 0.1
+
+logger = logging.getLogger(__name__)
+
+log: Optional[ReplayLog] = None
+
+
+def configure(directory: Optional[str] = None) -> Optional[ReplayLog]:
+    """
+    Open the replay log; the directory defaults to the environment.
+
+    Returns:
+        The log, or None when logging is disabled
+    """
+    global log
+    directory = directory or os.environ.get("TAROT_READER_REPLAY_LOG")
+    log = ReplayLog(directory) if directory else None
+    return log
+
+
+def draw(spread: Union[str, int], personal_seed: Optional[str]) -> Any:
+    """Draw and log a replayable reading, or return None when disabled."""
+    if log is None:
+        return None
+    seed = (
+        _create_personal_seed(personal_seed) if personal_seed else _create_time_seed()
+    )
+    reading = draw_from_seed(spread, seed)
+    _record(spread, reading, seed)
+    return reading
+
+
+def record(spread: Union[str, int], reading: Any):
+    """Log a reading that was not drawn from a seed (e.g., pooled)."""
+    if log is not None:
+        _record(spread, reading)
+
+
+def _record(spread: Union[str, int], reading: Any, seed: Optional[int] = None):
+    # A reading the log cannot hold is still served, just not logged
+    try:
+        log.record(spread, reading, seed)  # type: ignore[union-attr]
+    except ValueError as e:
+        logger.warning("Reading not logged: %s", e)
+
+
+async def flush_forever(interval: float = FLUSH_INTERVAL):
+    """
+    Flush the log in a worker thread until cancelled.
+
+    A failed flush is logged and retried on the next interval rather than
+    ending the task.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        if log is None:
+            continue
+        try:
+            await loop.run_in_executor(None, log.flush)
+        except Exception:
+            logger.exception("Flushing the replay log failed")
+
+
+def close():
+    """Flush, fsync and close the log."""
+    if log is not None:
+        log.close()
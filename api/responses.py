@@ -0,0 +1,122 @@
+"""
+Pre-encoded JSON for reading responses.
+
+Reading endpoints build their bodies here instead of constructing
+CardResponse and ReadingResponse models for FastAPI to validate and encode.
+Cards come from the deck, so their JSON prefix (name, orientation and
+meaning) is encoded once for all 156 (card, orientation) pairs, and
+positions, spread types and summaries once per distinct string. A response
+is then a join of cached bytes plus the timestamp and seed.
+
+The output is byte-identical to FastAPI's encoding of the equivalent
+ReadingResponse; endpoints keep response_model=ReadingResponse, so the
+OpenAPI schema is unchanged.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from fastapi import Response
+
+from src.core import _build_card_result
+from src.deck import get_all_cards
+
+
+def _dumps(value: Any) -> bytes:
+    # Same separators and escaping as FastAPI's JSONResponse
+    return json.dumps(
+        value, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _card_prefix(card: Dict[str, Any]) -> bytes:
+    return (
+        b'{"name":'
+        + _dumps(card["name"])
+        + b',"orientation":'
+        + _dumps(card["orientation"].lower())
+        + b',"meaning":'
+        + _dumps(card["meaning"])
+        + b',"position":'
+    )
+
+
+# Encoded card prefixes keyed by (name, orientation, meaning)
+_CARD_PREFIXES: Dict[Tuple[str, str, str], bytes] = {}
+for _card in get_all_cards():
+    for _is_reversed in (False, True):
+        _result = _build_card_result(_card, _is_reversed)
+        _CARD_PREFIXES[
+            (_result["name"], _result["orientation"], _result["meaning"])
+        ] = _card_prefix(_result)
+
+
+@lru_cache(maxsize=1024)
+def _encoded(value: Optional[str]) -> bytes:
+    """Encoding of a recurring string: positions, spread types, summaries."""
+    return _dumps(value)
+
+
+def encode_card(card: Dict[str, Any], position: Optional[str] = None) -> bytes:
+    """
+    JSON of one card as a CardResponse.
+
+    Args:
+        card: Card dict as returned by the draw functions
+        position: Optional position in the spread
+    """
+    prefix = _CARD_PREFIXES.get((card["name"], card["orientation"], card["meaning"]))
+    if prefix is None:
+        # Cards with custom meanings are encoded directly
+        prefix = _card_prefix(card)
+    return prefix + _encoded(position) + b"}"
+
+
+def encode_reading(
+    spread_type: str,
+    cards: Iterable[Tuple[Dict[str, Any], Optional[str]]],
+    timestamp: str,
+    seed: Optional[str] = None,
+    summary: Optional[str] = None,
+    analytics: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """
+    JSON of a ReadingResponse from trusted internal data, without validation.
+
+    Args:
+        spread_type: Type of spread performed
+        cards: (card dict, position or None) pairs in spread order
+        timestamp: ISO format timestamp
+        seed: Personal seed used, if any
+        summary: Reading summary, if any
+        analytics: Spread analytics as returned by analyze_reading(), if any
+
+    Returns:
+        UTF-8 encoded JSON body
+    """
+    return b"".join(
+        (
+            b'{"spread_type":',
+            _encoded(spread_type),
+            b',"cards":[',
+            b",".join([encode_card(card, position) for card, position in cards]),
+            b'],"timestamp":',
+            _dumps(timestamp),
+            b',"seed":',
+            _dumps(seed),
+            b',"summary":',
+            _encoded(summary),
+            b',"analytics":',
+            _dumps(analytics),
+            b"}",
+        )
+    )
+
+
+class ReadingJSONResponse(Response):
+    """
+    JSON response whose body is already encoded (see encode_reading()).
+    """
+
+    media_type = "application/json"
@@ -3,54 +3,39 @@ Card information endpoints.
 """
 
 from typing import List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
 from src.deck import MAJOR_ARCANA, MINOR_ARCANA
+from api.catalog import cached_response, get_catalog
 from api.models import DeckInfoResponse, CardDetailResponse
 
 router = APIRouter(prefix="/api/v1/cards", tags=["cards"])
 
 
 @router.get("/deck-info", response_model=DeckInfoResponse)
-async def get_deck_info():
+async def get_deck_info(request: Request):
     """
     Get information about the tarot deck.
 
     Returns basic statistics about the 78-card tarot deck including
     the number of Major and Minor Arcana cards and the four suits.
     """
-    return DeckInfoResponse(
-        total_cards=78,
-        major_arcana=22,
-        minor_arcana=56,
-        suits=["Wands", "Cups", "Swords", "Pentacles"],
-    )
+    return cached_response(request, get_catalog()["deck-info"])
 
 
 @router.get("/major-arcana", response_model=List[CardDetailResponse])
-async def get_major_arcana():
+async def get_major_arcana(request: Request):
     """
     Get all Major Arcana cards with their meanings.
 
     The Major Arcana consists of 22 cards representing life's spiritual
     and karmic lessons. These are the most significant cards in the deck.
     """
-    cards = []
-    for card in MAJOR_ARCANA:
-        cards.append(
-            CardDetailResponse(
-                name=card["name"],
-                suit=None,
-                arcana="major",
-                upright_meaning=card["upright"],
-                reversed_meaning=card["reversed"],
-            )
-        )
-    return cards
+    return cached_response(request, get_catalog()["major-arcana"])
 
 
 @router.get("/minor-arcana", response_model=List[CardDetailResponse])
-async def get_minor_arcana():
+async def get_minor_arcana(request: Request):
     """
     Get all Minor Arcana cards with their meanings.
 
@@ -60,22 +45,11 @@ async def get_minor_arcana():
     - **Swords**: Thoughts, intellect, conflict
     - **Pentacles**: Material world, finances, career
     """
-    cards = []
-    for card in MINOR_ARCANA:
-        cards.append(
-            CardDetailResponse(
-                name=card["name"],
-                suit=card["suit"],
-                arcana="minor",
-                upright_meaning=card["upright"],
-                reversed_meaning=card["reversed"],
-            )
-        )
-    return cards
+    return cached_response(request, get_catalog()["minor-arcana"])
 
 
 @router.get("/suit/{suit_name}", response_model=List[CardDetailResponse])
-async def get_cards_by_suit(suit_name: str):
+async def get_cards_by_suit(suit_name: str, request: Request):
     """
     Get all cards from a specific suit.
 
@@ -85,28 +59,13 @@ async def get_cards_by_suit(suit_name: str):
     - **swords**: Thoughts, intellect, conflict
     - **pentacles**: Material world, finances, career
     """
-    suit_name_normalized = suit_name.lower().capitalize()
-
-    if suit_name_normalized not in ["Wands", "Cups", "Swords", "Pentacles"]:
+    entry = get_catalog().get(f"suit/{suit_name.lower()}")
+    if entry is None:
         raise HTTPException(
             status_code=404,
             detail=f"Suit '{suit_name}' not found. Valid suits: Wands, Cups, Swords, Pentacles",
         )
-
-    cards = []
-    for card in MINOR_ARCANA:
-        if card["suit"] == suit_name_normalized:
-            cards.append(
-                CardDetailResponse(
-                    name=card["name"],
-                    suit=card["suit"],
-                    arcana="minor",
-                    upright_meaning=card["upright"],
-                    reversed_meaning=card["reversed"],
-                )
-            )
-
-    return cards
+    return cached_response(request, entry)
 
 
 @router.get("/search/{card_name}", response_model=CardDetailResponse)
@@ -135,16 +94,15 @@ async def search_card_by_name(card_name: str):
             )
 
     # Search Minor Arcana
-    for card in MINOR_ARCANA:
-        if card_name_lower in card["name"].lower():
-            return CardDetailResponse(
-                name=card["name"],
-                suit=card["suit"],
-                arcana="minor",
-                upright_meaning=card["upright"],
-                reversed_meaning=card["reversed"],
-            )
+    for suit, cards in MINOR_ARCANA.items():
+        for card in cards:
+            if card_name_lower in card["name"].lower():
+                return CardDetailResponse(
+                    name=card["name"],
+                    suit=suit,
+                    arcana="minor",
+                    upright_meaning=card["upright"],
+                    reversed_meaning=card["reversed"],
+                )
 
-    raise HTTPException(
-        status_code=404, detail=f"No card found matching '{card_name}'"
-    )
+    raise HTTPException(status_code=404, detail=f"No card found matching '{card_name}'")
@@ -2,24 +2,83 @@
 Reading endpoints for tarot spreads.
 """
 
-from datetime import datetime, timezone
-from typing import Optional
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional, Union
 from fastapi import APIRouter, Query, HTTPException
 
 from src import draw_single, draw_three, celtic_cross, random_drop
-from api.models import ReadingResponse, CardResponse
+from src.core import draw_spread
+from src.daily import CALENDAR_ENV_VAR, DailyCalendar, daily_card
+from src.spreads import get_spread
+from api import batcher, pool, replay
+from api.models import ReadingResponse
+from api.responses import ReadingJSONResponse, encode_reading
 
 router = APIRouter(prefix="/api/v1/readings", tags=["readings"])
 
+# Optional precomputed daily calendar (see src.daily.build_calendar)
+_calendar = (
+    DailyCalendar(os.environ[CALENDAR_ENV_VAR])
+    if os.environ.get(CALENDAR_ENV_VAR)
+    else None
+)
+
+
+async def _predrawn(num_cards: int) -> Optional[List[dict]]:
+    """Unseeded reading from the pool or the micro-batcher, if enabled."""
+    return pool.pop(num_cards) or await batcher.draw(num_cards)
+
+
+def _positioned(spread: Union[str, int], reading: Any) -> Any:
+    """Wrap a bare "single" card in its {position: card} mapping."""
+    if spread == "single" and "name" in reading:
+        return dict(zip(get_spread("single").positions, [reading]))
+    return reading
+
+
+async def _draw_reading(
+    spread: Union[str, int], seed: Optional[str], draw: Callable[[], Any]
+) -> Any:
+    """
+    Draw a reading, preferring pooled or batched cards for unseeded
+    unconstrained spreads, then a replay-logged draw, then draw().
+
+    Named spreads, "single" included, come back as the {position: card}
+    mapping draw_spread() returns; card counts as a list.
+    """
+    if not seed:
+        if isinstance(spread, int):
+            num_cards, positions = spread, None
+        else:
+            layout = get_spread(spread)
+            num_cards = 0 if layout.constrained else layout.size
+            positions = layout.positions
+        cards = await _predrawn(num_cards) if num_cards else None
+        if cards:
+            reading = cards if positions is None else dict(zip(positions, cards))
+            # Replay logs single readings as the bare card draw_single() returns
+            replay.record(spread, cards[0] if spread == "single" else reading)
+            return reading
+
+    reading = replay.draw(spread, seed)
+    return _positioned(spread, draw() if reading is None else reading)
+
+
+def _analytics(reading, requested: bool) -> Optional[dict]:
+    """Compute spread analytics if requested (requires NumPy)."""
+    if not requested:
+        return None
+    try:
+        from src.analytics import analyze_reading
+    except ImportError:
+        raise HTTPException(status_code=400, detail="Analytics require NumPy")
+    return analyze_reading(reading)
 
-def _format_card_response(card: dict, position: Optional[str] = None) -> CardResponse:
-    """Convert internal card dict to CardResponse model."""
-    return CardResponse(
-        name=card["name"],
-        orientation=card["orientation"].lower(),  # Convert to lowercase for validation
-        meaning=card["meaning"],
-        position=position,
-    )
+
+_ANALYTICS_QUERY = Query(
+    False, description="Include suit, element, reversal and numerology analytics"
+)
 
 
 @router.get("/single", response_model=ReadingResponse)
@@ -40,25 +99,71 @@ async def get_single_card_reading(
     **For entertainment purposes only.**
     """
     try:
-        card = draw_single(seed)
-        return ReadingResponse(
-            spread_type="single_card",
-            cards=[_format_card_response(card)],
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            seed=seed,
-            summary=None,
+        (card,) = (
+            await _draw_reading("single", seed, lambda: draw_single(seed))
+        ).values()
+        return ReadingJSONResponse(
+            encode_reading(
+                spread_type="single_card",
+                cards=[(card, None)],
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                seed=seed,
+                summary=None,
+            )
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error drawing card: {str(e)}")
 
 
+@router.get("/daily", response_model=ReadingResponse)
+async def get_daily_card_reading(
+    seed: Optional[str] = Query(
+        None,
+        description="Personal seed; the same seed gets the same card all day",
+        example="INFP",
+    ),
+    day: Optional[date] = Query(
+        None, description="Date of the reading (default: today in UTC)"
+    ),
+):
+    """
+    Card of the day.
+
+    Unlike `/single`, the card is deterministic per seed and date, so
+    responses are cacheable until the end of the day. Cards are read from a
+    precomputed calendar when one is configured and computed otherwise.
+
+    **For entertainment purposes only.**
+    """
+    now = datetime.now(timezone.utc)
+    day = day or now.date()
+    card = (_calendar and _calendar.lookup(seed, day)) or daily_card(seed, day)
+
+    if day == now.date():
+        midnight = datetime.combine(day + timedelta(days=1), datetime.min.time())
+        max_age = int((midnight.replace(tzinfo=timezone.utc) - now).total_seconds())
+    else:
+        max_age = 86400
+    return ReadingJSONResponse(
+        encode_reading(
+            spread_type="daily_card",
+            cards=[(card, None)],
+            timestamp=now.isoformat(),
+            seed=seed,
+            summary=f"Card of the day for {day.isoformat()}.",
+        ),
+        headers={"Cache-Control": f"public, max-age={max_age}"},
+    )
+
+
 @router.get("/three", response_model=ReadingResponse)
 async def get_three_card_reading(
     seed: Optional[str] = Query(
         None,
         description="Personal seed for influenced randomness",
         example="relationship question",
-    )
+    ),
+    analytics: bool = _ANALYTICS_QUERY,
 ):
     """
     Perform a 3-card spread reading (Past/Present/Future).
@@ -71,20 +176,21 @@ async def get_three_card_reading(
     **For entertainment purposes only.**
     """
     try:
-        cards_dict = draw_three(seed)  # Returns dict with position keys
+        # Returns dict with position keys
+        cards_dict = await _draw_reading("three", seed, lambda: draw_three(seed))
 
-        formatted_cards = [
-            _format_card_response(card, position)
-            for position, card in cards_dict.items()
-        ]
-
-        return ReadingResponse(
-            spread_type="three_card",
-            cards=formatted_cards,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            seed=seed,
-            summary="A three-card spread revealing past influences, present circumstances, and future potential.",
+        return ReadingJSONResponse(
+            encode_reading(
+                spread_type="three_card",
+                cards=[(card, position) for position, card in cards_dict.items()],
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                seed=seed,
+                summary=get_spread("three").summary,
+                analytics=_analytics(cards_dict, analytics),
+            )
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error drawing cards: {str(e)}")
 
@@ -93,7 +199,8 @@ async def get_three_card_reading(
 async def get_celtic_cross_reading(
     seed: Optional[str] = Query(
         None, description="Personal seed for influenced randomness"
-    )
+    ),
+    analytics: bool = _ANALYTICS_QUERY,
 ):
     """
     Perform a comprehensive 10-card Celtic Cross reading.
@@ -113,20 +220,21 @@ async def get_celtic_cross_reading(
     **For entertainment purposes only.**
     """
     try:
-        cards_dict = celtic_cross(seed)  # Returns dict with position keys
+        # Returns dict with position keys
+        cards_dict = await _draw_reading("celtic", seed, lambda: celtic_cross(seed))
 
-        formatted_cards = [
-            _format_card_response(card, position)
-            for position, card in cards_dict.items()
-        ]
-
-        return ReadingResponse(
-            spread_type="celtic_cross",
-            cards=formatted_cards,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            seed=seed,
-            summary="A comprehensive Celtic Cross reading examining all aspects of your situation.",
+        return ReadingJSONResponse(
+            encode_reading(
+                spread_type="celtic_cross",
+                cards=[(card, position) for position, card in cards_dict.items()],
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                seed=seed,
+                summary=get_spread("celtic").summary,
+                analytics=_analytics(cards_dict, analytics),
+            )
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error drawing cards: {str(e)}")
 
@@ -139,7 +247,8 @@ async def get_random_drop_reading(
         le=78,
         description="Number of cards to draw (1-78)",
         example=5,
-    )
+    ),
+    analytics: bool = _ANALYTICS_QUERY,
 ):
     """
     Draw random cards using pure time-based randomness.
@@ -158,15 +267,59 @@ async def get_random_drop_reading(
                 status_code=400, detail="Count must be between 1 and 78"
             )
 
-        cards = random_drop(count)
-        formatted_cards = [_format_card_response(card) for card in cards]
+        cards = await _draw_reading(count, None, lambda: random_drop(count))
+        return ReadingJSONResponse(
+            encode_reading(
+                spread_type="random_drop",
+                cards=[(card, None) for card in cards],
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                seed=None,
+                summary=f"Random draw of {count} card{'s' if count != 1 else ''} using time-based randomness.",
+                analytics=_analytics(cards, analytics),
+            )
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error drawing cards: {str(e)}")
+
+
+@router.get("/spread/{name}", response_model=ReadingResponse)
+async def get_named_spread_reading(
+    name: str,
+    seed: Optional[str] = Query(
+        None, description="Personal seed for influenced randomness"
+    ),
+    analytics: bool = _ANALYTICS_QUERY,
+):
+    """
+    Perform a reading for any registered spread.
+
+    Spreads are defined as data (JSON or TOML) and compiled once at startup,
+    so new spreads are available here without code changes. Built-in spreads:
+    - **single**, **three**, **celtic**
+    - **horseshoe**: 7-card situation reading
+    - **guidance**: 3 cards with a Major Arcana lesson
+
+    **For entertainment purposes only.**
+    """
+    try:
+        layout = get_spread(name)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    try:
+        cards_dict = await _draw_reading(name, seed, lambda: draw_spread(name, seed))
 
-        return ReadingResponse(
-            spread_type="random_drop",
-            cards=formatted_cards,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            seed=None,
-            summary=f"Random draw of {count} card{'s' if count != 1 else ''} using time-based randomness.",
+        return ReadingJSONResponse(
+            encode_reading(
+                spread_type=layout.name,
+                cards=[(card, position) for position, card in cards_dict.items()],
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                seed=seed,
+                summary=layout.summary,
+                analytics=_analytics(cards_dict, analytics),
+            )
         )
     except HTTPException:
         raise
@@ -0,0 +1,71 @@
+"""
+Dealer session endpoints for dealing cards one at a time across requests.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import APIRouter, Query, HTTPException
+
+from src.dealer import SessionStore
+from api.models import ReadingResponse, SessionResponse
+from api.responses import ReadingJSONResponse, encode_reading
+
+router = APIRouter(prefix="/api/v1/sessions", tags=["sessions"])
+
+# Process-wide store; about 40 MB at its default 100k-session cap
+store = SessionStore()
+
+
+@router.post("", response_model=SessionResponse)
+async def create_session(
+    seed: Optional[str] = Query(
+        None,
+        description="Personal seed for influenced randomness",
+        example="INFP",
+    )
+):
+    """
+    Shuffle a fresh deck and start a dealer session.
+
+    Deal from it with `POST /api/v1/sessions/{session_id}/deal`. Cards are
+    never repeated within a session. Sessions expire after a period of
+    inactivity and the least recently used are evicted under memory pressure.
+    """
+    session_id = store.create(seed)
+    return SessionResponse(session_id=session_id, remaining=78, expires_in=store.ttl)
+
+
+@router.post("/{session_id}/deal", response_model=ReadingResponse)
+async def deal_from_session(
+    session_id: str,
+    count: int = Query(1, ge=1, le=78, description="Number of cards to deal"),
+):
+    """
+    Deal the next cards from a session's deck.
+
+    **For entertainment purposes only.**
+    """
+    try:
+        cards, remaining = store.deal(session_id, count)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ReadingJSONResponse(
+        encode_reading(
+            spread_type="dealer_session",
+            cards=[(card, None) for card in cards],
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            seed=None,
+            summary=f"{remaining} cards remain in the deck.",
+        )
+    )
+
+
+@router.delete("/{session_id}", response_model=dict)
+async def delete_session(session_id: str):
+    """End a dealer session."""
+    if not store.delete(session_id):
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+    return {"deleted": session_id}
@@ -0,0 +1,103 @@
+"""
+Statistics endpoints for spread probabilities.
+"""
+
+from typing import Literal, Optional
+from fastapi import APIRouter, Query, HTTPException
+
+from src.probability import spread_probability
+from api import batcher, pool
+from api.models import BatcherStatsResponse, PoolStatsResponse, ProbabilityResponse
+
+router = APIRouter(prefix="/api/v1/stats", tags=["stats"])
+
+
+# A plain def: FastAPI runs it in its threadpool, so up to a million
+# simulated spreads do not block the event loop
+@router.get("/probability", response_model=ProbabilityResponse)
+def get_spread_probability(
+    spread: str = Query(
+        "celtic",
+        description="Spread type: single, three, celtic, or a number of cards (1-78)",
+        example="celtic",
+    ),
+    card: Optional[str] = Query(
+        None, description="Card name to match", example="The Tower"
+    ),
+    group: Optional[str] = Query(
+        None,
+        description="Group to match: Major Arcana, Wands, Cups, Swords or Pentacles",
+        example="Major Arcana",
+    ),
+    position: Optional[str] = Query(
+        None,
+        description="Position name or 1-based number; omit to count matching cards",
+        example="Final Outcome",
+    ),
+    orientation: Optional[Literal["upright", "reversed"]] = Query(
+        None, description="Only match cards in this orientation"
+    ),
+    count: int = Query(1, ge=0, le=78, description="Number of matching cards"),
+    comparison: Literal["at_least", "at_most", "exactly"] = Query(
+        "at_least", description="How the matching-card count compares to count"
+    ),
+    method: Literal["auto", "exact", "simulation"] = Query(
+        "auto", description="Force exact computation or simulation"
+    ),
+    trials: int = Query(
+        100_000, ge=1_000, le=1_000_000, description="Simulated spreads if simulating"
+    ),
+):
+    """
+    Probability of an event in a spread.
+
+    Examples:
+    - Three or more Major Arcana in a Celtic Cross:
+      `?spread=celtic&group=Major Arcana&count=3`
+    - The Tower reversed in Final Outcome:
+      `?spread=celtic&card=The Tower&position=Final Outcome&orientation=reversed`
+
+    Unweighted spreads are computed exactly; results are cached per deck version.
+    """
+    spread_value = int(spread) if spread.isdigit() else spread
+    try:
+        return ProbabilityResponse(
+            **spread_probability(
+                spread_value,
+                card=card,
+                group=group,
+                position=position,
+                orientation=orientation,
+                count=count,
+                comparison=comparison,
+                method=method,
+                trials=trials,
+            )
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ImportError:
+        raise HTTPException(status_code=400, detail="Simulation requires NumPy")
+
+
+@router.get("/pool", response_model=PoolStatsResponse)
+async def get_pool_stats():
+    """
+    Metrics of the pre-drawn reading pools.
+
+    Pools are enabled with the TAROT_READER_POOL_SIZE environment variable.
+    A growing `exhaustions` count means requests outpace refills; raise the
+    pool size, batch size or low-water mark.
+    """
+    return PoolStatsResponse(**pool.stats())
+
+
+@router.get("/batcher", response_model=BatcherStatsResponse)
+async def get_batcher_stats():
+    """
+    Metrics of draw micro-batching.
+
+    Enabled with TAROT_READER_BATCHING=1; the window and flush size are set
+    with TAROT_READER_BATCH_WINDOW_MS and TAROT_READER_BATCH_MAX.
+    """
+    return BatcherStatsResponse(**batcher.stats())
@@ -9,15 +9,63 @@ This package provides functions for tarot card readings including:
 For entertainment purposes only.
 """
 
-from .core import draw_single, draw_three, celtic_cross, random_drop
-from .search import search_cards
-from .text_formatter import (
-    get_single_card_text,
-    get_three_card_text,
-    get_celtic_cross_text,
-    get_random_cards_text,
-    get_reading_summary,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .core import (
+        draw_single,
+        draw_three,
+        celtic_cross,
+        random_drop,
+        draw_constrained,
+        draw_spread,
+    )
+    from .daily import daily_card
+    from .search import search_cards
+    from .spreads import get_spread, list_spreads, load_spreads, register_spread
+    from .text_formatter import (
+        get_single_card_text,
+        get_three_card_text,
+        get_celtic_cross_text,
+        get_random_cards_text,
+        get_reading_summary,
+        get_spread_text,
+        render,
+        render_summary,
+        get_renderer,
+        list_renderers,
+        register_renderer,
+    )
+
+# Public names and the submodule defining each. They are imported on first
+# access, so "import src" stays cheap for the --socket client, which only
+# needs __version__.
+_EXPORTS = {
+    "draw_single": "core",
+    "draw_three": "core",
+    "celtic_cross": "core",
+    "random_drop": "core",
+    "draw_constrained": "core",
+    "draw_spread": "core",
+    "daily_card": "daily",
+    "search_cards": "search",
+    "get_spread": "spreads",
+    "list_spreads": "spreads",
+    "load_spreads": "spreads",
+    "register_spread": "spreads",
+    "get_single_card_text": "text_formatter",
+    "get_three_card_text": "text_formatter",
+    "get_celtic_cross_text": "text_formatter",
+    "get_random_cards_text": "text_formatter",
+    "get_reading_summary": "text_formatter",
+    "get_spread_text": "text_formatter",
+    "render": "text_formatter",
+    "render_summary": "text_formatter",
+    "get_renderer": "text_formatter",
+    "list_renderers": "text_formatter",
+    "register_renderer": "text_formatter",
+}
 
 __version__ = "0.0.5"
 __author__ = "Tarot Reader"
@@ -27,10 +75,36 @@ __all__ = [
     "draw_three",
     "celtic_cross",
     "random_drop",
+    "draw_constrained",
+    "draw_spread",
+    "daily_card",
     "search_cards",
+    "get_spread",
+    "list_spreads",
+    "load_spreads",
+    "register_spread",
     "get_single_card_text",
     "get_three_card_text",
     "get_celtic_cross_text",
     "get_random_cards_text",
     "get_reading_summary",
+    "get_spread_text",
+    "render",
+    "render_summary",
+    "get_renderer",
+    "list_renderers",
+    "register_renderer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_EXPORTS))
@@ -3,12 +3,153 @@ Command-line interface for tarot-reader.
 """
 
 import argparse
+import os
+import sys
 from . import __version__
-from .text_formatter import (
-    get_single_card_text,
-    get_three_card_text,
-    get_celtic_cross_text,
-)
+
+# Reading modules are imported where they are used, so that the --socket
+# client path only loads the standard library before asking the daemon.
+
+
+def _add_batch_parser(subparsers):
+    batch = subparsers.add_parser(
+        "batch",
+        help="Generate many readings in one process",
+        description="Generate many readings without prompts. Output is "
+        "written in order; progress and throughput go to stderr.",
+    )
+    batch.add_argument(
+        "--spread",
+        default="single",
+        help="Spread name or number of cards (default: single)",
+    )
+    source = batch.add_mutually_exclusive_group(required=True)
+    source.add_argument("--count", "-n", type=int, help="Number of readings")
+    source.add_argument(
+        "--input",
+        "-i",
+        help='JSONL file of seeds (integers, strings or {"seed": ...}); '
+        "one reading per row, '-' for stdin",
+    )
+    batch.add_argument(
+        "--format",
+        "-f",
+        default="jsonl",
+        help="Output format: npy or a registered renderer such as jsonl, "
+        "terminal, summary, markdown or html (default: jsonl)",
+    )
+    batch.add_argument(
+        "--workers", "-w", type=int, default=1, help="Worker processes (default: 1)"
+    )
+    batch.add_argument("--out", "-o", default="-", help="Output file (default: stdout)")
+    batch.add_argument(
+        "--seed",
+        type=int,
+        help="Corpus seed for reproducible --count output",
+    )
+    batch.add_argument(
+        "--quiet", "-q", action="store_true", help="Do not report progress"
+    )
+
+
+def _add_serve_parser(subparsers):
+    serve = subparsers.add_parser(
+        "serve",
+        help="Run a warm daemon answering readings over a Unix socket",
+        description="Keep the deck and renderers loaded and answer reading "
+        "requests from 'tarot-reader --socket PATH' clients.",
+    )
+    serve.add_argument("--socket", required=True, help="Unix socket path")
+    serve.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Exit after this many seconds without requests (default: never)",
+    )
+    serve.add_argument(
+        "--stop", action="store_true", help="Stop the daemon serving on --socket"
+    )
+
+
+def _run_serve(parser, args):
+    try:
+        from .daemon import send_request, serve
+    except ImportError as e:
+        parser.exit(
+            1, f"tarot-reader serve: daemon unsupported on this platform ({e})\n"
+        )
+
+    if args.stop:
+        try:
+            send_request(args.socket, {"cmd": "stop"})
+        except OSError:
+            parser.exit(1, f"No daemon is serving on {args.socket}\n")
+        return
+    try:
+        serve(args.socket, args.idle_timeout)
+    except OSError as e:
+        parser.exit(1, f"tarot-reader serve: error: {e}\n")
+    except KeyboardInterrupt:
+        pass
+
+
+def _daemon_reading(args):
+    """Reading text from the daemon on args.socket, or None if unreachable."""
+    try:
+        from .daemon import request_reading
+    except ImportError:
+        sys.stderr.write(
+            "tarot-reader: daemon unsupported on this platform; reading locally\n"
+        )
+        return None
+    try:
+        return request_reading(args.socket, args.type, args.seed)
+    except OSError as e:
+        sys.stderr.write(f"tarot-reader: daemon unavailable ({e}); reading locally\n")
+        return None
+
+
+def _run_batch(parser, args):
+    from .batch_cli import open_output, parse_spread, read_seeds, run_batch
+    from .text_formatter import list_renderers
+
+    formats = list_renderers() + ["text", "npy"]
+    if args.format not in formats:
+        parser.error(
+            f"argument --format/-f: invalid choice: '{args.format}' "
+            f"(choose from {', '.join(formats)})"
+        )
+    try:
+        spread = parse_spread(args.spread)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.count is not None and args.count < 0:
+        parser.error("--count must not be negative")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    source = None
+    if args.input is not None:
+        source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = open_output(args.out)
+    try:
+        run_batch(
+            out,
+            spread,
+            count=args.count,
+            seeds=None if source is None else read_seeds(source),
+            fmt=args.format,
+            workers=args.workers,
+            seed=args.seed,
+            progress=None if args.quiet else sys.stderr,
+        )
+    except ValueError as e:
+        parser.exit(1, f"tarot-reader batch: error: {e}\n")
+    finally:
+        if source is not None and source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout.buffer:
+            out.close()
 
 
 def main():
@@ -33,9 +174,37 @@ def main():
         type=str,
         help="Personal seed for reproducible readings (e.g., MBTI, blood type)",
     )
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get("TAROT_READER_SOCKET"),
+        help="Get the reading from a warm daemon on this Unix socket, starting "
+        "it on first use (default: $TAROT_READER_SOCKET)",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    _add_batch_parser(subparsers)
+    _add_serve_parser(subparsers)
 
     args = parser.parse_args()
 
+    if args.command == "batch":
+        _run_batch(subparsers.choices["batch"], args)
+        return
+    if args.command == "serve":
+        _run_serve(subparsers.choices["serve"], args)
+        return
+
+    if args.socket:
+        result = _daemon_reading(args)
+        if result is not None:
+            print(result)
+            return
+
+    from .text_formatter import (
+        get_celtic_cross_text,
+        get_single_card_text,
+        get_three_card_text,
+    )
+
     # Generate reading based on type
     if args.type == "single":
         result = get_single_card_text(args.seed)
@@ -0,0 +1,160 @@
+"""
+Vectorized spread analytics.
+
+Computes group and element balance, Major/Minor and reversed ratios,
+repeated Minor Arcana ranks and numerology sums for whole batches of
+readings at once. Readings are arrays of card ids and orientations (as
+produced by draw_batch() or encode_readings()), so every statistic is a
+table lookup followed by a NumPy reduction, fast enough for entire corpora.
+
+Requires NumPy (``pip install tarot-reader[numpy]``).
+"""
+
+from typing import Any, Dict, Iterable, Tuple
+
+import numpy as np
+
+from .core import _reading_cards
+from .deck import (
+    CARD_GROUPS,
+    DECK_SIZE,
+    MAJOR_ARCANA,
+    MAJOR_GROUP,
+    MINOR_ARCANA,
+    get_all_cards,
+    get_card_id,
+    get_card_suit,
+)
+
+# Elements of the Minor Arcana suits, in MINOR_ARCANA order
+ELEMENTS = ("Fire", "Water", "Air", "Earth")
+RANKS = tuple(card["name"].split(" of ")[0] for card in MINOR_ARCANA["Wands"])
+
+# Per-card lookup tables indexed by card id
+_GROUP_OF = np.array(
+    [CARD_GROUPS.index(get_card_suit(i) or MAJOR_GROUP) for i in range(DECK_SIZE)],
+    dtype=np.intp,
+)
+_RANK_OF = np.array(
+    [0] * len(MAJOR_ARCANA) + list(range(1, len(RANKS) + 1)) * len(MINOR_ARCANA),
+    dtype=np.intp,
+)
+# Majors count their number, Minors their rank (Ace 1 ... King 14)
+_NUMBER_OF = np.array(
+    [card.get("number", _RANK_OF[i]) for i, card in enumerate(get_all_cards())],
+    dtype=np.int64,
+)
+
+
+def encode_readings(readings: Iterable[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode readings of equal size as card-id and orientation arrays.
+
+    Args:
+        readings: Iterable of card dicts, position -> card dicts or card lists
+
+    Returns:
+        Tuple of (card_ids, reversed) arrays of shape (readings, cards)
+        with dtypes uint8 and bool
+    """
+    rows = [_reading_cards(reading) for reading in readings]
+    if not rows or len({len(row) for row in rows}) != 1:
+        raise ValueError("Readings must be non-empty and of equal size")
+    card_ids = np.array(
+        [[get_card_id(card["name"]) for card in row] for row in rows], dtype=np.uint8
+    )
+    is_reversed = np.array(
+        [[card["orientation"] == "Reversed" for card in row] for row in rows],
+        dtype=bool,
+    )
+    return card_ids, is_reversed
+
+
+def _counts(values: np.ndarray, size: int) -> np.ndarray:
+    """Row-wise bincount of a (readings, cards) array of indices below size."""
+    rows = values.shape[0]
+    flat = values + (np.arange(rows) * size)[:, None]
+    return np.bincount(flat.ravel(), minlength=rows * size).reshape(rows, size)
+
+
+def spread_analytics(card_ids: Any, is_reversed: Any) -> Dict[str, np.ndarray]:
+    """
+    Compute analytics for a batch of readings.
+
+    Args:
+        card_ids: Array-like of card ids, shape (readings, cards) or (cards,)
+        is_reversed: Array-like of orientations with the same shape
+
+    Returns:
+        Dictionary of per-reading arrays:
+        - group_counts: (readings, 5) counts in CARD_GROUPS order
+        - element_counts: (readings, 4) Minor Arcana counts in ELEMENTS order
+        - element_balance: normalized entropy of element counts, 1 when the
+          elements are evenly represented and 0 when one dominates or there
+          are no Minor Arcana
+        - major_ratio, reversed_ratio: shares of the spread
+        - rank_counts: (readings, 14) Minor Arcana counts in RANKS order
+        - repeated_ranks: number of ranks appearing more than once
+        - numerology_sum: sum of Major numbers and Minor ranks
+        - numerology_root: numerology_sum reduced to a single digit
+    """
+    ids = np.atleast_2d(np.asarray(card_ids, dtype=np.intp))
+    flags = np.atleast_2d(np.asarray(is_reversed, dtype=bool))
+    if ids.shape != flags.shape or ids.shape[1] == 0:
+        raise ValueError("card_ids and is_reversed must have the same, non-empty shape")
+    if ids.min() < 0 or ids.max() >= DECK_SIZE:
+        raise ValueError("Card ids must be between 0 and 77")
+    num_cards = ids.shape[1]
+
+    group_counts = _counts(_GROUP_OF[ids], len(CARD_GROUPS))
+    element_counts = group_counts[:, 1:]
+    minors = element_counts.sum(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shares = element_counts / minors
+        entropy = -np.where(shares > 0, shares * np.log(shares), 0.0).sum(axis=1)
+    element_balance = np.nan_to_num(entropy / np.log(len(ELEMENTS)))
+
+    rank_counts = _counts(_RANK_OF[ids], len(RANKS) + 1)[:, 1:]
+    numerology_sum = _NUMBER_OF[ids].sum(axis=1)
+    numerology_root = np.where(numerology_sum > 0, 1 + (numerology_sum - 1) % 9, 0)
+
+    return {
+        "group_counts": group_counts,
+        "element_counts": element_counts,
+        "element_balance": element_balance,
+        "major_ratio": group_counts[:, 0] / num_cards,
+        "reversed_ratio": flags.sum(axis=1) / num_cards,
+        "rank_counts": rank_counts,
+        "repeated_ranks": (rank_counts > 1).sum(axis=1),
+        "numerology_sum": numerology_sum,
+        "numerology_root": numerology_root,
+    }
+
+
+def analyze_reading(reading: Any) -> Dict[str, Any]:
+    """
+    Analytics for a single reading as plain Python values.
+
+    Args:
+        reading: A card dict, a position -> card dict (e.g., from draw_three)
+                 or a list of card dicts (e.g., from random_drop)
+
+    Returns:
+        Dictionary with groups and elements (name -> count), element_balance,
+        major_ratio, reversed_ratio, repeated_ranks (rank names appearing
+        more than once), numerology_sum and numerology_root
+    """
+    card_ids, is_reversed = encode_readings([reading])
+    stats = spread_analytics(card_ids, is_reversed)
+    return {
+        "groups": dict(zip(CARD_GROUPS, stats["group_counts"][0].tolist())),
+        "elements": dict(zip(ELEMENTS, stats["element_counts"][0].tolist())),
+        "element_balance": float(stats["element_balance"][0]),
+        "major_ratio": float(stats["major_ratio"][0]),
+        "reversed_ratio": float(stats["reversed_ratio"][0]),
+        "repeated_ranks": [
+            rank for rank, count in zip(RANKS, stats["rank_counts"][0]) if count > 1
+        ],
+        "numerology_sum": int(stats["numerology_sum"][0]),
+        "numerology_root": int(stats["numerology_root"][0]),
+    }
@@ -0,0 +1,140 @@
+"""
+Balanced corpora for training data.
+
+Independent draws only balance card frequencies on average. balanced_corpus()
+instead schedules cards so that, over every period of 156 readings, each
+card appears exactly twice at every position, once upright and once
+reversed. A corpus whose size is a multiple of 156 is therefore exactly
+balanced over (card, orientation), (card, position) and
+(card, position, orientation).
+
+Each period is two Latin-rectangle blocks of 78 readings. A block takes a
+random permutation of the deck and distinct random offsets, one per
+position; reading r holds card perm[(r + offset[j]) % 78] at position j, so
+cards in a reading are distinct and every position sees every card once.
+The second block uses its own permutation and offsets and inverts the
+first block's per-card orientations. Rows are shuffled within each block.
+
+Periods are generated independently from (seed, period index), so a corpus
+streams with O(78) state and can be split across workers by period without
+losing balance: the union of all shards is the same corpus whatever the
+number of workers.
+
+Requires NumPy (``pip install tarot-reader[numpy]``).
+"""
+
+from typing import Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .core import _spread_positions
+from .deck import DECK_SIZE
+
+# Readings per balanced period: two blocks of DECK_SIZE
+PERIOD = 2 * DECK_SIZE
+
+
+def _block(
+    rng: np.random.Generator, num_cards: int, orientation: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    perm = rng.permutation(DECK_SIZE).astype(np.uint8)
+    offsets = rng.permutation(DECK_SIZE)[:num_cards]
+    rows = rng.permutation(DECK_SIZE)
+    card_ids = perm[(rows[:, None] + offsets) % DECK_SIZE]
+    return card_ids, orientation[card_ids]
+
+
+def balanced_period(
+    num_cards: int, index: int, seed: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate one balanced period of PERIOD readings.
+
+    Args:
+        num_cards: Number of cards per reading (1-78)
+        index: Period number within the corpus
+        seed: Corpus seed (a non-negative integer)
+
+    Returns:
+        Tuple of (card_ids, reversed) arrays of shape (PERIOD, num_cards)
+        with dtypes uint8 and bool
+    """
+    if num_cards < 1 or num_cards > DECK_SIZE:
+        raise ValueError("Number of cards must be between 1 and 78")
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+    orientation = rng.random(DECK_SIZE) < 0.5
+    first_ids, first_reversed = _block(rng, num_cards, orientation)
+    second_ids, second_reversed = _block(rng, num_cards, ~orientation)
+    return (
+        np.concatenate([first_ids, second_ids]),
+        np.concatenate([first_reversed, second_reversed]),
+    )
+
+
+def balanced_corpus(
+    spread: Any,
+    count: int,
+    seed: Optional[int] = None,
+    chunk_size: int = 64 * PERIOD,
+    shard: int = 0,
+    shards: int = 1,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Stream a balanced corpus of readings in chunks.
+
+    The corpus is exactly balanced when count is a multiple of PERIOD. A
+    final partial period keeps each card at most once per position within
+    each of its blocks.
+
+    For parallel generation, give every worker the same spread, count and
+    seed and a distinct shard in range(shards). Shard k yields periods k,
+    k + shards, k + 2 * shards, ...; together the shards yield exactly the
+    periods of the unsharded corpus.
+
+    Args:
+        spread: "single", a registered spread name or a number of cards
+        count: Total number of readings in the corpus
+        seed: Corpus seed; random if omitted (required when sharding)
+        chunk_size: Maximum readings per yielded chunk (rounded up to a
+                    whole period)
+        shard: Index of this worker's shard
+        shards: Total number of shards
+
+    Returns:
+        Iterator of (card_ids, reversed) arrays of shape
+        (readings, num_cards), as returned by draw_batch()
+    """
+    num_cards, _ = _spread_positions(spread)
+    if count < 1:
+        raise ValueError("Corpus size must be at least 1")
+    if shards < 1 or not 0 <= shard < shards:
+        raise ValueError("shard must be between 0 and shards - 1")
+    if seed is None:
+        if shards > 1:
+            raise ValueError("Sharded corpora need an explicit seed")
+        seed = int(np.random.default_rng().integers(2**63))
+
+    periods = range(shard, -(-count // PERIOD), shards)
+    return _stream(num_cards, count, seed, periods, max(1, -(-chunk_size // PERIOD)))
+
+
+def _stream(
+    num_cards: int,
+    count: int,
+    seed: int,
+    periods: range,
+    periods_per_chunk: int,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    id_chunks: List[np.ndarray] = []
+    reversed_chunks: List[np.ndarray] = []
+    for index in periods:
+        card_ids, is_reversed = balanced_period(num_cards, index, seed)
+        rows = min(PERIOD, count - index * PERIOD)
+        id_chunks.append(card_ids[:rows])
+        reversed_chunks.append(is_reversed[:rows])
+        if len(id_chunks) == periods_per_chunk:
+            yield np.concatenate(id_chunks), np.concatenate(reversed_chunks)
+            id_chunks.clear()
+            reversed_chunks.clear()
+    if id_chunks:
+        yield np.concatenate(id_chunks), np.concatenate(reversed_chunks)
@@ -0,0 +1,252 @@
+"""
+Vectorized batch drawing and Monte Carlo readings.
+
+draw_batch() draws many spreads at once as NumPy arrays of card ids and
+orientations; consensus_reading() builds on it to report the most frequent
+card per position over thousands of simulated draws.
+
+Requires NumPy (``pip install tarot-reader[numpy]``).
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .core import (
+    _build_card_result,
+    _create_personal_seed,
+    _get_weight_profile,
+    _spread_positions,
+)
+from .deck import DECK_SIZE, get_all_cards
+
+# z-score of the two-sided 95% confidence interval
+_Z_95 = 1.959963984540054
+# Redraw rounds after which a unique batch gives up, e.g. when weights or a
+# saturated Bloom filter leave almost no new readings to find
+_MAX_UNIQUE_ROUNDS = 1000
+
+RandomSource = Union[None, int, np.random.Generator]
+
+# Card dicts for every (card id, reversed) pair, copied when decoding
+_CARD_RESULTS = [
+    (_build_card_result(card, False), _build_card_result(card, True))
+    for card in get_all_cards()
+]
+
+
+def _generator(rng: RandomSource) -> np.random.Generator:
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+
+def _draw_rows(
+    num_cards: int,
+    trials: int,
+    weights: Optional[Dict[str, float]],
+    generator: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray]:
+    if weights:
+        inverse = np.array(_get_weight_profile(weights, num_cards).inverse)
+        exponential = generator.standard_exponential((trials, DECK_SIZE))
+        keys = np.where(np.isfinite(inverse), exponential * inverse, np.inf)
+    else:
+        keys = generator.random((trials, DECK_SIZE))
+
+    if num_cards < DECK_SIZE:
+        chosen = np.argpartition(keys, num_cards - 1, axis=1)[:, :num_cards]
+    else:
+        chosen = np.broadcast_to(np.arange(DECK_SIZE), keys.shape)
+    order = np.argsort(np.take_along_axis(keys, chosen, axis=1), axis=1)
+    card_ids = np.take_along_axis(chosen, order, axis=1).astype(np.uint8)
+    is_reversed = generator.random((trials, num_cards)) < 0.5
+    return card_ids, is_reversed
+
+
+def _draw_unique(
+    num_cards: int,
+    trials: int,
+    weights: Optional[Dict[str, float]],
+    generator: np.random.Generator,
+    error_rate: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    from .dedupe import ReadingFilter
+
+    # Only cards with positive weight can be drawn
+    support = _get_weight_profile(weights, num_cards).support if weights else DECK_SIZE
+    space = math.perm(support, num_cards) * 2**num_cards
+    if trials > space:
+        raise ValueError(
+            f"Only {space} distinct readings of {num_cards} cards can be drawn"
+        )
+
+    seen = ReadingFilter(num_cards, trials, error_rate)
+    id_chunks: List[np.ndarray] = []
+    reversed_chunks: List[np.ndarray] = []
+    remaining = trials
+    for _ in range(_MAX_UNIQUE_ROUNDS):
+        if not remaining:
+            break
+        size = min(max(remaining + remaining // 8, 64), 1 << 20)
+        card_ids, is_reversed = _draw_rows(num_cards, size, weights, generator)
+        new = np.flatnonzero(seen.add_new(card_ids, is_reversed))[:remaining]
+        id_chunks.append(card_ids[new])
+        reversed_chunks.append(is_reversed[new])
+        remaining -= len(new)
+    if remaining:
+        raise ValueError(
+            f"Found only {trials - remaining} of {trials} distinct readings "
+            f"after {_MAX_UNIQUE_ROUNDS} rounds; draw fewer or lower error_rate"
+        )
+    return np.concatenate(id_chunks), np.concatenate(reversed_chunks)
+
+
+def draw_batch(
+    num_cards: int,
+    trials: int,
+    weights: Optional[Dict[str, float]] = None,
+    rng: RandomSource = None,
+    unique: bool = False,
+    error_rate: float = 1e-6,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draw many independent spreads in one vectorized pass.
+
+    Each row is a draw without replacement from a full deck, like
+    _draw_cards(). With a weight profile, rows follow the same weighted
+    distribution as weighted _draw_cards() calls.
+
+    Args:
+        num_cards: Number of cards per spread (1-78)
+        trials: Number of spreads to draw
+        weights: Optional weight profile (see _draw_cards)
+        rng: Optional NumPy Generator or integer seed
+        unique: If True, no two rows share the same cards and orientations
+                in the same order. Repeats are redrawn; spreads of up to
+                three cards are checked exactly, longer ones against a Bloom
+                filter sized for trials (see src.dedupe.ReadingFilter)
+        error_rate: Bloom filter false-positive rate for unique draws; a
+                    false positive only redraws a reading that was new
+
+    Returns:
+        Tuple of (card_ids, reversed) arrays of shape (trials, num_cards)
+        with dtypes uint8 and bool
+
+    Raises:
+        ValueError: If unique is True and trials exceeds the number of
+                    distinct readings the weights allow, or too few new
+                    readings turn up within the redraw limit
+    """
+    if num_cards < 1 or num_cards > 78:
+        raise ValueError("Number of cards must be between 1 and 78")
+    if trials < 1:
+        raise ValueError("Number of trials must be at least 1")
+
+    generator = _generator(rng)
+    if unique:
+        return _draw_unique(num_cards, trials, weights, generator, error_rate)
+    return _draw_rows(num_cards, trials, weights, generator)
+
+
+def decode_batch(card_ids: np.ndarray, is_reversed: np.ndarray) -> List[List[Any]]:
+    """
+    Convert batch arrays into lists of card dicts.
+
+    Args:
+        card_ids: Array of card ids of shape (trials, num_cards)
+        is_reversed: Array of orientations of the same shape
+
+    Returns:
+        One list of card dictionaries per row, as returned by random_drop()
+    """
+    return [
+        [dict(_CARD_RESULTS[card_id][flag]) for card_id, flag in zip(ids, flags)]
+        for ids, flags in zip(card_ids.tolist(), is_reversed.tolist())
+    ]
+
+
+def _wilson_interval(successes: int, trials: int) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion at 95% confidence."""
+    p = successes / trials
+    z2 = _Z_95 * _Z_95
+    centre = (p + z2 / (2 * trials)) / (1 + z2 / trials)
+    half = (
+        _Z_95
+        * math.sqrt(p * (1 - p) / trials + z2 / (4 * trials * trials))
+        / (1 + z2 / trials)
+    )
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def consensus_reading(
+    spread: Any = "three",
+    seed: Optional[str] = None,
+    trials: int = 10_000,
+    weights: Optional[Dict[str, float]] = None,
+) -> Any:
+    """
+    Aggregate a spread over many simulated draws.
+
+    Every trial is drawn in a single NumPy batch. Like a real draw, the
+    consensus holds distinct cards: the most frequent (position, card) pair
+    is taken first, then the most frequent pair among the remaining
+    positions and cards, and so on. Each card is reported with its frequency
+    at its position, a 95% Wilson confidence interval, and its most frequent
+    orientation there.
+
+    Args:
+        spread: "single", "three", "celtic" or a number of cards (1-78)
+        seed: Optional personal information to seed the simulation
+        trials: Number of simulated draws
+        weights: Optional weight profile (see _draw_cards)
+
+    Returns:
+        Same shape as the matching spread function. Each card dict also has
+        "frequency", "confidence_interval" and "orientation_frequency" keys.
+    """
+    num_cards, positions = _spread_positions(spread)
+    rng = _create_personal_seed(seed) if seed else None
+    card_ids, is_reversed = draw_batch(num_cards, trials, weights, rng)
+
+    # counts[position, card, orientation] in a single bincount
+    flat = (
+        np.arange(num_cards) * (2 * DECK_SIZE)
+        + card_ids.astype(np.int64) * 2
+        + is_reversed
+    )
+    counts = np.bincount(flat.ravel(), minlength=num_cards * 2 * DECK_SIZE)
+    counts = counts.reshape(num_cards, DECK_SIZE, 2)
+    card_counts = counts.sum(axis=2)
+
+    # Greedy assignment, highest count first; taken rows and columns are
+    # masked with -1 so no position or card is used twice
+    available = card_counts.astype(np.int64)
+    chosen = [0] * num_cards
+    for _ in range(num_cards):
+        row, column = np.unravel_index(int(available.argmax()), available.shape)
+        chosen[row] = int(column)
+        available[row, :] = -1
+        available[:, column] = -1
+
+    all_cards = get_all_cards()
+    cards: List[Dict[str, Any]] = []
+    for position, card_id in enumerate(chosen):
+        hits = int(card_counts[position, card_id])
+        reversed_hits = int(counts[position, card_id, 1])
+        is_mostly_reversed = reversed_hits * 2 > hits
+        card = _build_card_result(all_cards[card_id], is_mostly_reversed)
+        card["frequency"] = hits / trials
+        card["confidence_interval"] = _wilson_interval(hits, trials)
+        # A card never drawn at its position shows no orientation preference
+        card["orientation_frequency"] = (
+            max(reversed_hits, hits - reversed_hits) / hits if hits else 0.5
+        )
+        cards.append(card)
+
+    if spread == "single":
+        return cards[0]
+    if positions:
+        return dict(zip(positions, cards))
+    return cards
@@ -0,0 +1,290 @@
+"""
+Non-interactive batch generation for the ``tarot-reader batch`` command.
+
+Readings are generated in fixed-size chunks. Each chunk is drawn and
+rendered to bytes in one call, so a worker pool can process chunks in
+parallel while the parent writes results in input order with one large
+write per chunk.
+
+Counted corpora draw chunk i from random.Random(f"{seed}:{start}"), so
+with --seed the output depends only on the seed, spread and count, and
+never on the number of workers. Input seeds give one reading per row,
+drawn exactly as draw_from_seed() draws it; string seeds seed a
+random.Random directly, which is deterministic across runs.
+
+The "npy" format writes a NumPy structured array with "cards" (uint8 card
+ids, see deck.get_card_id) and "reversed" (bool) fields of one row per
+reading, and requires NumPy.
+"""
+
+import io
+import json
+import multiprocessing
+import random
+import sys
+import time
+from collections import deque
+from typing import IO, Any, Deque, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .core import _draw_with, _reading_cards
+from .deck import DECK_SIZE, get_card_id
+from .spreads import get_spread
+from .text_formatter import get_renderer, render_to
+
+# Readings per chunk; fixed so seeded output does not depend on --workers
+CHUNK_READINGS = 1024
+# Chunks queued per worker, bounding memory for large inputs
+_PENDING_PER_WORKER = 4
+# Seconds between progress updates
+_PROGRESS_INTERVAL = 0.25
+
+Seed = Union[int, str]
+
+
+def parse_spread(value: str) -> Union[str, int]:
+    """
+    Parse a --spread value: a registered spread name or a card count.
+
+    Raises:
+        ValueError: For unknown spreads or counts outside 1-78
+    """
+    spread: Union[str, int] = int(value) if value.isdigit() else value
+    _spread_size(spread)
+    return spread
+
+
+def _spread_size(spread: Union[str, int]) -> int:
+    if isinstance(spread, int):
+        if spread < 1 or spread > DECK_SIZE:
+            raise ValueError("Number of cards must be between 1 and 78")
+        return spread
+    return get_spread(spread).size
+
+
+def _row_seed(line: str, number: int) -> Seed:
+    try:
+        row = json.loads(line)
+    except ValueError:
+        raise ValueError(f"Line {number}: not valid JSON") from None
+    if isinstance(row, dict):
+        row = row.get("seed")
+    if isinstance(row, bool) or not isinstance(row, (int, str)):
+        raise ValueError(
+            f'Line {number}: expected an integer, a string or {{"seed": ...}}'
+        )
+    return row
+
+
+def read_seeds(stream: Iterable[str]) -> Iterator[Seed]:
+    """
+    Parse a seeds JSONL stream, skipping blank lines.
+
+    Each row is an integer, a string, or an object with a "seed" key.
+
+    Raises:
+        ValueError: For rows without a usable seed
+    """
+    for number, line in enumerate(stream, 1):
+        if line.strip():
+            yield _row_seed(line, number)
+
+
+def _draw_chunk(
+    spread: Union[str, int], seed: Any, start: int, count: int, seeds: Any
+) -> List[Any]:
+    if seeds is not None:
+        return [_draw_with(random.Random(row), spread) for row in seeds]
+    rng = random.Random(f"{seed}:{start}")
+    return [_draw_with(rng, spread) for _ in range(count)]
+
+
+def _npy_dtype(width: int) -> Any:
+    import numpy as np
+
+    return np.dtype([("cards", np.uint8, (width,)), ("reversed", np.bool_, (width,))])
+
+
+def _npy_header(count: int, width: int) -> bytes:
+    import numpy as np
+
+    header = io.BytesIO()
+    np.lib.format.write_array_header_1_0(
+        header,
+        {
+            "descr": np.lib.format.dtype_to_descr(_npy_dtype(width)),
+            "fortran_order": False,
+            "shape": (count,),
+        },
+    )
+    return header.getvalue()
+
+
+def _encode_npy(readings: List[Any], width: int) -> bytes:
+    import numpy as np
+
+    records = np.zeros(len(readings), dtype=_npy_dtype(width))
+    ids = []
+    flags = []
+    for reading in readings:
+        cards = _reading_cards(reading)
+        ids.append([get_card_id(card["name"]) for card in cards])
+        flags.append([card["orientation"] == "Reversed" for card in cards])
+    records["cards"] = ids
+    records["reversed"] = flags
+    return records.tobytes()
+
+
+def _render_chunk(job: Tuple[Any, ...]) -> Tuple[int, bytes]:
+    """Draw and render one chunk; runs in worker processes."""
+    spread, fmt, seed, start, count, seeds = job
+    readings = _draw_chunk(spread, seed, start, count, seeds)
+    if fmt == "npy":
+        return len(readings), _encode_npy(readings, _spread_size(spread))
+    buffer = io.BytesIO()
+    render_to(buffer, readings, fmt, spread, chunk_size=1 << 30)
+    return len(readings), buffer.getvalue()
+
+
+def _jobs(
+    spread: Union[str, int],
+    fmt: str,
+    seed: Any,
+    count: Optional[int],
+    seeds: Optional[Iterable[Seed]],
+) -> Iterator[Tuple[Any, ...]]:
+    if seeds is None:
+        assert count is not None
+        for start in range(0, count, CHUNK_READINGS):
+            size = min(CHUNK_READINGS, count - start)
+            yield (spread, fmt, seed, start, size, None)
+        return
+    chunk: List[Seed] = []
+    start = 0
+    for row in seeds:
+        chunk.append(row)
+        if len(chunk) == CHUNK_READINGS:
+            yield (spread, fmt, seed, start, len(chunk), chunk)
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield (spread, fmt, seed, start, len(chunk), chunk)
+
+
+def _ordered_results(
+    jobs: Iterator[Tuple[Any, ...]], workers: int
+) -> Iterator[Tuple[int, bytes]]:
+    """Run jobs in a process pool and yield results in submission order."""
+    if workers == 1:
+        for job in jobs:
+            yield _render_chunk(job)
+        return
+    with multiprocessing.Pool(workers) as pool:
+        pending: Deque[Any] = deque()
+        for job in jobs:
+            pending.append(pool.apply_async(_render_chunk, (job,)))
+            if len(pending) >= workers * _PENDING_PER_WORKER:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+class _Progress:
+    """Progress and throughput reports on a text stream."""
+
+    def __init__(self, stream: Optional[IO[str]], total: Optional[int]):
+        self.stream = stream
+        self.total = total
+        self.done = 0
+        self.started = time.perf_counter()
+        self._last = self.started
+
+    def _rate(self, now: float) -> float:
+        return self.done / max(now - self.started, 1e-9)
+
+    def update(self, count: int):
+        self.done += count
+        now = time.perf_counter()
+        if self.stream is None or now - self._last < _PROGRESS_INTERVAL:
+            return
+        self._last = now
+        total = "" if self.total is None else f"/{self.total}"
+        self.stream.write(
+            f"\r{self.done}{total} readings  {self._rate(now):,.0f} readings/s"
+        )
+        self.stream.flush()
+
+    def finish(self):
+        if self.stream is None:
+            return
+        now = time.perf_counter()
+        self.stream.write(
+            f"\rWrote {self.done} readings in {now - self.started:.2f}s "
+            f"({self._rate(now):,.0f} readings/s)\n"
+        )
+        self.stream.flush()
+
+
+def run_batch(
+    out: IO[bytes],
+    spread: Union[str, int] = "single",
+    count: Optional[int] = None,
+    seeds: Optional[Iterable[Seed]] = None,
+    fmt: str = "jsonl",
+    workers: int = 1,
+    seed: Optional[int] = None,
+    progress: Optional[IO[str]] = None,
+) -> int:
+    """
+    Generate readings and write them to a binary stream.
+
+    Args:
+        out: Writable binary stream
+        spread: "single", a registered spread name or a card count
+        count: Number of readings to draw (when seeds is None)
+        seeds: Optional iterable of integer or string seeds, one reading each
+        fmt: "npy" or the name of a registered renderer (see list_renderers())
+        workers: Number of worker processes
+        seed: Optional corpus seed for reproducible counted output
+        progress: Optional text stream for progress and throughput reports
+
+    Returns:
+        Number of readings written
+
+    Raises:
+        ValueError: For invalid arguments
+    """
+    if (count is None) == (seeds is None):
+        raise ValueError("Give exactly one of count and seeds")
+    if count is not None and count < 0:
+        raise ValueError("count must not be negative")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    width = _spread_size(spread)
+    if fmt != "npy":
+        get_renderer(fmt)
+
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    total = count
+    if fmt == "npy" and seeds is not None:
+        # The .npy header needs the row count up front
+        seeds = list(seeds)
+        total = len(seeds)
+
+    report = _Progress(progress, total)
+    if fmt == "npy":
+        out.write(_npy_header(total or 0, width))
+    jobs = _jobs(spread, fmt, seed, count, seeds)
+    for size, data in _ordered_results(jobs, workers):
+        out.write(data)
+        report.update(size)
+    out.flush()
+    report.finish()
+    return report.done
+
+
+def open_output(path: str) -> IO[bytes]:
+    """Open --out for large buffered binary writes ("-" is stdout)."""
+    if path == "-":
+        return sys.stdout.buffer
+    return open(path, "wb", buffering=1 << 20)
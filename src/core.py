@@ -4,9 +4,44 @@ Core functionality for tarot card readings.
 
 import random
 import hashlib
+import math
 import time
-from typing import Dict, List, Any, Optional
-from .deck import get_all_cards
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
+from .deck import CARD_GROUPS, DECK_SIZE, GROUP_CARD_IDS, get_all_cards, get_card_id
+from .spreads import (
+    SpreadLayout,
+    _augment,
+    _match_slots,
+    _slot_pools,
+    get_spread,
+    list_spreads,
+)
+
+# Maximum number of compiled weight profiles kept in memory
+_WEIGHT_CACHE_SIZE = 256
+
+# Compiled once from the spread registry
+THREE_CARD_POSITIONS = get_spread("three").positions
+CELTIC_CROSS_POSITIONS = get_spread("celtic").positions
+
+_GROUP_MASKS = {
+    group: sum(1 << card_id for card_id in card_ids)
+    for group, card_ids in GROUP_CARD_IDS.items()
+}
+_FULL_MASK = (1 << DECK_SIZE) - 1
+
+_CONSTRAINT_KEYS = frozenset(
+    [
+        "groups",
+        "exclude",
+        "min_counts",
+        "max_counts",
+        "reversed",
+        "min_reversed",
+        "max_reversed",
+    ]
+)
 
 
 def _create_personal_seed(personal_info: str) -> int:
@@ -97,8 +132,150 @@ def random_drop(num_cards: int = 1) -> List[Dict[str, Any]]:
     return result
 
 
+def _build_card_result(card: Dict[str, Any], is_reversed: bool) -> Dict[str, Any]:
+    """
+    Build the reading dict for a drawn card in the given orientation.
+
+    Args:
+        card: Card definition from the deck
+        is_reversed: Whether the card was drawn reversed
+
+    Returns:
+        Card dictionary with name, orientation, meaning and optional number
+    """
+    card_result = {
+        "name": card["name"],
+        "orientation": "Reversed" if is_reversed else "Upright",
+        "meaning": card["reversed"] if is_reversed else card["upright"],
+    }
+
+    # Add number for Major Arcana cards
+    if "number" in card:
+        card_result["number"] = card["number"]
+
+    return card_result
+
+
+class _AliasTable:
+    """
+    Vose alias table for O(1) sampling from a fixed discrete distribution.
+    """
+
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: Tuple[float, ...]):
+        n = len(weights)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        self.prob = [0.0] * n
+        self.alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+        # Leftovers are 1.0 up to floating point error
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self) -> int:
+        """Draw one index using the module-level random generator."""
+        i = random.randrange(len(self.prob))
+        return i if random.random() < self.prob[i] else self.alias[i]
+
+
+class _WeightProfile:
+    """
+    Compiled per-card weights: an alias table for single draws and inverse
+    weights for without-replacement draws via exponential keys.
+    """
+
+    __slots__ = ("table", "inverse", "support")
+
+    def __init__(self, weights: Tuple[float, ...]):
+        self.table = _AliasTable(weights)
+        self.inverse = tuple(1.0 / w if w > 0 else math.inf for w in weights)
+        self.support = sum(1 for w in weights if w > 0)
+
+
+@lru_cache(maxsize=_WEIGHT_CACHE_SIZE)
+def _compile_weights(profile: Tuple[Tuple[str, float], ...]) -> _WeightProfile:
+    """
+    Resolve a weight profile into per-card weights and compile it.
+
+    Profile keys are card names, suit names ("Wands", "Cups", "Swords",
+    "Pentacles") or "Major Arcana". Multipliers for a card's name and its
+    group are combined; unlisted cards keep weight 1.0.
+    """
+    card_weights = [1.0] * DECK_SIZE
+    for key, weight in profile:
+        if weight < 0 or not math.isfinite(weight):
+            raise ValueError(f"Weight for '{key}' must be a finite number >= 0")
+
+        if key in GROUP_CARD_IDS:
+            card_ids = GROUP_CARD_IDS[key]
+        else:
+            card_ids = (get_card_id(key),)
+
+        for card_id in card_ids:
+            card_weights[card_id] *= weight
+
+    if not any(card_weights):
+        raise ValueError("At least one card must have a positive weight")
+    return _WeightProfile(tuple(card_weights))
+
+
+def _get_weight_profile(weights: Dict[str, float], num_cards: int) -> _WeightProfile:
+    """Return the cached compiled profile, checking it can fill the draw."""
+    profile = _compile_weights(tuple(sorted(weights.items())))
+    if num_cards > profile.support:
+        raise ValueError(
+            f"Cannot draw {num_cards} cards: only {profile.support} have positive weight"
+        )
+    return profile
+
+
+def _weighted_sample(num_cards: int, profile: _WeightProfile) -> List[int]:
+    """
+    Draw distinct card ids with probability proportional to their weights.
+
+    Single cards use the cached alias table. Spreads use Efraimidis-Spirakis
+    exponential keys, which sample without replacement in one pass.
+    """
+    if num_cards == 1:
+        return [profile.table.sample()]
+
+    keys = [random.expovariate(1.0) * inv for inv in profile.inverse]
+    return sorted(range(DECK_SIZE), key=keys.__getitem__)[:num_cards]
+
+
+def _orient_cards(rng: Any, cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Assign a random orientation (upright/reversed) to each card."""
+    return [_build_card_result(card, rng.choice([True, False])) for card in cards]
+
+
+def _shuffle_draw(rng: Any, num_cards: int) -> List[Dict[str, Any]]:
+    """
+    Shuffle a fresh deck with rng and draw num_cards oriented cards.
+
+    rng is the random module or a random.Random instance; the same seed
+    always gives the same cards.
+    """
+    all_cards = get_all_cards()
+    rng.shuffle(all_cards)
+    return _orient_cards(rng, all_cards[:num_cards])
+
+
 def _draw_cards(
-    num_cards: int, personal_seed: Optional[str] = None
+    num_cards: int,
+    personal_seed: Optional[str] = None,
+    weights: Optional[Dict[str, float]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Draw a specified number of cards from the deck.
@@ -106,6 +283,8 @@ def _draw_cards(
     Args:
         num_cards: Number of cards to draw
         personal_seed: Optional personal information to seed the shuffle
+        weights: Optional weight profile mapping card names, suit names or
+                 "Major Arcana" to relative likelihood multipliers
 
     Returns:
         List of card dictionaries with name, meaning, and orientation
@@ -113,35 +292,19 @@ def _draw_cards(
     if num_cards < 1 or num_cards > 78:
         raise ValueError("Number of cards must be between 1 and 78")
 
+    profile = _get_weight_profile(weights, num_cards) if weights else None
+
     # Set random seed if personal info provided
     if personal_seed:
         seed = _create_personal_seed(personal_seed)
         random.seed(seed)
 
-    all_cards = get_all_cards()
-
-    # Shuffle the deck
-    random.shuffle(all_cards)
-
-    # Draw the specified number of cards
-    drawn_cards = all_cards[:num_cards]
-
-    # Assign random orientation (upright/reversed) to each card
-    result = []
-    for card in drawn_cards:
-        is_reversed = random.choice([True, False])
-
-        card_result = {
-            "name": card["name"],
-            "orientation": "Reversed" if is_reversed else "Upright",
-            "meaning": card["reversed"] if is_reversed else card["upright"],
-        }
-
-        # Add number for Major Arcana cards
-        if "number" in card:
-            card_result["number"] = card["number"]
-
-        result.append(card_result)
+    if profile is not None:
+        all_cards = get_all_cards()
+        drawn_cards = [all_cards[i] for i in _weighted_sample(num_cards, profile)]
+        result = _orient_cards(random, drawn_cards)
+    else:
+        result = _shuffle_draw(random, num_cards)
 
     # Reset random seed to current time for subsequent calls
     if personal_seed:
@@ -150,61 +313,595 @@ def _draw_cards(
     return result
 
 
-def draw_single(personal_seed: Optional[str] = None) -> Dict[str, Any]:
+def draw_single(
+    personal_seed: Optional[str] = None, weights: Optional[Dict[str, float]] = None
+) -> Dict[str, Any]:
     """
     Draw a single card for a basic reading.
 
     Args:
         personal_seed: Optional personal information to seed the shuffle
                       (e.g., "INFP", "O+", "seeking love guidance")
+        weights: Optional weight profile (e.g., {"Cups": 2.0})
 
     Returns:
         Dictionary containing card name, orientation, and meaning
     """
-    cards = _draw_cards(1, personal_seed)
+    cards = _draw_cards(1, personal_seed, weights)
     return cards[0]
 
 
-def draw_three(personal_seed: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+def draw_three(
+    personal_seed: Optional[str] = None, weights: Optional[Dict[str, float]] = None
+) -> Dict[str, Dict[str, Any]]:
     """
     Draw three cards for a Past/Present/Future reading.
 
     Args:
         personal_seed: Optional personal information to seed the shuffle
                       (e.g., "ENFJ + career change", "AB blood type")
+        weights: Optional weight profile (e.g., {"Major Arcana": 3.0})
 
     Returns:
         Dictionary with Past, Present, and Future keys containing card info
     """
-    cards = _draw_cards(3, personal_seed)
+    cards = _draw_cards(3, personal_seed, weights)
 
-    return {"Past": cards[0], "Present": cards[1], "Future": cards[2]}
+    return dict(zip(THREE_CARD_POSITIONS, cards))
 
 
-def celtic_cross(personal_seed: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+def celtic_cross(
+    personal_seed: Optional[str] = None, weights: Optional[Dict[str, float]] = None
+) -> Dict[str, Dict[str, Any]]:
     """
     Draw ten cards for a Celtic Cross spread.
 
     Args:
         personal_seed: Optional personal information to seed the shuffle
                       (e.g., "ISTJ born 1990", "relationship questions")
+        weights: Optional weight profile (e.g., {"The Tower": 0.0})
 
     Returns:
         Dictionary with position names as keys containing card info
     """
-    cards = _draw_cards(10, personal_seed)
-
-    positions = [
-        "Present Situation",
-        "Challenge",
-        "Distant Past/Foundation",
-        "Recent Past",
-        "Possible Outcome",
-        "Near Future",
-        "Your Approach",
-        "External Influences",
-        "Hopes and Fears",
-        "Final Outcome",
+    cards = _draw_cards(10, personal_seed, weights)
+
+    return dict(zip(CELTIC_CROSS_POSITIONS, cards))
+
+
+def draw_spread(
+    name: str,
+    personal_seed: Optional[str] = None,
+    weights: Optional[Dict[str, float]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Draw any registered spread.
+
+    Args:
+        name: Spread name from the registry (e.g., "three", "horseshoe")
+        personal_seed: Optional personal information to seed the shuffle
+        weights: Optional weight profile (not supported for spreads with
+                 per-position constraints)
+
+    Returns:
+        Dictionary with position names as keys containing card info
+    """
+    layout = get_spread(name)
+    if not layout.constrained:
+        cards = _draw_cards(layout.size, personal_seed, weights)
+        return dict(zip(layout.positions, cards))
+    if weights:
+        raise ValueError(
+            f"Spread '{name}' has per-position constraints; weights are not supported"
+        )
+
+    if personal_seed:
+        random.seed(_create_personal_seed(personal_seed))
+
+    try:
+        drawn = _draw_layout(random, layout)
+    finally:
+        if personal_seed:
+            random.seed()
+
+    return dict(zip(layout.positions, drawn))
+
+
+@lru_cache(maxsize=64)
+def _layout_matching(layout: SpreadLayout) -> Optional[Dict[int, int]]:
+    return _match_slots(_slot_pools(layout.slots))
+
+
+def _assign(
+    owners: Dict[int, int],
+    pools: List[Any],
+    index: int,
+    card_id: int,
+    taken: Set[int],
+) -> Optional[Dict[int, int]]:
+    """
+    Matching of the remaining slots after giving card_id to slot index, or
+    None if the other slots could then no longer all get a card.
+    """
+    trial = {card: slot for card, slot in owners.items() if slot != index}
+    displaced = trial.get(card_id)
+    trial[card_id] = index
+    if displaced is not None and not _augment(
+        displaced, pools, trial, set(), taken | {card_id}
+    ):
+        return None
+    return trial
+
+
+def _draw_layout(rng: Any, layout: SpreadLayout) -> List[Dict[str, Any]]:
+    """
+    Draw a constrained layout position by position, in draw order.
+
+    A matching of every undrawn position to a distinct card is kept up to
+    date, and a card is only given to a position if the remaining positions
+    can still all be filled, so overlapping pools never run dry mid-draw.
+    """
+    all_cards = get_all_cards()
+    pools = _slot_pools(layout.slots)
+    matching = _layout_matching(layout)
+    if matching is None:
+        raise ValueError(f"Spread '{layout.name}' cannot be drawn")
+    owners = dict(matching)
+    taken: Set[int] = set()
+    drawn: List[Dict[str, Any]] = [{}] * layout.size
+    for index in layout.draw_order:
+        slot = layout.slots[index]
+        candidates = [i for i in pools[index] if i not in taken]
+        while True:
+            if not candidates:
+                raise ValueError(
+                    f"No card left for position '{slot.name}' of spread "
+                    f"'{layout.name}'"
+                )
+            card_id = rng.choice(candidates)
+            assigned = _assign(owners, pools, index, card_id, taken)
+            if assigned is not None:
+                break
+            candidates.remove(card_id)
+        owners = assigned
+        taken.add(card_id)
+        is_reversed = (
+            rng.choice([True, False]) if slot.reversed is None else slot.reversed
+        )
+        drawn[index] = _build_card_result(all_cards[card_id], is_reversed)
+    return drawn
+
+
+def draw_from_seed(spread: Any, seed: int) -> Any:
+    """
+    Draw a spread from an explicit integer seed.
+
+    Uses the same algorithm as the unweighted spread functions but with a
+    private random.Random, so the global random state is untouched and the
+    same spread and seed always give the same reading. Used to reproduce
+    logged readings.
+
+    Args:
+        spread: "single", a registered spread name or a number of cards (1-78)
+        seed: Integer seed, e.g. from _create_personal_seed()
+
+    Returns:
+        Same shape as draw_single() for "single", a position -> card dict for
+        named spreads, or a list of cards for a number of cards
+    """
+    return _draw_with(random.Random(seed), spread)
+
+
+def _draw_with(rng: Any, spread: Any) -> Any:
+    """
+    Draw a spread with rng, as draw_from_seed() does with a seeded
+    random.Random. Successive draws from one rng continue its sequence.
+    """
+    if spread == "single":
+        return _shuffle_draw(rng, 1)[0]
+    if isinstance(spread, int) and not isinstance(spread, bool):
+        if spread < 1 or spread > 78:
+            raise ValueError("Number of cards must be between 1 and 78")
+        return _shuffle_draw(rng, spread)
+
+    layout = get_spread(spread)
+    if layout.constrained:
+        drawn = _draw_layout(rng, layout)
+    else:
+        drawn = _shuffle_draw(rng, layout.size)
+    return dict(zip(layout.positions, drawn))
+
+
+def _spread_positions(spread: Any) -> Tuple[int, Optional[Tuple[str, ...]]]:
+    """
+    Return (num_cards, positions) for "single", a registered spread name or a
+    card count. Positions are None for "single" and plain counts.
+    """
+    if spread == "single":
+        return 1, None
+    if isinstance(spread, int) and not isinstance(spread, bool):
+        if spread < 1 or spread > 78:
+            raise ValueError("Number of cards must be between 1 and 78")
+        return spread, None
+    layout = get_spread(spread)
+    if layout.constrained:
+        raise ValueError(
+            f"Spread '{spread}' has per-position constraints; use draw_spread()"
+        )
+    return layout.size, layout.positions
+
+
+def _reading_spread(reading: Any) -> Union[str, int]:
+    """
+    Infer the spread of a reading: "single" for a card dict, the registered
+    spread whose positions match a position -> card dict, or the number of
+    cards in a list.
+    """
+    if isinstance(reading, dict):
+        if "name" in reading:
+            return "single"
+        positions = tuple(reading)
+        for name in list_spreads():
+            if get_spread(name).positions == positions:
+                return name
+        raise ValueError(f"No registered spread has positions {positions}")
+    return len(reading)
+
+
+def _reading_cards(reading: Any) -> List[Any]:
+    """Return the cards of a single card, a position -> card reading or a list."""
+    if isinstance(reading, dict):
+        return [reading] if "name" in reading else list(reading.values())
+    return list(reading)
+
+
+def _card_names(cards: Any) -> List[str]:
+    """Collect card names from names, card dicts or a position -> card reading."""
+    return [
+        card["name"] if isinstance(card, dict) else card
+        for card in _reading_cards(cards)
+    ]
+
+
+def _pick_index(weights: List[int]) -> int:
+    """Pick an index with probability proportional to exact integer weights."""
+    target = random.randrange(sum(weights))
+    for index, weight in enumerate(weights):
+        if target < weight:
+            return index
+        target -= weight
+    raise AssertionError("unreachable")
+
+
+class _CompiledConstraints:
+    """
+    Constraints resolved into per-group card pools and quota bounds.
+
+    ``ways[g][r]`` counts the card sets of size ``r`` that groups ``g..`` can
+    supply within their bounds, so quotas can be sampled group by group with
+    exactly the probabilities of a uniform draw conditioned on the constraints.
+    """
+
+    __slots__ = ("num_cards", "pools", "lows", "highs", "ways", "reversed_range")
+
+    def __init__(self, num_cards: int, constraints: Dict[str, Any]):
+        unknown = set(constraints) - _CONSTRAINT_KEYS
+        if unknown:
+            raise ValueError(f"Unknown constraint(s): {', '.join(sorted(unknown))}")
+
+        groups = constraints.get("groups", CARD_GROUPS)
+        pool_mask = 0
+        for group in groups:
+            if group not in _GROUP_MASKS:
+                raise ValueError(
+                    f"Unknown group '{group}'. Valid groups: {', '.join(CARD_GROUPS)}"
+                )
+            pool_mask |= _GROUP_MASKS[group]
+        for name in _card_names(constraints.get("exclude", ())):
+            pool_mask &= _FULL_MASK ^ (1 << get_card_id(name))
+
+        min_counts = constraints.get("min_counts", {})
+        max_counts = constraints.get("max_counts", {})
+        for group in set(min_counts) | set(max_counts):
+            if group not in _GROUP_MASKS:
+                raise ValueError(
+                    f"Unknown group '{group}'. Valid groups: {', '.join(CARD_GROUPS)}"
+                )
+
+        self.num_cards = num_cards
+        self.pools = []
+        self.lows = []
+        self.highs = []
+        for group in CARD_GROUPS:
+            pool = [i for i in GROUP_CARD_IDS[group] if pool_mask >> i & 1]
+            low = min_counts.get(group, 0)
+            high = min(max_counts.get(group, num_cards), len(pool))
+            if low > high:
+                raise ValueError(
+                    f"Unsatisfiable constraints: need at least {low} {group} "
+                    f"card(s) but at most {high} can be drawn"
+                )
+            self.pools.append(pool)
+            self.lows.append(low)
+            self.highs.append(high)
+
+        # ways[g][r]: number of r-card sets drawable from groups g.. within bounds
+        self.ways = [[0] * (num_cards + 1) for _ in range(len(CARD_GROUPS) + 1)]
+        self.ways[-1][0] = 1
+        for g in range(len(CARD_GROUPS) - 1, -1, -1):
+            size = len(self.pools[g])
+            for r in range(num_cards + 1):
+                self.ways[g][r] = sum(
+                    math.comb(size, x) * self.ways[g + 1][r - x]
+                    for x in range(self.lows[g], min(self.highs[g], r) + 1)
+                )
+        if not self.ways[0][num_cards]:
+            raise ValueError(
+                f"Unsatisfiable constraints: no {num_cards}-card draw satisfies "
+                "the group pools and counts"
+            )
+
+        low_rev = constraints.get("reversed", constraints.get("min_reversed", 0))
+        high_rev = constraints.get(
+            "reversed", constraints.get("max_reversed", num_cards)
+        )
+        low_rev, high_rev = max(low_rev, 0), min(high_rev, num_cards)
+        if low_rev > high_rev:
+            raise ValueError(
+                f"Unsatisfiable constraints: cannot reverse between "
+                f"{low_rev} and {high_rev} of {num_cards} card(s)"
+            )
+        self.reversed_range = (low_rev, high_rev)
+
+    def sample_card_ids(self) -> List[int]:
+        """Sample quotas per group, then cards within each group, in one pass."""
+        card_ids: List[int] = []
+        remaining = self.num_cards
+        for g, pool in enumerate(self.pools):
+            options = list(range(self.lows[g], min(self.highs[g], remaining) + 1))
+            weights = [
+                math.comb(len(pool), x) * self.ways[g + 1][remaining - x]
+                for x in options
+            ]
+            count = options[_pick_index(weights)]
+            card_ids.extend(random.sample(pool, count))
+            remaining -= count
+        random.shuffle(card_ids)
+        return card_ids
+
+    def sample_reversed(self) -> List[bool]:
+        """Sample orientations, uniform over all flips meeting the bounds."""
+        low, high = self.reversed_range
+        options = list(range(low, high + 1))
+        count = options[_pick_index([math.comb(self.num_cards, r) for r in options])]
+        flipped = set(random.sample(range(self.num_cards), count))
+        return [i in flipped for i in range(self.num_cards)]
+
+
+def draw_constrained(
+    spread: Any = "three",
+    constraints: Optional[Dict[str, Any]] = None,
+    personal_seed: Optional[str] = None,
+) -> Any:
+    """
+    Draw a spread that satisfies constraints, in a single sampling pass.
+
+    Constraints are compiled into card pools and per-group quotas and sampled
+    directly, so there is no retry loop. The result is distributed exactly like
+    a uniform draw conditioned on the constraints.
+
+    Args:
+        spread: "single", a registered spread name or a number of cards (1-78)
+        constraints: Optional dict with any of:
+            - "groups": allowed groups, e.g. ["Cups", "Wands"] or ["Major Arcana"]
+            - "exclude": card names, card dicts or a previous reading to avoid
+            - "min_counts" / "max_counts": per-group bounds, e.g.
+              {"Major Arcana": 1}
+            - "reversed": exact number of reversed cards
+            - "min_reversed" / "max_reversed": bounds on reversed cards
+        personal_seed: Optional personal information to seed the shuffle
+
+    Returns:
+        Same shape as the matching spread function: a card dict for "single",
+        a position -> card dict for named spreads, or a list of cards
+
+    Raises:
+        ValueError: If the spread is unknown or the constraints are unsatisfiable
+    """
+    num_cards, positions = _spread_positions(spread)
+    compiled = _CompiledConstraints(num_cards, constraints or {})
+
+    if personal_seed:
+        random.seed(_create_personal_seed(personal_seed))
+
+    all_cards = get_all_cards()
+    card_ids = compiled.sample_card_ids()
+    cards = [
+        _build_card_result(all_cards[card_id], is_reversed)
+        for card_id, is_reversed in zip(card_ids, compiled.sample_reversed())
     ]
 
-    return {position: card for position, card in zip(positions, cards)}
+    if personal_seed:
+        random.seed()
+
+    if spread == "single":
+        return cards[0]
+    if positions:
+        return dict(zip(positions, cards))
+    return cards
+
+
+class _CountTree:
+    """
+    Fenwick tree over per-card remaining counts.
+
+    Supports picking the card at a given position of the remaining multiset
+    and decrementing its count in O(log 78), without materializing the shoe.
+    """
+
+    __slots__ = ("size", "tree", "top_bit")
+
+    def __init__(self, counts: List[int]):
+        self.size = len(counts)
+        self.tree = [0] + list(counts)
+        for i in range(1, self.size + 1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[i]
+        self.top_bit = 1 << (self.size.bit_length() - 1)
+
+    def add(self, index: int, delta: int):
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, target: int) -> int:
+        """Return the index holding the target-th (0-based) remaining card."""
+        pos = 0
+        bit = self.top_bit
+        while bit:
+            nxt = pos + bit
+            if nxt <= self.size and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            bit >>= 1
+        return pos
+
+
+class Shoe:
+    """
+    Several combined decks dealt from per-card remaining counts.
+
+    The shoe never builds a list of ``num_decks * 78`` cards: it tracks how
+    many copies of each card remain and picks cards through a Fenwick tree.
+    Once the dealt fraction reaches ``penetration`` the shoe is reshuffled
+    before the next deal; a deal that empties the shoe reshuffles mid-deal.
+    """
+
+    def __init__(
+        self,
+        num_decks: int = 2,
+        penetration: float = 0.75,
+        personal_seed: Optional[str] = None,
+    ):
+        """
+        Args:
+            num_decks: Number of 78-card decks combined in the shoe
+            penetration: Fraction of the shoe dealt before reshuffling (0-1]
+            personal_seed: Optional personal information to seed the shoe
+        """
+        if num_decks < 1:
+            raise ValueError("Number of decks must be at least 1")
+        if not 0 < penetration <= 1:
+            raise ValueError("Penetration must be greater than 0 and at most 1")
+
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.size = num_decks * DECK_SIZE
+        self.reshuffles = 0
+        self._rng = random.Random(
+            _create_personal_seed(personal_seed) if personal_seed else None
+        )
+        self._all_cards = get_all_cards()
+        self._reset()
+
+    @property
+    def remaining(self) -> int:
+        """Number of cards left before the shoe is exhausted."""
+        return self._remaining
+
+    @property
+    def dealt(self) -> int:
+        """Number of cards dealt since the last reshuffle."""
+        return self.size - self._remaining
+
+    def _reset(self):
+        self._counts = [self.num_decks] * DECK_SIZE
+        self._tree = _CountTree(self._counts)
+        self._remaining = self.size
+
+    def reshuffle(self):
+        """Return every card to the shoe."""
+        self._reset()
+        self.reshuffles += 1
+
+    def _prepare_deal(self):
+        if self.dealt >= self.penetration * self.size:
+            self.reshuffle()
+
+    def deal(self, num_cards: int = 1, replace: bool = False) -> List[Dict[str, Any]]:
+        """
+        Deal cards from the shoe.
+
+        Args:
+            num_cards: Number of cards to deal (any positive number)
+            replace: Draw with replacement, leaving the shoe untouched
+
+        Returns:
+            List of card dictionaries with name, meaning, and orientation
+        """
+        if num_cards < 1:
+            raise ValueError("Number of cards must be at least 1")
+
+        rng = self._rng
+        result = []
+        if replace:
+            for _ in range(num_cards):
+                card = self._all_cards[rng.randrange(DECK_SIZE)]
+                result.append(_build_card_result(card, rng.random() < 0.5))
+            return result
+
+        self._prepare_deal()
+        for _ in range(num_cards):
+            if not self._remaining:
+                self.reshuffle()
+            card_id = self._tree.find(rng.randrange(self._remaining))
+            self._tree.add(card_id, -1)
+            self._counts[card_id] -= 1
+            self._remaining -= 1
+            result.append(
+                _build_card_result(self._all_cards[card_id], rng.random() < 0.5)
+            )
+        return result
+
+    def deal_ids(self, num_cards: int, replace: bool = False) -> Tuple[Any, Any]:
+        """
+        Deal cards in bulk as NumPy arrays instead of card dicts.
+
+        Follows the same reshuffle rules as deal(). Requires NumPy.
+
+        Args:
+            num_cards: Number of cards to deal (any positive number)
+            replace: Draw with replacement, leaving the shoe untouched
+
+        Returns:
+            Tuple of (card_ids, reversed) arrays of dtype uint8 and bool
+        """
+        import numpy as np
+
+        if num_cards < 1:
+            raise ValueError("Number of cards must be at least 1")
+
+        rng = np.random.default_rng(self._rng.getrandbits(64))
+        is_reversed = rng.random(num_cards) < 0.5
+        if replace:
+            return rng.integers(0, DECK_SIZE, num_cards, dtype=np.uint8), is_reversed
+
+        self._prepare_deal()
+        card_ids = np.empty(num_cards, dtype=np.uint8)
+        filled = 0
+        while filled < num_cards:
+            if not self._remaining:
+                self.reshuffle()
+            take = min(num_cards - filled, self._remaining)
+            counts = np.array(self._counts, dtype=np.int64)
+            shoe = np.repeat(np.arange(DECK_SIZE, dtype=np.uint8), counts)
+            chunk = rng.choice(shoe, size=take, replace=False)
+            card_ids[filled : filled + take] = chunk
+            counts -= np.bincount(chunk, minlength=DECK_SIZE)
+            self._counts = counts.tolist()
+            self._remaining -= take
+            filled += take
+        self._tree = _CountTree(self._counts)
+        return card_ids, is_reversed
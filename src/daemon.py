@@ -0,0 +1,299 @@
+"""
+Warm reading daemon for the ``tarot-reader`` command, over a Unix socket.
+
+``tarot-reader serve --socket PATH`` keeps the deck, spread registry and
+renderers loaded, and answers requests of one JSON object per line:
+
+    {"type": "celtic", "seed": "INFP"}   ->  {"output": "..."}
+    {"cmd": "ping"}                       ->  {"ok": true, "version": "..."}
+    {"cmd": "stop"}                       ->  {"ok": true}
+
+Errors are answered as {"error": "..."}. A connection may send any number
+of requests. ``tarot-reader --socket PATH ...`` is the thin client: it sends
+the reading request, prints the output and starts the daemon on first use.
+Because the protocol is plain JSON lines, ``nc -U`` or ``socat`` also work
+as clients without starting Python at all.
+
+Readings are generated one at a time under a lock, since seeded draws seed
+the global random module. The client side imports only the standard
+library, so asking a running daemon costs no more than starting Python.
+Unix only: importing this module elsewhere raises ImportError.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from . import __version__
+
+if not hasattr(socketserver, "UnixStreamServer"):
+    raise ImportError("The reading daemon needs Unix domain sockets")
+
+# Seconds an auto-started daemon waits for requests before exiting
+DEFAULT_IDLE_TIMEOUT = 900.0
+# Longest request line accepted, in bytes
+MAX_REQUEST = 1 << 16
+
+# Text function of each reading type, in text_formatter
+READINGS: Dict[str, str] = {
+    "single": "get_single_card_text",
+    "three": "get_three_card_text",
+    "celtic": "get_celtic_cross_text",
+}
+
+_GENERATE_LOCK = threading.Lock()
+
+
+def reading_text(reading_type: str, seed: Optional[str] = None) -> str:
+    """
+    Text of a CLI reading.
+
+    Args:
+        reading_type: "single", "three" or "celtic"
+        seed: Optional personal seed
+
+    Raises:
+        ValueError: For unknown reading types
+    """
+    from . import text_formatter
+
+    try:
+        text_function: Callable[..., str] = getattr(
+            text_formatter, READINGS[reading_type]
+        )
+    except KeyError:
+        raise ValueError(
+            f"Unknown reading type '{reading_type}'. "
+            f"Available types: {', '.join(READINGS)}"
+        ) from None
+    with _GENERATE_LOCK:
+        return text_function(seed)
+
+
+def handle_request(server: Any, request: Any) -> Dict[str, Any]:
+    """Answer one decoded request."""
+    if not isinstance(request, dict):
+        return {"error": "Request must be a JSON object"}
+    command = request.get("cmd", "reading")
+    if command == "ping":
+        return {"ok": True, "version": __version__}
+    if command == "stop":
+        # The handler shuts the server down once this answer is sent
+        server.stop_requested = True
+        return {"ok": True}
+    if command != "reading":
+        return {"error": f"Unknown command '{command}'"}
+
+    reading_type = request.get("type", "single")
+    if not isinstance(reading_type, str):
+        return {"error": "type must be a string"}
+    seed = request.get("seed")
+    if seed is not None and not isinstance(seed, str):
+        return {"error": "seed must be a string"}
+    try:
+        return {"output": reading_text(reading_type, seed)}
+    except ValueError as e:
+        return {"error": str(e)}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            line = self.rfile.readline(MAX_REQUEST + 1)
+            if not line:
+                return
+            self.server.last_request = time.monotonic()
+            if len(line) > MAX_REQUEST:
+                response: Dict[str, Any] = {"error": "Request too large"}
+            else:
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {"error": "Request is not valid JSON"}
+                else:
+                    response = handle_request(self.server, request)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+            if self.server.stop_requested:
+                # shutdown() waits for the serving loop, so call it elsewhere
+                threading.Thread(target=self.server.shutdown).start()
+                return
+            if len(line) > MAX_REQUEST:
+                return
+
+
+def _is_alive(path: str) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+        return True
+    except OSError:
+        return False
+
+
+class ReadingServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Threaded Unix socket server answering reading requests.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Socket path. A stale socket file left by a dead daemon is
+                  replaced.
+
+        Raises:
+            OSError: If another daemon is already serving on path
+        """
+        self.path = path
+        self.lock_path = path + ".lock"
+        self.last_request = time.monotonic()
+        self.stop_requested = False
+        self._lock_held = False
+        # Daemons auto-started by concurrent clients take turns to check
+        # and bind, so none unlinks a socket another has just bound
+        with self._locked():
+            if os.path.exists(path):
+                if _is_alive(path):
+                    raise OSError(f"A daemon is already serving on {path}")
+                os.unlink(path)
+            super().__init__(path, _Handler)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        # Reentrant, since a failed bind calls server_close() under the lock
+        if self._lock_held:
+            yield
+            return
+        import fcntl
+
+        with open(self.lock_path, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self._lock_held = True
+            try:
+                yield
+            finally:
+                self._lock_held = False
+
+    def server_close(self):
+        super().server_close()
+        # Remove the socket and the lock file while holding the lock
+        with self._locked():
+            for path in (self.path, self.lock_path):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+
+def serve(path: str, idle_timeout: Optional[float] = None):
+    """
+    Serve reading requests on a Unix socket until stopped.
+
+    Args:
+        path: Socket path
+        idle_timeout: Optional number of idle seconds after which the daemon
+                      exits
+    """
+    # Load the deck and renderers before the first request
+    from . import text_formatter  # noqa: F401
+
+    with ReadingServer(path) as server:
+        if idle_timeout:
+
+            def watch_idle():
+                while True:
+                    idle = time.monotonic() - server.last_request
+                    if idle >= idle_timeout:
+                        server.shutdown()
+                        return
+                    time.sleep(min(idle_timeout - idle, 1.0))
+
+            threading.Thread(target=watch_idle, daemon=True).start()
+        server.serve_forever()
+
+
+def send_request(
+    path: str, request: Dict[str, Any], timeout: float = 10.0
+) -> Dict[str, Any]:
+    """
+    Send one request to a daemon and return its decoded response.
+
+    Raises:
+        OSError: If no daemon answers on path
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as stream:
+            line = stream.readline()
+    if not line:
+        raise ConnectionError(f"The daemon on {path} closed the connection")
+    return json.loads(line)
+
+
+def start_daemon(
+    path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT, wait: float = 5.0
+) -> bool:
+    """
+    Start a detached daemon on path and wait until it accepts connections.
+
+    Returns:
+        True if a daemon is answering on path
+    """
+    command = [sys.executable, "-m", "src", "serve", "--socket", path]
+    command += ["--idle-timeout", str(idle_timeout)]
+    subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if _is_alive(path):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def request_reading(
+    path: str, reading_type: str, seed: Optional[str] = None, autostart: bool = True
+) -> str:
+    """
+    Get a reading from the daemon on path, starting one if none is running.
+
+    Args:
+        path: Socket path
+        reading_type: "single", "three" or "celtic"
+        seed: Optional personal seed
+        autostart: Start a daemon when none answers
+
+    Returns:
+        The reading text
+
+    Raises:
+        OSError: If no daemon answers and none could be started
+        ValueError: If the daemon rejects the request
+    """
+    request = {"type": reading_type, "seed": seed}
+    try:
+        response = send_request(path, request)
+    except (FileNotFoundError, ConnectionRefusedError):
+        if not autostart or not start_daemon(path):
+            raise
+        response = send_request(path, request)
+    if "error" in response:
+        raise ValueError(response["error"])
+    return response["output"]
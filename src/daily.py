@@ -0,0 +1,257 @@
+"""
+Deterministic card of the day.
+
+daily_card() gives every personal seed one card per calendar date, the same
+card on every call. Each seed is hashed once to a 64-bit key; the card for a
+date mixes that key with the date's ordinal using the splitmix64 finalizer,
+which NumPy can evaluate for a whole calendar at once.
+
+build_calendar() precomputes those cards for a list of seeds over a date
+range into a fixed-width lookup file, and DailyCalendar memory-maps it so
+serving a daily card is a constant-time read. Building needs NumPy; reading
+does not.
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from .core import _build_card_result
+from .deck import CARD_ID_MASK, DECK_SIZE, DECK_VERSION, REVERSED_BIT, get_all_cards
+
+CALENDAR_ENV_VAR = "TAROT_READER_CALENDAR"
+
+_MAGIC = b"TAROTCAL"
+_FORMAT_VERSION = 1
+_KEY_SIZE = 8
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+# Seeds hashed per vectorized block while building a calendar
+_BUILD_CHUNK = 4096
+
+
+def _seed_key(personal_seed: Optional[str]) -> int:
+    """64-bit key of a personal seed; never 0, which marks empty slots."""
+    digest = hashlib.blake2b(
+        (personal_seed or "").encode("utf-8"), digest_size=8, person=b"tarot-daily"
+    ).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+def _encode(value: int) -> int:
+    """Map a 64-bit hash to a card byte: card id plus the reversed bit."""
+    choice = value % (2 * DECK_SIZE)
+    return (choice >> 1) | (REVERSED_BIT if choice & 1 else 0)
+
+
+def _daily_byte(key: int, ordinal: int) -> int:
+    z = (key + ordinal * _GOLDEN) & _MASK64
+    z = ((z ^ (z >> 30)) * _MIX1) & _MASK64
+    z = ((z ^ (z >> 27)) * _MIX2) & _MASK64
+    return _encode(z ^ (z >> 31))
+
+
+def _decode(value: int) -> Dict[str, Any]:
+    card = get_all_cards()[value & CARD_ID_MASK]
+    return _build_card_result(card, bool(value & REVERSED_BIT))
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def daily_card(
+    personal_seed: Optional[str] = None, day: Optional[date] = None
+) -> Dict[str, Any]:
+    """
+    Card of the day for a personal seed.
+
+    Unlike draw_single(), the result has no time component: the same seed
+    and date always give the same card and orientation.
+
+    Args:
+        personal_seed: Optional personal information; without one, everyone
+                       shares the same card of the day
+        day: Date of the reading (default: today in UTC)
+
+    Returns:
+        Dictionary with card name, meaning, and orientation
+    """
+    day = day or _today()
+    return _decode(_daily_byte(_seed_key(personal_seed), day.toordinal()))
+
+
+def build_calendar(
+    path: str, seeds: Iterable[str], start: Optional[date] = None, days: int = 365
+) -> int:
+    """
+    Precompute daily cards for many seeds into a lookup file.
+
+    The file is an open-addressing hash table of fixed-width records, one
+    per seed: its 64-bit key followed by one card byte per day. Cards are
+    computed for blocks of seeds at a time with vectorized hashing.
+
+    Args:
+        path: Output file
+        seeds: Personal seeds to precompute (duplicates are ignored)
+        start: First date of the calendar (default: today in UTC)
+        days: Number of consecutive days (1-3660)
+
+    Returns:
+        Number of distinct seeds written
+    """
+    import numpy as np
+
+    if days < 1 or days > 3660:
+        raise ValueError("days must be between 1 and 3660")
+    start = start or _today()
+
+    keys = list(dict.fromkeys(_seed_key(seed) for seed in seeds))
+    num_slots = 1
+    while 3 * num_slots < 4 * max(len(keys), 1):
+        num_slots *= 2
+
+    # Linear probing; at most 3/4 of the slots are used so probes stay short
+    mask = num_slots - 1
+    occupied = bytearray(num_slots)
+    slots = []
+    for key in keys:
+        slot = key & mask
+        while occupied[slot]:
+            slot = (slot + 1) & mask
+        occupied[slot] = 1
+        slots.append(slot)
+
+    header = json.dumps(
+        {
+            "format": _FORMAT_VERSION,
+            "deck_version": DECK_VERSION,
+            "start": start.isoformat(),
+            "days": days,
+            "slots": num_slots,
+            "seeds": len(keys),
+        }
+    ).encode()
+    header += b" " * (-(len(_MAGIC) + 4 + len(header)) % 8)
+    offset = len(_MAGIC) + 4 + len(header)
+
+    with open(path, "wb") as f:
+        f.write(_MAGIC + struct.pack("<I", len(header)) + header)
+        f.truncate(offset + num_slots * (_KEY_SIZE + days))
+
+    dtype = np.dtype([("key", "<u8"), ("cards", "u1", (days,))])
+    records = np.memmap(path, dtype=dtype, mode="r+", offset=offset, shape=(num_slots,))
+
+    ordinals = np.arange(days, dtype=np.uint64) + np.uint64(start.toordinal())
+    offsets = ordinals * np.uint64(_GOLDEN)
+    for begin in range(0, len(keys), _BUILD_CHUNK):
+        block = np.array(keys[begin : begin + _BUILD_CHUNK], dtype=np.uint64)
+        z = block[:, None] + offsets[None, :]
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(_MIX1)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(_MIX2)
+        choice = (z ^ (z >> np.uint64(31))) % np.uint64(2 * DECK_SIZE)
+        cards = (choice >> np.uint64(1)) | ((choice & np.uint64(1)) << np.uint64(7))
+
+        rows = np.array(slots[begin : begin + _BUILD_CHUNK], dtype=np.intp)
+        records["key"][rows] = block
+        records["cards"][rows] = cards.astype(np.uint8)
+
+    records.flush()
+    del records
+    return len(keys)
+
+
+class DailyCalendar:
+    """
+    Memory-mapped calendar written by build_calendar().
+
+    Lookups hash the seed once and probe a few fixed-width records, reading
+    a single byte for the card; nothing is loaded up front.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Calendar file written by build_calendar()
+
+        Raises:
+            ValueError: If the file is not a calendar or was built for a
+                        different deck version
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._map[: len(_MAGIC)] != _MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a daily calendar file")
+        (header_size,) = struct.unpack_from("<I", self._map, len(_MAGIC))
+        header_start = len(_MAGIC) + 4
+        header = json.loads(self._map[header_start : header_start + header_size])
+        if header["deck_version"] != DECK_VERSION:
+            self._map.close()
+            raise ValueError(
+                f"{path} was built for deck version {header['deck_version']}, "
+                f"current version is {DECK_VERSION}"
+            )
+
+        self.start = date.fromisoformat(header["start"])
+        self.days: int = header["days"]
+        self.seeds: int = header["seeds"]
+        self._slots: int = header["slots"]
+        self._offset = header_start + header_size
+        self._record_size = _KEY_SIZE + self.days
+
+    @property
+    def end(self) -> date:
+        """Last date covered by the calendar."""
+        return self.start + timedelta(days=self.days - 1)
+
+    def _find(self, key: int) -> Optional[int]:
+        mask = self._slots - 1
+        slot = key & mask
+        while True:
+            position = self._offset + slot * self._record_size
+            (stored,) = struct.unpack_from("<Q", self._map, position)
+            if stored == key:
+                return position
+            if stored == 0:
+                return None
+            slot = (slot + 1) & mask
+
+    def lookup(
+        self, personal_seed: Optional[str] = None, day: Optional[date] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Precomputed card of the day, or None if the seed or date is not in
+        the calendar.
+
+        Args:
+            personal_seed: Personal seed as passed to daily_card()
+            day: Date of the reading (default: today in UTC)
+
+        Returns:
+            Same dictionary as daily_card(), or None
+        """
+        index = (day or _today()).toordinal() - self.start.toordinal()
+        if index < 0 or index >= self.days:
+            return None
+        position = self._find(_seed_key(personal_seed))
+        if position is None:
+            return None
+        return _decode(self._map[position + _KEY_SIZE + index])
+
+    def close(self):
+        """Unmap the calendar file."""
+        self._map.close()
+
+    def __enter__(self) -> "DailyCalendar":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
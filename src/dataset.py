@@ -0,0 +1,416 @@
+"""
+Columnar, memory-mapped reading datasets.
+
+A dataset file is a small JSON header followed by a packed NumPy structured
+array with one fixed-width record per reading:
+
+    cards     uint8[width]       card ids, 0xFF past the end of the reading
+    reversed  uint8[width / 8]   orientation bitmask, bit i = card i reversed
+    size      uint8              number of cards in the reading
+    spread    uint8              index into the header's spread table, or
+                                 0xFF for plain card counts
+    flags     uint8              bit 0: the seed column is set
+    seed      uint64             seed id, e.g. for draw_from_seed()
+
+The header holds the deck version the card ids refer to, the record width
+and the spread table with each spread's positions, so a file decodes the
+same in any process whatever spreads are registered there. Records start on
+a 64-byte boundary, so Dataset can memory-map the file and expose columns
+as zero-copy NumPy views; a reading is decoded only when it is accessed.
+DatasetWriter buffers records and writes them in large chunks, and the
+JSONL converters stream line by line.
+
+Requires NumPy (``pip install tarot-reader[numpy]``).
+"""
+
+import json
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .batch import _CARD_RESULTS
+from .core import _reading_cards, _reading_spread
+from .deck import DECK_SIZE, DECK_VERSION, get_card_id
+from .spreads import get_spread, list_spreads
+
+_MAGIC = b"TAROTSET"
+_FORMAT_VERSION = 1
+_ALIGN = 64
+_COUNT_SPREAD = 0xFF
+_MAX_SPREADS = 255
+_EMPTY_SLOT = 0xFF
+_SEEDED = 0x01
+# Records decoded per NumPy-to-list conversion
+_DECODE_CHUNK = 4096
+
+PathLike = Union[str, Path]
+
+
+def _record_dtype(width: int) -> np.dtype:
+    return np.dtype(
+        [
+            ("cards", np.uint8, (width,)),
+            ("reversed", np.uint8, ((width + 7) // 8,)),
+            ("size", np.uint8),
+            ("spread", np.uint8),
+            ("flags", np.uint8),
+            ("seed", "<u8"),
+        ]
+    )
+
+
+class DatasetWriter:
+    """
+    Buffered writer of a dataset file.
+    """
+
+    def __init__(self, path: PathLike, width: int = 10, buffer_rows: int = 65536):
+        """
+        Args:
+            path: File to create (overwritten if it exists)
+            width: Maximum cards per reading (1-78)
+            buffer_rows: Records buffered before each write
+        """
+        if width < 1 or width > DECK_SIZE:
+            raise ValueError("width must be between 1 and 78")
+        if buffer_rows < 1:
+            raise ValueError("buffer_rows must be at least 1")
+
+        self.path = Path(path)
+        self.width = width
+        self.count = 0
+        self._dtype = _record_dtype(width)
+        self._spreads = list_spreads()[:_MAX_SPREADS]
+        self._spread_ids = {name: i for i, name in enumerate(self._spreads)}
+        positions = {name: get_spread(name).positions for name in self._spreads}
+        self._buffer = np.zeros(buffer_rows, dtype=self._dtype)
+        self._fill = 0
+
+        header = json.dumps(
+            {
+                "format": _FORMAT_VERSION,
+                "deck_version": DECK_VERSION,
+                "width": width,
+                "spreads": self._spreads,
+                "positions": positions,
+                "created": time.time(),
+            }
+        ).encode()
+        prefix = len(_MAGIC) + 4
+        header += b" " * (-(prefix + len(header)) % _ALIGN)
+        self._file: Any = open(self.path, "wb")
+        self._file.write(_MAGIC + struct.pack("<I", len(header)) + header)
+
+    def _spread_id(self, spread: Union[str, int], size: int) -> int:
+        if size < 1 or size > self.width:
+            raise ValueError(f"Readings must have between 1 and {self.width} cards")
+        if isinstance(spread, int) and not isinstance(spread, bool):
+            return _COUNT_SPREAD
+        if spread not in self._spread_ids:
+            raise ValueError(f"Spread '{spread}' is not in the dataset's spread table")
+        return self._spread_ids[spread]
+
+    def _flush_buffer(self):
+        if self._fill:
+            self._file.write(self._buffer[: self._fill].tobytes())
+            self.count += self._fill
+            self._fill = 0
+
+    def write(self, reading: Any, spread: Any = None, seed: Optional[int] = None):
+        """
+        Append one reading.
+
+        Args:
+            reading: A reading as returned by the spread functions
+            spread: "single", a spread name or a card count (inferred from
+                    the reading if omitted)
+            seed: Optional non-negative integer seed id
+        """
+        cards = _reading_cards(reading)
+        spread = _reading_spread(reading) if spread is None else spread
+        spread_id = self._spread_id(spread, len(cards))
+        if self._fill == len(self._buffer):
+            self._flush_buffer()
+
+        record = self._buffer[self._fill]
+        record["cards"] = _EMPTY_SLOT
+        record["cards"][: len(cards)] = [get_card_id(card["name"]) for card in cards]
+        mask = 0
+        for i, card in enumerate(cards):
+            if card["orientation"] == "Reversed":
+                mask |= 1 << i
+        record["reversed"] = list(
+            mask.to_bytes(self._dtype["reversed"].shape[0], "little")
+        )
+        record["size"] = len(cards)
+        record["spread"] = spread_id
+        record["flags"] = 0 if seed is None else _SEEDED
+        record["seed"] = seed or 0
+        self._fill += 1
+
+    def write_batch(
+        self,
+        card_ids: np.ndarray,
+        is_reversed: np.ndarray,
+        spread: Any = None,
+        seeds: Optional[np.ndarray] = None,
+    ):
+        """
+        Append readings from batch arrays, as returned by draw_batch().
+
+        Args:
+            card_ids: Array of card ids of shape (readings, num_cards)
+            is_reversed: Array of orientations of the same shape
+            spread: "single", a spread name or a card count (default:
+                    num_cards)
+            seeds: Optional array of seed ids, one per reading
+        """
+        count, num_cards = card_ids.shape
+        spread = num_cards if spread is None else spread
+        spread_id = self._spread_id(spread, num_cards)
+
+        rows = np.zeros(count, dtype=self._dtype)
+        rows["cards"] = _EMPTY_SLOT
+        rows["cards"][:, :num_cards] = card_ids
+        flags = np.zeros((count, self.width), dtype=bool)
+        flags[:, :num_cards] = is_reversed
+        rows["reversed"] = np.packbits(flags, axis=1, bitorder="little")
+        rows["size"] = num_cards
+        rows["spread"] = spread_id
+        if seeds is not None:
+            rows["flags"] = _SEEDED
+            rows["seed"] = seeds
+
+        if self._fill + count > len(self._buffer):
+            self._flush_buffer()
+        if count >= len(self._buffer):
+            self._file.write(rows.tobytes())
+            self.count += count
+        else:
+            self._buffer[self._fill : self._fill + count] = rows
+            self._fill += count
+
+    def close(self):
+        """Write buffered records and close the file."""
+        if self._file is not None:
+            self._flush_buffer()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "DatasetWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+
+class Dataset:
+    """
+    Memory-mapped dataset written by DatasetWriter.
+
+    Columns are zero-copy views of the file; indexing with an integer
+    decodes one reading, and slicing returns a Dataset view of a range.
+    """
+
+    def __init__(self, path: PathLike):
+        """
+        Args:
+            path: Dataset file
+
+        Raises:
+            ValueError: If the file is not a dataset or was written for a
+                        different deck version
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            prefix = f.read(len(_MAGIC) + 4)
+            if prefix[: len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"{path} is not a reading dataset")
+            (header_size,) = struct.unpack_from("<I", prefix, len(_MAGIC))
+            header = json.loads(f.read(header_size))
+        if header["deck_version"] != DECK_VERSION:
+            raise ValueError(
+                f"{path} was written for deck version {header['deck_version']}, "
+                f"current version is {DECK_VERSION}"
+            )
+
+        self.width: int = header["width"]
+        self.spreads: List[str] = header["spreads"]
+        self.positions: Dict[str, Tuple[str, ...]] = {
+            name: tuple(names) for name, names in header["positions"].items()
+        }
+        dtype = _record_dtype(self.width)
+        offset = len(prefix) + header_size
+        # A torn final record from an interrupted write is ignored
+        count = (self.path.stat().st_size - offset) // dtype.itemsize
+        self.records: np.ndarray
+        if count:
+            self.records = np.memmap(
+                self.path, dtype=dtype, mode="r", offset=offset, shape=(count,)
+            )
+        else:
+            self.records = np.zeros(0, dtype=dtype)
+
+    @classmethod
+    def _view(cls, parent: "Dataset", records: np.ndarray) -> "Dataset":
+        view = cls.__new__(cls)
+        view.path = parent.path
+        view.width = parent.width
+        view.spreads = parent.spreads
+        view.positions = parent.positions
+        view.records = records
+        return view
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def card_ids(self) -> np.ndarray:
+        """Card id column of shape (readings, width); 0xFF marks empty slots."""
+        return self.records["cards"]
+
+    @property
+    def seeds(self) -> np.ndarray:
+        """Seed id column."""
+        return self.records["seed"]
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Number of cards in each reading."""
+        return self.records["size"]
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Card ids and unpacked orientations, as returned by draw_batch().
+
+        Returns:
+            Tuple of (card_ids, reversed) arrays of shape (readings, width);
+            card_ids is a zero-copy view
+        """
+        is_reversed = np.unpackbits(
+            self.records["reversed"], axis=1, count=self.width, bitorder="little"
+        ).astype(bool)
+        return self.card_ids, is_reversed
+
+    def _decode(self, start: int, stop: int) -> Iterator[Tuple[Any, Any, Any]]:
+        """Yield (spread, seed, reading) for a range, decoding in chunks."""
+        positions = self.positions
+        for chunk_start in range(start, stop, _DECODE_CHUNK):
+            chunk = self.records[chunk_start : min(chunk_start + _DECODE_CHUNK, stop)]
+            masks = np.unpackbits(
+                chunk["reversed"], axis=1, count=self.width, bitorder="little"
+            ).tolist()
+            for ids, flags, size, spread_id, seeded, seed in zip(
+                chunk["cards"].tolist(),
+                masks,
+                chunk["size"].tolist(),
+                chunk["spread"].tolist(),
+                chunk["flags"].tolist(),
+                chunk["seed"].tolist(),
+            ):
+                cards = [
+                    dict(_CARD_RESULTS[card_id][flag])
+                    for card_id, flag in zip(ids[:size], flags)
+                ]
+                if spread_id == _COUNT_SPREAD:
+                    spread: Any = size
+                    reading: Any = cards
+                else:
+                    spread = self.spreads[spread_id]
+                    if spread == "single":
+                        reading = cards[0]
+                    else:
+                        reading = dict(zip(positions[spread], cards))
+                yield spread, seed if seeded & _SEEDED else None, reading
+
+    def reading(self, index: int) -> Any:
+        """Decode one reading into the shape of its spread's reading."""
+        index = range(len(self))[index]
+        return next(self._decode(index, index + 1))[2]
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return Dataset._view(self, self.records[index])
+        return self.reading(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for _, _, reading in self._decode(0, len(self)):
+            yield reading
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over {"spread", "seed", "reading"} dicts, as in JSONL files."""
+        for spread, seed, reading in self._decode(0, len(self)):
+            yield {"spread": spread, "seed": seed, "reading": reading}
+
+    def close(self):
+        """Release the memory map."""
+        self.records = np.zeros(0, dtype=self.records.dtype)
+
+    def __enter__(self) -> "Dataset":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+
+def jsonl_to_dataset(
+    source: Union[PathLike, IO[str]], path: PathLike, width: int = 10
+) -> int:
+    """
+    Convert a JSONL file of readings into a dataset, one line at a time.
+
+    Each line is either a bare reading or an object with a "reading" key and
+    optional "spread" and "seed" keys, as written by dataset_to_jsonl().
+
+    Args:
+        source: JSONL file path or open text stream
+        path: Dataset file to create
+        width: Maximum cards per reading
+
+    Returns:
+        Number of readings written
+    """
+    stream = open(source) if isinstance(source, (str, Path)) else source
+    try:
+        with DatasetWriter(path, width) as writer:
+            for line in stream:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if isinstance(entry, dict) and "reading" in entry:
+                    writer.write(
+                        entry["reading"], entry.get("spread"), entry.get("seed")
+                    )
+                else:
+                    writer.write(entry)
+        return writer.count
+    finally:
+        if stream is not source:
+            stream.close()
+
+
+def dataset_to_jsonl(path: PathLike, target: Union[PathLike, IO[str]]) -> int:
+    """
+    Write a dataset as JSONL, one {"spread", "seed", "reading"} object per line.
+
+    Args:
+        path: Dataset file
+        target: JSONL file path or open text stream
+
+    Returns:
+        Number of readings written
+    """
+    stream = open(target, "w") if isinstance(target, (str, Path)) else target
+    count = 0
+    try:
+        with Dataset(path) as dataset:
+            for entry in dataset.entries():
+                stream.write(json.dumps(entry) + "\n")
+                count += 1
+    finally:
+        if stream is not target:
+            stream.close()
+    return count
@@ -0,0 +1,268 @@
+"""
+Stateful dealing from a single shuffled deck across several requests.
+
+A Dealer holds one shuffled deck as a 78-byte permutation plus a cursor and
+deals from it incrementally, like a real table. Orientations are fixed at
+shuffle time and stored in the high bit of each permutation byte, so the whole
+state serializes to 79 bytes. SessionStore keeps those states per session with
+LRU and TTL eviction and a hard memory cap.
+"""
+
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .core import _build_card_result, _create_personal_seed
+from .deck import CARD_ID_MASK, DECK_SIZE, REVERSED_BIT, get_all_cards
+
+# Estimated bytes per stored session besides its key and state: the
+# OrderedDict node and hash slot, the (state, expiry) tuple and the float.
+_ENTRY_OVERHEAD = 200
+
+
+class Dealer:
+    """
+    Deal cards one at a time from a single shuffled deck.
+    """
+
+    __slots__ = ("_deck", "_cursor")
+
+    def __init__(self, personal_seed: Optional[str] = None):
+        """
+        Args:
+            personal_seed: Optional personal information to seed the shuffle
+        """
+        rng = random.Random(
+            _create_personal_seed(personal_seed) if personal_seed else None
+        )
+        card_ids = list(range(DECK_SIZE))
+        rng.shuffle(card_ids)
+        orientations = rng.getrandbits(DECK_SIZE)
+        self._deck = bytes(
+            card_id | (REVERSED_BIT if orientations >> i & 1 else 0)
+            for i, card_id in enumerate(card_ids)
+        )
+        self._cursor = 0
+
+    @classmethod
+    def from_bytes(cls, state: bytes) -> "Dealer":
+        """Restore a dealer from the 79 bytes produced by to_bytes()."""
+        if len(state) != DECK_SIZE + 1 or state[0] > DECK_SIZE:
+            raise ValueError("Dealer state must be a cursor byte plus 78 card bytes")
+        dealer = cls.__new__(cls)
+        dealer._cursor = state[0]
+        dealer._deck = bytes(state[1:])
+        return dealer
+
+    def to_bytes(self) -> bytes:
+        """Serialize the dealer as a cursor byte followed by the permutation."""
+        return bytes((self._cursor,)) + self._deck
+
+    @property
+    def remaining(self) -> int:
+        """Number of cards left in the deck."""
+        return DECK_SIZE - self._cursor
+
+    def deal(self, num_cards: int = 1) -> List[Dict[str, Any]]:
+        """
+        Deal the next cards from the deck.
+
+        Args:
+            num_cards: Number of cards to deal
+
+        Returns:
+            List of card dictionaries with name, meaning, and orientation
+
+        Raises:
+            ValueError: If fewer than num_cards cards remain
+        """
+        if num_cards < 1:
+            raise ValueError("Number of cards must be at least 1")
+        if num_cards > self.remaining:
+            raise ValueError(
+                f"Cannot deal {num_cards} cards: only {self.remaining} remain"
+            )
+
+        all_cards = get_all_cards()
+        dealt = self._deck[self._cursor : self._cursor + num_cards]
+        self._cursor += num_cards
+        return [
+            _build_card_result(
+                all_cards[value & CARD_ID_MASK], bool(value & REVERSED_BIT)
+            )
+            for value in dealt
+        ]
+
+
+class SessionStore:
+    """
+    Dealer states keyed by session id, bounded in count, age and memory.
+
+    Sessions expire ``ttl`` seconds after their last use. When adding a
+    session would exceed ``max_sessions`` or ``max_bytes``, the least recently
+    used sessions are evicted first. States are kept as 79-byte strings, so
+    100k sessions take roughly 40 MB.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 100_000,
+        ttl: float = 1800.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_sessions: Maximum number of live sessions
+            ttl: Seconds of inactivity before a session expires
+            max_bytes: Hard cap on the estimated memory used by sessions
+            clock: Monotonic time source, injectable for tests
+        """
+        if max_sessions < 1 or ttl <= 0 or max_bytes < 1:
+            raise ValueError("max_sessions, ttl and max_bytes must be positive")
+
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._clock = clock
+        self._sessions: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return self._lookup(session_id) is not None
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated bytes held by stored sessions."""
+        return self._bytes
+
+    @staticmethod
+    def _entry_size(session_id: str, state: bytes) -> int:
+        return _ENTRY_OVERHEAD + sys.getsizeof(session_id) + sys.getsizeof(state)
+
+    def _remove(self, session_id: str):
+        state, _ = self._sessions.pop(session_id)
+        self._bytes -= self._entry_size(session_id, state)
+
+    def _purge_expired(self, now: float):
+        # Entries are in last-use order, so expired ones sit at the front
+        while self._sessions:
+            session_id, (_, expires) = next(iter(self._sessions.items()))
+            if expires > now:
+                break
+            self._remove(session_id)
+
+    def _lookup(self, session_id: object) -> Optional[bytes]:
+        with self._lock:
+            return self._live_state(session_id)
+
+    def _live_state(self, session_id: object) -> Optional[bytes]:
+        # Callers hold self._lock
+        entry = self._sessions.get(session_id)  # type: ignore[call-overload]
+        if entry is None:
+            return None
+        if entry[1] <= self._clock():
+            self._remove(session_id)  # type: ignore[arg-type]
+            return None
+        return entry[0]
+
+    def _store(self, session_id: str, dealer: Dealer):
+        # Callers hold self._lock
+        state = dealer.to_bytes()
+        size = self._entry_size(session_id, state)
+        if size > self.max_bytes:
+            raise ValueError("A single session exceeds the store's memory cap")
+
+        now = self._clock()
+        if session_id in self._sessions:
+            self._remove(session_id)
+        self._purge_expired(now)
+        while self._sessions and (
+            len(self._sessions) >= self.max_sessions
+            or self._bytes + size > self.max_bytes
+        ):
+            self._remove(next(iter(self._sessions)))
+            self.evictions += 1
+        self._sessions[session_id] = (state, now + self.ttl)
+        self._bytes += size
+
+    def save(self, session_id: str, dealer: Dealer):
+        """
+        Store a dealer's state, marking the session as most recently used.
+
+        Args:
+            session_id: Session identifier
+            dealer: Dealer whose state to store
+        """
+        with self._lock:
+            self._store(session_id, dealer)
+
+    def create(self, personal_seed: Optional[str] = None) -> str:
+        """
+        Start a session with a freshly shuffled deck.
+
+        Args:
+            personal_seed: Optional personal information to seed the shuffle
+
+        Returns:
+            New session id
+        """
+        session_id = uuid.uuid4().hex
+        self.save(session_id, Dealer(personal_seed))
+        return session_id
+
+    def get(self, session_id: str) -> Optional[Dealer]:
+        """
+        Return the session's dealer, or None if unknown or expired.
+
+        The returned dealer is a copy; call save() after dealing from it.
+        """
+        state = self._lookup(session_id)
+        return None if state is None else Dealer.from_bytes(state)
+
+    def deal(
+        self, session_id: str, num_cards: int = 1
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Deal from a session's deck and store the advanced state.
+
+        The lookup, deal and store happen under one lock, so concurrent deals
+        never hand out the same cards and a session deleted or expired
+        meanwhile is not brought back.
+
+        Args:
+            session_id: Session identifier
+            num_cards: Number of cards to deal
+
+        Returns:
+            Tuple of the dealt card dictionaries and the number of cards left
+
+        Raises:
+            KeyError: If the session is unknown or expired
+            ValueError: If fewer than num_cards cards remain
+        """
+        with self._lock:
+            state = self._live_state(session_id)
+            if state is None:
+                raise KeyError(session_id)
+            dealer = Dealer.from_bytes(state)
+            cards = dealer.deal(num_cards)
+            self._store(session_id, dealer)
+            return cards, dealer.remaining
+
+    def delete(self, session_id: str) -> bool:
+        """Remove a session; returns whether it existed."""
+        with self._lock:
+            if session_id not in self._sessions:
+                return False
+            self._remove(session_id)
+            return True
@@ -2,6 +2,17 @@
 Tarot deck data containing all 78 cards with upright and reversed meanings.
 """
 
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+DECK_SIZE = 78
+
+# Compact card byte used by dealer states, replay logs and the daily
+# calendar: the card id in the low 7 bits, the reversed flag in the high bit
+CARD_ID_MASK = 0x7F
+REVERSED_BIT = 0x80
+
 MAJOR_ARCANA = [
     {
         "name": "The Fool",
@@ -441,3 +452,80 @@ def get_all_cards():
         all_cards.extend(cards)
 
     return all_cards
+
+
+# Stable card ids follow the get_all_cards() order: Major Arcana 0-21,
+# then Wands, Cups, Swords and Pentacles with 14 cards each.
+_ALL_CARDS: List[Dict[str, Any]] = get_all_cards()
+_CARD_SUITS: List[Optional[str]] = [None] * len(MAJOR_ARCANA) + [
+    suit for suit, cards in MINOR_ARCANA.items() for _ in cards
+]
+_CARD_IDS: Dict[str, int] = {
+    card["name"]: card_id for card_id, card in enumerate(_ALL_CARDS)
+}
+
+# Content hash of the card table; changes whenever names, order or meanings do,
+# so caches and stored readings can tell which deck they were built against.
+DECK_VERSION = hashlib.sha256(
+    json.dumps(_ALL_CARDS, sort_keys=True).encode()
+).hexdigest()[:12]
+
+
+def get_card_id(name: str) -> int:
+    """
+    Return the stable numeric id (0-77) of a card.
+
+    Args:
+        name: Exact card name (e.g., "The Fool", "Ace of Cups")
+
+    Returns:
+        Integer card id in get_all_cards() order
+    """
+    try:
+        return _CARD_IDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown card: {name}") from None
+
+
+def get_card_by_id(card_id: int) -> Dict[str, Any]:
+    """
+    Return the card definition for a numeric card id.
+
+    Args:
+        card_id: Card id between 0 and 77
+
+    Returns:
+        Card dictionary as stored in the deck
+    """
+    if card_id < 0 or card_id >= DECK_SIZE:
+        raise ValueError("Card id must be between 0 and 77")
+    return _ALL_CARDS[card_id]
+
+
+def get_card_suit(card_id: int) -> Optional[str]:
+    """
+    Return the suit of a card by id.
+
+    Args:
+        card_id: Card id between 0 and 77
+
+    Returns:
+        Suit name for Minor Arcana cards, None for Major Arcana
+    """
+    if card_id < 0 or card_id >= DECK_SIZE:
+        raise ValueError("Card id must be between 0 and 77")
+    return _CARD_SUITS[card_id]
+
+
+# Card groups used by weight profiles, constraints and spread positions;
+# they partition the deck
+MAJOR_GROUP = "Major Arcana"
+CARD_GROUPS = (MAJOR_GROUP,) + tuple(MINOR_ARCANA)
+GROUP_CARD_IDS: Dict[str, Tuple[int, ...]] = {
+    group: tuple(
+        card_id
+        for card_id in range(DECK_SIZE)
+        if (_CARD_SUITS[card_id] or MAJOR_GROUP) == group
+    )
+    for group in CARD_GROUPS
+}
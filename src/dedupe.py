@@ -0,0 +1,160 @@
+"""
+Duplicate detection for bulk-generated readings.
+
+A reading's fingerprint is its ordered sequence of (card, orientation)
+codes. ReadingFilter remembers fingerprints in an exact bitset when the
+space of possible readings is small enough to enumerate (single cards and
+three-card spreads), and otherwise in a Bloom filter sized for a capacity
+and false-positive rate. A Bloom filter never misses a duplicate; a false
+positive only discards a reading that was in fact new.
+
+Requires NumPy (``pip install tarot-reader[numpy]``).
+"""
+
+import math
+import numpy as np
+
+from .deck import DECK_SIZE
+
+# Readings of up to this many possible fingerprints use an exact bitset
+_EXACT_LIMIT = 1 << 26
+_CODES = 2 * DECK_SIZE
+
+# Fixed odd multipliers for the two 64-bit fingerprint hashes
+_MULTIPLIERS = np.random.default_rng(0x7A2070).integers(
+    1, 2**63, size=(2, DECK_SIZE), dtype=np.uint64
+) | np.uint64(1)
+
+
+def reading_space(num_cards: int) -> int:
+    """Number of distinct ordered readings of num_cards cards."""
+    return math.perm(DECK_SIZE, num_cards) * 2**num_cards
+
+
+def _codes(card_ids: np.ndarray, is_reversed: np.ndarray) -> np.ndarray:
+    return card_ids.astype(np.uint64) * np.uint64(2) + is_reversed.astype(np.uint64)
+
+
+def _mix(z: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer."""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _test_bits(bits: np.ndarray, index: np.ndarray) -> np.ndarray:
+    return ((bits[index >> np.uint64(3)] >> (index & np.uint64(7))) & 1).astype(bool)
+
+
+def _set_bits(bits: np.ndarray, index: np.ndarray):
+    shifts = (index & np.uint64(7)).astype(np.uint8)
+    np.bitwise_or.at(bits, index >> np.uint64(3), np.left_shift(1, shifts))
+
+
+def _first_occurrences(keys: np.ndarray) -> np.ndarray:
+    """Mask of rows whose key did not appear in an earlier row."""
+    _, first = np.unique(keys, axis=0, return_index=True)
+    mask = np.zeros(len(keys), dtype=bool)
+    mask[first] = True
+    return mask
+
+
+class BloomFilter:
+    """
+    Bloom filter over pairs of 64-bit hashes, using double hashing.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 1e-6):
+        """
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: False-positive rate at capacity (0 < error_rate < 1)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_bits = max(64, -(-bits // 64) * 64)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = np.zeros(self.num_bits // 8, dtype=np.uint8)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the bit array."""
+        return self._bits.nbytes
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        steps = np.arange(self.num_hashes, dtype=np.uint64)
+        return (hashes[:, :1] + steps * (hashes[:, 1:] | np.uint64(1))) % np.uint64(
+            self.num_bits
+        )
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Whether each (n, 2) hash pair may have been added."""
+        return np.all(_test_bits(self._bits, self._positions(hashes)), axis=1)
+
+    def add(self, hashes: np.ndarray):
+        """Add (n, 2) hash pairs."""
+        _set_bits(self._bits, self._positions(hashes).ravel())
+
+
+class ReadingFilter:
+    """
+    Remembers readings of one size and reports which are new.
+    """
+
+    def __init__(self, num_cards: int, capacity: int, error_rate: float = 1e-6):
+        """
+        Args:
+            num_cards: Cards per reading (1-78)
+            capacity: Expected number of distinct readings (sizes the Bloom
+                      filter; ignored for exact bitsets)
+            error_rate: Bloom filter false-positive rate
+        """
+        if num_cards < 1 or num_cards > DECK_SIZE:
+            raise ValueError("Number of cards must be between 1 and 78")
+        self.num_cards = num_cards
+        self.exact = _CODES**num_cards <= _EXACT_LIMIT
+        if self.exact:
+            self._seen = np.zeros(-(-(_CODES**num_cards) // 8), dtype=np.uint8)
+            self._radix = np.uint64(_CODES) ** np.arange(num_cards, dtype=np.uint64)
+        else:
+            self._bloom = BloomFilter(capacity, error_rate)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the filter."""
+        return self._seen.nbytes if self.exact else self._bloom.nbytes
+
+    def add_new(self, card_ids: np.ndarray, is_reversed: np.ndarray) -> np.ndarray:
+        """
+        Add a batch of readings and return the mask of those not seen before.
+
+        Repeats within the batch count as duplicates after their first row.
+
+        Args:
+            card_ids: Array of card ids of shape (readings, num_cards)
+            is_reversed: Array of orientations of the same shape
+
+        Returns:
+            Boolean mask of readings that were new
+        """
+        codes = _codes(card_ids, is_reversed)
+        if self.exact:
+            index = (codes * self._radix).sum(axis=1)
+            new = ~_test_bits(self._seen, index) & _first_occurrences(index)
+            _set_bits(self._seen, index[new])
+            return new
+
+        hashes = np.stack(
+            [
+                _mix((codes * multipliers).sum(axis=1))
+                for multipliers in _MULTIPLIERS[:, : self.num_cards]
+            ],
+            axis=1,
+        )
+        new = ~self._bloom.contains(hashes) & _first_occurrences(hashes)
+        self._bloom.add(hashes[new])
+        return new
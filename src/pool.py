@@ -0,0 +1,144 @@
+"""
+Pools of pre-drawn readings.
+
+A ReadingPool keeps unseeded draws of a fixed size in a ring buffer of card
+ids and orientations. A background refiller tops it up in vectorized batches
+with draw_batch(), so serving a reading is a pop plus a lookup into prebuilt
+card dicts instead of a fresh shuffle.
+
+The buffer is single-producer, single-consumer: pop() from one thread and
+refill() from one other thread need no lock, because each side only
+advances its own counter after finishing with the slots it covers.
+
+Requires NumPy (``pip install tarot-reader[numpy]``).
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .batch import RandomSource, _generator, decode_batch, draw_batch
+from .deck import DECK_SIZE
+
+
+class ReadingPool:
+    """
+    Ring buffer of pre-drawn, unseeded readings of one size.
+    """
+
+    def __init__(
+        self,
+        num_cards: int,
+        size: int = 4096,
+        low_water: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        rng: RandomSource = None,
+    ):
+        """
+        Args:
+            num_cards: Cards per reading (1-78)
+            size: Maximum number of readings held
+            low_water: Refill when this many or fewer readings remain
+                       (default: a quarter of size)
+            batch_size: Readings drawn per refill batch (default: a quarter
+                        of size)
+            rng: Optional NumPy Generator or integer seed
+        """
+        if num_cards < 1 or num_cards > DECK_SIZE:
+            raise ValueError("Number of cards must be between 1 and 78")
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        low_water = size // 4 if low_water is None else low_water
+        batch_size = max(size // 4, 1) if batch_size is None else batch_size
+        if low_water < 0 or low_water >= size:
+            raise ValueError("low_water must be between 0 and size - 1")
+        if batch_size < 1 or batch_size > size:
+            raise ValueError("batch_size must be between 1 and size")
+
+        self.num_cards = num_cards
+        self.size = size
+        self.low_water = low_water
+        self.batch_size = batch_size
+        self.hits = 0
+        self.exhaustions = 0
+        self.refills = 0
+        self._ids = np.empty((size, num_cards), dtype=np.uint8)
+        self._reversed = np.empty((size, num_cards), dtype=bool)
+        # Monotonic counters; slot = counter % size
+        self._head = 0
+        self._tail = 0
+        self._rng = _generator(rng)
+
+    @property
+    def available(self) -> int:
+        """Number of readings ready to pop."""
+        return self._tail - self._head
+
+    @property
+    def needs_refill(self) -> bool:
+        """Whether the pool is at or below its low-water mark."""
+        return self.available <= self.low_water
+
+    def refill(self) -> int:
+        """
+        Draw one batch into free slots (producer side).
+
+        Returns:
+            Number of readings added
+        """
+        count = min(self.batch_size, self.size - self.available)
+        if count <= 0:
+            return 0
+        card_ids, is_reversed = draw_batch(self.num_cards, count, rng=self._rng)
+
+        start = self._tail % self.size
+        first = min(count, self.size - start)
+        self._ids[start : start + first] = card_ids[:first]
+        self._reversed[start : start + first] = is_reversed[:first]
+        self._ids[: count - first] = card_ids[first:]
+        self._reversed[: count - first] = is_reversed[first:]
+
+        self._tail += count
+        self.refills += 1
+        return count
+
+    def fill(self) -> int:
+        """Refill until the pool is full; returns readings added."""
+        added = 0
+        while True:
+            count = self.refill()
+            if not count:
+                return added
+            added += count
+
+    def pop(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Take one reading (consumer side).
+
+        Returns:
+            List of card dictionaries with name, meaning, and orientation, or
+            None when the pool is exhausted
+        """
+        if self._tail == self._head:
+            self.exhaustions += 1
+            return None
+        slot = self._head % self.size
+        cards = decode_batch(
+            self._ids[slot : slot + 1], self._reversed[slot : slot + 1]
+        )[0]
+        self._head += 1
+        self.hits += 1
+        return cards
+
+    def stats(self) -> Dict[str, int]:
+        """Pool settings and counters."""
+        return {
+            "num_cards": self.num_cards,
+            "size": self.size,
+            "low_water": self.low_water,
+            "batch_size": self.batch_size,
+            "available": self.available,
+            "hits": self.hits,
+            "exhaustions": self.exhaustions,
+            "refills": self.refills,
+        }
@@ -0,0 +1,231 @@
+"""
+Probability engine for spread statistics.
+
+Answers questions such as "what is the chance of three or more Major Arcana
+in a Celtic Cross" or "how often does The Tower land reversed in Final
+Outcome". Uniform spreads are solved exactly from the hypergeometric
+distribution and positional symmetry; weighted spreads (or method
+"simulation") fall back to a vectorized Monte Carlo estimate with a
+standard error and 95% interval. Results are cached per query and deck
+version.
+
+The exact path is pure Python; simulation requires NumPy.
+"""
+
+import math
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .core import _spread_positions
+from .deck import CARD_GROUPS, DECK_SIZE, DECK_VERSION, GROUP_CARD_IDS, get_card_id
+
+COMPARISONS = ("at_least", "at_most", "exactly")
+METHODS = ("auto", "exact", "simulation")
+
+# Maximum number of cached probability results
+_PROBABILITY_CACHE_SIZE = 1024
+
+# Spreads simulated per vectorized batch, bounding peak memory
+_SIMULATION_CHUNK = 25_000
+
+
+def _selected_ids(card: Optional[str], group: Optional[str]) -> Tuple[int, ...]:
+    """Return the card ids matched by a card name or group (all cards if neither)."""
+    if card and group:
+        raise ValueError("Specify either a card or a group, not both")
+    if card:
+        return (get_card_id(card),)
+    if group:
+        if group not in GROUP_CARD_IDS:
+            raise ValueError(
+                f"Unknown group '{group}'. Valid groups: {', '.join(CARD_GROUPS)}"
+            )
+        return GROUP_CARD_IDS[group]
+    return tuple(range(DECK_SIZE))
+
+
+def _position_index(spread: Any, position: Union[str, int]) -> int:
+    """Resolve a position name or 1-based number to a 0-based index."""
+    num_cards, positions = _spread_positions(spread)
+    if isinstance(position, int) or str(position).isdigit():
+        index = int(position) - 1
+    elif positions and position in positions:
+        index = positions.index(position)
+    else:
+        raise ValueError(f"Unknown position '{position}' for spread '{spread}'")
+    if index < 0 or index >= num_cards:
+        raise ValueError(f"Position must be between 1 and {num_cards}")
+    return index
+
+
+def _compare(values: Any, count: int, comparison: str) -> Any:
+    if comparison == "at_least":
+        return values >= count
+    if comparison == "at_most":
+        return values <= count
+    return values == count
+
+
+def _exact_count_distribution(
+    num_cards: int, selected: int, orientation: Optional[str]
+) -> Dict[int, float]:
+    """
+    Distribution of matching cards in a uniform spread.
+
+    The number of selected cards drawn is hypergeometric; with an orientation
+    filter each of them matches independently with probability 1/2.
+    """
+    total = math.comb(DECK_SIZE, num_cards)
+    drawn = {
+        x: math.comb(selected, x)
+        * math.comb(DECK_SIZE - selected, num_cards - x)
+        / total
+        for x in range(min(selected, num_cards) + 1)
+    }
+    if orientation is None:
+        return drawn
+
+    matched: Dict[int, float] = {}
+    for x, p in drawn.items():
+        for y in range(x + 1):
+            matched[y] = matched.get(y, 0.0) + p * math.comb(x, y) / 2**x
+    return matched
+
+
+@lru_cache(maxsize=_PROBABILITY_CACHE_SIZE)
+def _compute(
+    spread: Any,
+    selected: Tuple[int, ...],
+    position: Optional[int],
+    orientation: Optional[str],
+    count: int,
+    comparison: str,
+    weights: Tuple[Tuple[str, float], ...],
+    method: str,
+    trials: int,
+    deck_version: str,
+) -> Dict[str, Any]:
+    num_cards, _ = _spread_positions(spread)
+    orientation_share = 0.5 if orientation else 1.0
+
+    if method != "simulation" and not weights:
+        if position is not None:
+            probability = len(selected) / DECK_SIZE * orientation_share
+        else:
+            distribution = _exact_count_distribution(
+                num_cards, len(selected), orientation
+            )
+            probability = sum(
+                p for y, p in distribution.items() if _compare(y, count, comparison)
+            )
+        return {
+            "probability": probability,
+            "method": "exact",
+            "standard_error": 0.0,
+            "confidence_interval": (probability, probability),
+            "trials": None,
+            "deck_version": deck_version,
+        }
+
+    if method == "exact":
+        raise ValueError(
+            "Exact probabilities are only available for unweighted spreads"
+        )
+
+    import numpy as np
+
+    from .batch import _wilson_interval, draw_batch
+
+    mask = np.zeros(DECK_SIZE, dtype=bool)
+    mask[list(selected)] = True
+    rng = np.random.default_rng()
+    hits = 0
+    for start in range(0, trials, _SIMULATION_CHUNK):
+        size = min(_SIMULATION_CHUNK, trials - start)
+        card_ids, is_reversed = draw_batch(num_cards, size, dict(weights), rng)
+        matches = mask[card_ids]
+        if orientation == "reversed":
+            matches &= is_reversed
+        elif orientation == "upright":
+            matches &= ~is_reversed
+
+        if position is not None:
+            hits += int(matches[:, position].sum())
+        else:
+            hits += int(_compare(matches.sum(axis=1), count, comparison).sum())
+
+    probability = hits / trials
+    return {
+        "probability": probability,
+        "method": "simulation",
+        "standard_error": math.sqrt(probability * (1 - probability) / trials),
+        "confidence_interval": _wilson_interval(hits, trials),
+        "trials": trials,
+        "deck_version": deck_version,
+    }
+
+
+def spread_probability(
+    spread: Any = "celtic",
+    card: Optional[str] = None,
+    group: Optional[str] = None,
+    position: Optional[Union[str, int]] = None,
+    orientation: Optional[str] = None,
+    count: int = 1,
+    comparison: str = "at_least",
+    weights: Optional[Dict[str, float]] = None,
+    method: str = "auto",
+    trials: int = 100_000,
+) -> Dict[str, Any]:
+    """
+    Probability of an event in a spread.
+
+    With a position the event is "the card at that position matches";
+    otherwise it is "the number of matching cards in the spread compares to
+    count". A card matches when it is the given card or belongs to the given
+    group (any card if neither) and has the given orientation (if any).
+
+    Args:
+        spread: "single", "three", "celtic" or a number of cards (1-78)
+        card: Optional card name, e.g. "The Tower"
+        group: Optional group, e.g. "Major Arcana" or "Cups"
+        position: Optional position name ("Final Outcome") or 1-based number
+        orientation: Optional "upright" or "reversed"
+        count: Number of matching cards for count events
+        comparison: "at_least", "at_most" or "exactly"
+        weights: Optional weight profile; forces simulation
+        method: "auto", "exact" or "simulation"
+        trials: Number of simulated spreads when simulating
+
+    Returns:
+        Dictionary with probability, method, standard_error,
+        confidence_interval, trials and deck_version
+    """
+    _spread_positions(spread)
+    if comparison not in COMPARISONS:
+        raise ValueError(f"comparison must be one of {', '.join(COMPARISONS)}")
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {', '.join(METHODS)}")
+    if orientation is not None:
+        orientation = orientation.lower()
+        if orientation not in ("upright", "reversed"):
+            raise ValueError("orientation must be 'upright' or 'reversed'")
+    if count < 0:
+        raise ValueError("count must be >= 0")
+    if trials < 1:
+        raise ValueError("trials must be at least 1")
+
+    index = None if position is None else _position_index(spread, position)
+    result = _compute(
+        spread,
+        _selected_ids(card, group),
+        index,
+        orientation,
+        count,
+        comparison,
+        tuple(sorted((weights or {}).items())),
+        method,
+        trials,
+        DECK_VERSION,
+    )
+    return dict(result)
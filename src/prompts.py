@@ -0,0 +1,292 @@
+"""
+Batch LLM prompt building with token-budget packing.
+
+PromptBuilder renders readings with any registered renderer (see
+text_formatter.get_renderer) and packs as many as fit a token budget into
+each prompt. Token counts are estimated without tokenizing each reading:
+the count of every card fragment is computed once per builder, and the
+count of a spread's static text (headers, position labels) once per spread,
+so a reading's estimate is a few lookups and a sum.
+
+The default estimate_tokens() is a conservative heuristic for English text;
+pass a real tokenizer's counter (e.g. ``lambda s: len(enc.encode(s))``) for
+exact per-fragment counts. Prompts are yielded one at a time, so prompt sets
+of any size stream in constant memory.
+"""
+
+import json
+import re
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from .core import _build_card_result, _reading_cards, _reading_spread
+from .deck import get_all_cards
+from .text_formatter import _is_binary, get_renderer
+
+DEFAULT_TEMPLATE = "Interpret each of the following tarot readings.\n\n{readings}"
+DEFAULT_ITEM = "Reading {index}:\n{reading}"
+
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d{1,3}|\s+|.")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a text.
+
+    Letter runs count one token per four letters, digits one per group of
+    three, whitespace only when it contains a line break, ASCII punctuation
+    one each and other characters one per two UTF-8 bytes. This errs on the
+    high side for English, so packed prompts stay within budget.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count
+    """
+    tokens = 0
+    for piece in _TOKEN_PATTERN.findall(text):
+        first = piece[0]
+        if first.isalpha() and first.isascii():
+            tokens += (len(piece) + 3) // 4
+        elif first.isspace():
+            tokens += "\n" in piece
+        elif first.isascii():
+            tokens += 1
+        else:
+            tokens += max(1, len(piece.encode()) // 2)
+    return tokens
+
+
+class Prompt(NamedTuple):
+    """One packed prompt."""
+
+    text: str
+    tokens: int  # estimated
+    readings: int  # number of readings packed into the prompt
+    start: int  # index of the first packed reading in the input
+
+
+class PromptBuilder:
+    """
+    Pack rendered readings into prompts that fit a token budget.
+    """
+
+    def __init__(
+        self,
+        template: str = DEFAULT_TEMPLATE,
+        item: str = DEFAULT_ITEM,
+        fmt: str = "markdown",
+        max_tokens: int = 4096,
+        max_readings: Optional[int] = None,
+        separator: str = "\n\n",
+        token_counter: Callable[[str], int] = estimate_tokens,
+    ):
+        """
+        Args:
+            template: Prompt text with a "{readings}" placeholder
+            item: Text of each reading, with a "{reading}" placeholder and an
+                  optional "{index}" (1-based within the prompt)
+            fmt: Renderer used for readings (see list_renderers())
+            max_tokens: Token budget of each prompt
+            max_readings: Optional limit on readings per prompt
+            separator: Text between items
+            token_counter: Function returning the token count of a text
+        """
+        if template.count("{readings}") != 1:
+            raise ValueError('template must contain "{readings}" exactly once')
+        if item.count("{reading}") != 1:
+            raise ValueError('item must contain "{reading}" exactly once')
+        if max_readings is not None and max_readings < 1:
+            raise ValueError("max_readings must be at least 1")
+
+        self.renderer = get_renderer(fmt)
+        self.max_tokens = max_tokens
+        self.max_readings = max_readings
+        self.separator = separator
+        self._count = token_counter
+        self._head, self._tail = template.split("{readings}")
+        self._item_head, self._item_tail = item.split("{reading}")
+        self._indexed = "{index}" in item
+
+        self._frame_tokens = token_counter(self._head) + token_counter(self._tail)
+        self._item_tokens = token_counter(
+            item.replace("{reading}", "").replace("{index}", "")
+        )
+        self._separator_tokens = token_counter(separator)
+        if self._frame_tokens + self._item_tokens >= max_tokens:
+            raise ValueError("max_tokens leaves no room for readings")
+
+        # Token estimate of every card fragment, and of each spread's static text
+        self.card_tokens: Dict[Tuple[str, str, str], int] = {}
+        for card in get_all_cards():
+            for is_reversed in (False, True):
+                result = _build_card_result(card, is_reversed)
+                key = (result["name"], result["orientation"], result["meaning"])
+                self.card_tokens[key] = token_counter(self._card_text(result))
+        self._static_tokens: Dict[Any, int] = {}
+
+    def _card_text(self, card: Dict[str, Any]) -> str:
+        fragment = self.renderer.card(card)
+        # Binary renderers such as "jsonl" cache UTF-8 fragments
+        return fragment.decode() if isinstance(fragment, bytes) else fragment
+
+    def _cards_tokens(self, reading: Any) -> int:
+        total = 0
+        for card in _reading_cards(reading):
+            tokens = self.card_tokens.get(
+                (card["name"], card["orientation"], card["meaning"])
+            )
+            if tokens is None:
+                tokens = self._count(self._card_text(card))
+            total += tokens
+        return total
+
+    def _measure(self, reading: Any, spread: Any) -> Tuple[str, int]:
+        """Render a reading and estimate its tokens from cached counts."""
+        text = self.renderer.render(reading, spread)
+        cards = self._cards_tokens(reading)
+        static = self._static_tokens.get(spread)
+        if static is None:
+            static = self._static_tokens[spread] = max(0, self._count(text) - cards)
+        return text, static + cards
+
+    def reading_tokens(self, reading: Any, spread: Any = None) -> int:
+        """
+        Estimated tokens of one rendered reading, without item text.
+
+        Args:
+            reading: A reading as returned by the spread functions
+            spread: "single", a spread name or a card count (inferred from
+                    the reading if omitted)
+        """
+        spread = _reading_spread(reading) if spread is None else spread
+        return self._measure(reading, spread)[1]
+
+    def _index_tokens(self, index: int) -> int:
+        return (len(str(index)) + 2) // 3 if self._indexed else 0
+
+    def _item(self, index: int, text: str) -> str:
+        if self._indexed:
+            return (
+                self._item_head.replace("{index}", str(index))
+                + text
+                + self._item_tail.replace("{index}", str(index))
+            )
+        return self._item_head + text + self._item_tail
+
+    def build(self, readings: Iterable[Any], spread: Any = None) -> Iterator[Prompt]:
+        """
+        Pack readings into prompts, in order.
+
+        Args:
+            readings: Iterable of readings, e.g. a generator
+            spread: Spread of every reading (inferred per reading if omitted)
+
+        Returns:
+            Iterator of Prompt, each within max_tokens by estimate
+
+        Raises:
+            ValueError: If a single reading does not fit the budget
+        """
+        items: List[str] = []
+        tokens = self._frame_tokens
+        start = 0
+        for position, reading in enumerate(readings):
+            reading_spread = _reading_spread(reading) if spread is None else spread
+            text, cost = self._measure(reading, reading_spread)
+            cost += self._item_tokens
+
+            if items and (
+                len(items) == self.max_readings
+                or tokens
+                + self._separator_tokens
+                + cost
+                + self._index_tokens(len(items) + 1)
+                > self.max_tokens
+            ):
+                yield self._prompt(items, tokens, start)
+                items = []
+                tokens = self._frame_tokens
+                start = position
+
+            cost += self._index_tokens(len(items) + 1)
+            if items:
+                tokens += self._separator_tokens
+            elif tokens + cost > self.max_tokens:
+                raise ValueError(
+                    f"Reading {position} needs about {cost} tokens, more than "
+                    f"the budget of {self.max_tokens - self._frame_tokens}"
+                )
+            items.append(self._item(len(items) + 1, text))
+            tokens += cost
+        if items:
+            yield self._prompt(items, tokens, start)
+
+    def _prompt(self, items: List[str], tokens: int, start: int) -> Prompt:
+        text = self._head + self.separator.join(items) + self._tail
+        return Prompt(text, tokens, len(items), start)
+
+    def write_to(
+        self,
+        stream: IO[Any],
+        readings: Iterable[Any],
+        spread: Any = None,
+        chunk_size: int = 1 << 16,
+        flush: bool = False,
+    ) -> int:
+        """
+        Stream prompts as JSON Lines of {"prompt", "tokens", "readings", "start"}.
+
+        Args:
+            stream: Writable text or binary file-like object
+            readings: Iterable of readings
+            spread: Spread of every reading (inferred per reading if omitted)
+            chunk_size: Characters collected before each write
+            flush: Flush the stream after every chunk
+
+        Returns:
+            Number of prompts written
+        """
+        binary = _is_binary(stream)
+        pieces: List[str] = []
+        size = 0
+        count = 0
+        for prompt in self.build(readings, spread):
+            line = (
+                json.dumps(
+                    {
+                        "prompt": prompt.text,
+                        "tokens": prompt.tokens,
+                        "readings": prompt.readings,
+                        "start": prompt.start,
+                    }
+                )
+                + "\n"
+            )
+            pieces.append(line)
+            size += len(line)
+            count += 1
+            if size >= chunk_size:
+                data = "".join(pieces)
+                stream.write(data.encode() if binary else data)
+                if flush:
+                    stream.flush()
+                pieces.clear()
+                size = 0
+        if pieces:
+            data = "".join(pieces)
+            stream.write(data.encode() if binary else data)
+            if flush:
+                stream.flush()
+        return count
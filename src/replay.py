@@ -0,0 +1,374 @@
+"""
+Append-only replay log of served readings.
+
+Each reading is logged as a fixed 15-byte record header (timestamp, derived
+seed, spread id, flags, card count) followed by one byte per card: the card
+id with the reversed flag in the high bit. Readings are queued on the request
+path and encoded, written in large chunks and fsynced (at most once per sync
+interval) by flush(). Files are split into segments; each segment starts
+with a small JSON header that holds the deck version and the spread-name
+table the spread ids refer to.
+
+Readings drawn with draw_from_seed() are logged with their seed and can be
+regenerated and verified later:
+
+    python -m src.replay verify LOG_DIR
+    python -m src.replay show LOG_DIR --limit 10
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .core import _build_card_result, _card_names, _reading_cards, draw_from_seed
+from .deck import CARD_ID_MASK, DECK_VERSION, REVERSED_BIT, get_all_cards
+from .spreads import get_spread, list_spreads
+
+_MAGIC = b"TAROTLOG"
+_FORMAT_VERSION = 1
+_SEGMENT_SUFFIX = ".tlog"
+# timestamp (µs), seed, spread id, flags, number of cards
+_RECORD = struct.Struct("<QIBBB")
+_SEEDED = 0x01
+_COUNT_SPREAD = 0xFF  # spread id of plain card counts
+_MAX_SPREADS = 255
+
+# Encoded byte of every (card name, orientation) pair
+_CARD_BYTES = {
+    (card["name"], orientation): card_id | (REVERSED_BIT if reversed_ else 0)
+    for card_id, card in enumerate(get_all_cards())
+    for orientation, reversed_ in (("Upright", False), ("Reversed", True))
+}
+
+
+def _encode_cards(reading: Any) -> bytes:
+    return bytes(
+        [
+            _CARD_BYTES[card["name"], card["orientation"]]
+            for card in _reading_cards(reading)
+        ]
+    )
+
+
+class LogEntry(NamedTuple):
+    """One logged reading."""
+
+    timestamp: float
+    spread: Union[str, int]
+    seed: Optional[int]
+    cards: bytes
+    deck_version: str
+
+    def reading(self) -> Any:
+        """Decode the logged cards into the shape of the spread's reading."""
+        all_cards = get_all_cards()
+        cards = [
+            _build_card_result(
+                all_cards[value & CARD_ID_MASK], bool(value & REVERSED_BIT)
+            )
+            for value in self.cards
+        ]
+
+        if self.spread == "single":
+            return cards[0]
+        if isinstance(self.spread, int):
+            return cards
+        return dict(zip(get_spread(self.spread).positions, cards))
+
+
+class ReplayLog:
+    """
+    Segmented, append-only writer of served readings.
+
+    record() only queues a reference to the reading, so it costs well under
+    a microsecond; encoding, writing and fsync happen in flush(), which a
+    background task should call periodically. The queue is flushed inline
+    only if it reaches max_pending. Safe to share between threads. Logged
+    readings must not be modified before they are flushed.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        segment_bytes: int = 64 * 1024 * 1024,
+        max_pending: int = 65536,
+        sync_interval: float = 1.0,
+    ):
+        """
+        Args:
+            directory: Directory for segment files (created if missing)
+            segment_bytes: Size after which a new segment is started
+            max_pending: Queued readings that force an inline flush
+            sync_interval: Minimum seconds between fsyncs
+        """
+        if segment_bytes < 1024 or max_pending < 1 or sync_interval < 0:
+            raise ValueError("Invalid replay log settings")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.max_pending = max_pending
+        self.sync_interval = sync_interval
+        self.records = 0
+        self._pending: Deque[Tuple[int, Union[str, int], Optional[int], Any]] = deque()
+        self._lock = threading.Lock()
+        self._last_sync = time.monotonic()
+        self._file: Any = None
+        self._open_segment()
+
+    def _open_segment(self):
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+
+        existing = sorted(self.directory.glob("*" + _SEGMENT_SUFFIX))
+        index = int(existing[-1].stem) + 1 if existing else 0
+        spreads = list_spreads()[:_MAX_SPREADS]
+        self._spread_ids = {name: i for i, name in enumerate(spreads)}
+
+        header = json.dumps(
+            {
+                "format": _FORMAT_VERSION,
+                "deck_version": DECK_VERSION,
+                "spreads": spreads,
+                "created": time.time(),
+            }
+        ).encode()
+        self.path = self.directory / f"{index:08d}{_SEGMENT_SUFFIX}"
+        self._file = open(self.path, "ab")
+        self._file.write(_MAGIC + struct.pack("<I", len(header)) + header)
+        self._size = self._file.tell()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def record(self, spread: Union[str, int], reading: Any, seed: Optional[int] = None):
+        """
+        Queue one reading for logging.
+
+        Args:
+            spread: "single", a registered spread name or a number of cards
+            reading: The reading as returned to the user
+            seed: Integer seed the reading was drawn from with
+                  draw_from_seed(), if any; enables replay
+
+        Raises:
+            ValueError: If the log is closed, the spread is not one of the
+                        first 255 registered spreads, or seed does not fit
+                        the log's 32-bit seed field
+        """
+        if self._file is None:
+            raise ValueError("Replay log is closed")
+        if (
+            not isinstance(spread, int)
+            and spread not in self._spread_ids
+            and spread not in list_spreads()[:_MAX_SPREADS]
+        ):
+            raise ValueError(
+                f"Spread '{spread}' is not among the first {_MAX_SPREADS} "
+                "registered spreads and cannot be logged"
+            )
+        if seed is not None and not 0 <= seed < 2**32:
+            raise ValueError("Replay log seeds must be between 0 and 2**32 - 1")
+        self._pending.append((time.time_ns() // 1000, spread, seed, reading))
+        if len(self._pending) >= self.max_pending:
+            self.flush()
+
+    def flush(self, sync: bool = False):
+        """
+        Encode and write queued readings; fsync if due or if sync is True.
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            buffer = bytearray()
+            try:
+                while self._pending:
+                    timestamp, spread, seed, reading = self._pending.popleft()
+                    if isinstance(spread, int):
+                        spread_id = _COUNT_SPREAD
+                    elif spread in self._spread_ids:
+                        spread_id = self._spread_ids[spread]
+                    else:
+                        # Spread registered after this segment began
+                        self._file.write(buffer)
+                        buffer.clear()
+                        self._open_segment()
+                        spread_id = self._spread_ids[spread]
+
+                    cards = _encode_cards(reading)
+                    buffer += _RECORD.pack(
+                        timestamp,
+                        seed or 0,
+                        spread_id,
+                        _SEEDED if seed is not None else 0,
+                        len(cards),
+                    )
+                    buffer += cards
+                    self.records += 1
+            finally:
+                # A reading that fails to encode is dropped, not the ones
+                # encoded before it
+                self._file.write(buffer)
+            self._size = self._file.tell()
+            if sync or time.monotonic() - self._last_sync >= self.sync_interval:
+                self._sync()
+            if self._size >= self.segment_bytes:
+                self._open_segment()
+
+    def close(self):
+        """Flush and fsync everything, then close the segment."""
+        self.flush(sync=True)
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "ReplayLog":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+
+def _read_segment(path: Path) -> Iterator[LogEntry]:
+    data = path.read_bytes()
+    if data[: len(_MAGIC)] != _MAGIC:
+        raise ValueError(f"{path} is not a replay log segment")
+    (header_size,) = struct.unpack_from("<I", data, len(_MAGIC))
+    offset = len(_MAGIC) + 4
+    header = json.loads(data[offset : offset + header_size])
+    spreads = header["spreads"]
+    offset += header_size
+
+    while offset + _RECORD.size <= len(data):
+        timestamp, seed, spread_id, flags, num_cards = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        if offset + num_cards > len(data):
+            break  # torn write at the end of a crashed segment
+        yield LogEntry(
+            timestamp=timestamp / 1e6,
+            spread=num_cards if spread_id == _COUNT_SPREAD else spreads[spread_id],
+            seed=seed if flags & _SEEDED else None,
+            cards=data[offset : offset + num_cards],
+            deck_version=header["deck_version"],
+        )
+        offset += num_cards
+
+
+def read_log(path: Union[str, Path]) -> Iterator[LogEntry]:
+    """
+    Iterate over logged readings in order.
+
+    Args:
+        path: A segment file or a log directory
+
+    Returns:
+        Iterator of LogEntry
+    """
+    path = Path(path)
+    segments = sorted(path.glob("*" + _SEGMENT_SUFFIX)) if path.is_dir() else [path]
+    for segment in segments:
+        yield from _read_segment(segment)
+
+
+def replay(entry: LogEntry) -> Any:
+    """
+    Regenerate a logged reading from its seed.
+
+    Raises:
+        ValueError: If the entry has no seed or was logged for another deck
+    """
+    if entry.seed is None:
+        raise ValueError("Reading was not drawn from a seed and cannot be replayed")
+    if entry.deck_version != DECK_VERSION:
+        raise ValueError(
+            f"Reading was logged for deck version {entry.deck_version}, "
+            f"current version is {DECK_VERSION}"
+        )
+    return draw_from_seed(entry.spread, entry.seed)
+
+
+def verify_log(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Regenerate every seeded reading and compare it with the logged cards.
+
+    Args:
+        path: A segment file or a log directory
+
+    Returns:
+        Dictionary with counts of records, verified, unseeded and stale
+        (other deck version) entries, and the indices of mismatches
+    """
+    summary: Dict[str, Any] = {
+        "records": 0,
+        "verified": 0,
+        "unseeded": 0,
+        "stale": 0,
+        "mismatches": [],
+    }
+    for index, entry in enumerate(read_log(path)):
+        summary["records"] += 1
+        if entry.seed is None:
+            summary["unseeded"] += 1
+        elif entry.deck_version != DECK_VERSION:
+            summary["stale"] += 1
+        elif _encode_cards(replay(entry)) == entry.cards:
+            summary["verified"] += 1
+        else:
+            summary["mismatches"].append(index)
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: show or verify a replay log."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.replay", description="Inspect tarot reading replay logs"
+    )
+    parser.add_argument("command", choices=["show", "verify"])
+    parser.add_argument("path", help="Log directory or segment file")
+    parser.add_argument("--limit", type=int, default=None, help="Entries to show")
+    args = parser.parse_args(argv)
+
+    if args.command == "verify":
+        summary = verify_log(args.path)
+        print(json.dumps(summary))
+        return 1 if summary["mismatches"] else 0
+
+    for index, entry in enumerate(read_log(args.path)):
+        if args.limit is not None and index >= args.limit:
+            break
+        print(
+            json.dumps(
+                {
+                    "timestamp": entry.timestamp,
+                    "spread": entry.spread,
+                    "seed": entry.seed,
+                    "cards": _card_names(entry.reading()),
+                }
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
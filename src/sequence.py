@@ -0,0 +1,194 @@
+"""
+Markov-chain card sequences for storytelling prompts.
+
+A CardSequencer walks a 78x78 transition matrix over card ids. Every row is
+compiled once into a Vose alias table, so each step costs O(1) and batches of
+sequences advance together as vectorized NumPy operations.
+
+Requires NumPy (``pip install tarot-reader[numpy]``).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .core import _AliasTable, _build_card_result, _card_names
+from .deck import DECK_SIZE, get_all_cards, get_card_id, get_card_suit
+
+
+def _structure_transitions(
+    next_weight: float = 4.0, group_weight: float = 1.0, other_weight: float = 0.25
+) -> np.ndarray:
+    """
+    Build transitions from the deck structure.
+
+    Each card leads most often to the next card of its group (The Fool's
+    journey through the Major Arcana, Ace to King within a suit), then to
+    other cards of the same group, and rarely elsewhere. Cards never repeat
+    immediately.
+    """
+    groups = [get_card_suit(card_id) for card_id in range(DECK_SIZE)]
+    matrix = np.full((DECK_SIZE, DECK_SIZE), other_weight, dtype=np.float64)
+    for card_id in range(DECK_SIZE):
+        for other in range(DECK_SIZE):
+            if groups[other] == groups[card_id]:
+                matrix[card_id, other] = group_weight
+        following = card_id + 1
+        if following < DECK_SIZE and groups[following] == groups[card_id]:
+            matrix[card_id, following] = next_weight
+    np.fill_diagonal(matrix, 0.0)
+    return matrix
+
+
+class CardSequencer:
+    """
+    Generate card sequences from a transition matrix over card ids.
+
+    Row ``i`` of the matrix holds relative weights of moving from card ``i``
+    to every card; rows do not need to be normalized. Use
+    ``CardSequencer.from_deck_structure()`` or ``CardSequencer.from_corpus()``
+    to derive a matrix, or pass your own.
+    """
+
+    def __init__(
+        self,
+        transitions: Any,
+        start_weights: Optional[Any] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            transitions: Array-like of shape (78, 78) with non-negative weights
+            start_weights: Optional weights of length 78 for the first card;
+                           uniform when omitted
+            seed: Optional seed for the NumPy random generator
+        """
+        matrix = np.asarray(transitions, dtype=np.float64)
+        if matrix.shape != (DECK_SIZE, DECK_SIZE):
+            raise ValueError("Transition matrix must have shape (78, 78)")
+        if (matrix < 0).any() or not np.isfinite(matrix).all():
+            raise ValueError("Transition weights must be finite and >= 0")
+        empty = np.flatnonzero(matrix.sum(axis=1) == 0)
+        if len(empty):
+            raise ValueError(f"Transition rows without outgoing weight: {list(empty)}")
+
+        if start_weights is None:
+            start_weights = np.ones(DECK_SIZE)
+        start = np.asarray(start_weights, dtype=np.float64)
+        if start.shape != (DECK_SIZE,) or (start < 0).any() or not start.sum() > 0:
+            raise ValueError("Start weights must be 78 non-negative values, not all 0")
+
+        self.transitions = matrix / matrix.sum(axis=1, keepdims=True)
+        self.transitions.flags.writeable = False
+
+        tables = [_AliasTable(tuple(row)) for row in matrix]
+        self._prob = np.array([table.prob for table in tables], dtype=np.float64)
+        self._alias = np.array([table.alias for table in tables], dtype=np.intp)
+        start_table = _AliasTable(tuple(start))
+        self._start_prob = np.array(start_table.prob, dtype=np.float64)
+        self._start_alias = np.array(start_table.alias, dtype=np.intp)
+
+        self._rng = np.random.default_rng(seed)
+        self._all_cards = get_all_cards()
+
+    @classmethod
+    def from_deck_structure(cls, seed: Optional[int] = None) -> "CardSequencer":
+        """Create a sequencer that follows suits and rank order."""
+        return cls(_structure_transitions(), seed=seed)
+
+    @classmethod
+    def from_corpus(
+        cls,
+        readings: Iterable[Any],
+        smoothing: float = 0.1,
+        seed: Optional[int] = None,
+    ) -> "CardSequencer":
+        """
+        Learn transitions from consecutive cards in past readings.
+
+        Args:
+            readings: Iterable of card lists or position -> card dicts
+            smoothing: Weight added to every transition so unseen moves
+                       remain possible (must be > 0 unless every card
+                       is followed at least once)
+            seed: Optional seed for the NumPy random generator
+        """
+        counts = np.full((DECK_SIZE, DECK_SIZE), float(smoothing))
+        first = np.full(DECK_SIZE, float(smoothing))
+        for reading in readings:
+            card_ids = [get_card_id(name) for name in _card_names(reading)]
+            if not card_ids:
+                continue
+            first[card_ids[0]] += 1
+            for current, following in zip(card_ids, card_ids[1:]):
+                counts[current, following] += 1
+        return cls(counts, start_weights=first, seed=seed)
+
+    def _first_cards(self, num_sequences: int, start: Optional[int]) -> np.ndarray:
+        if start is not None:
+            if start < 0 or start >= DECK_SIZE:
+                raise ValueError("Start card id must be between 0 and 77")
+            return np.full(num_sequences, start, dtype=np.intp)
+        columns = self._rng.integers(0, DECK_SIZE, size=num_sequences)
+        keep = self._rng.random(num_sequences) < self._start_prob[columns]
+        return np.where(keep, columns, self._start_alias[columns])
+
+    def generate_batch(
+        self, num_sequences: int, length: int, start: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Generate many sequences at once, one vectorized step per position.
+
+        Args:
+            num_sequences: Number of independent sequences
+            length: Number of cards per sequence
+            start: Optional card id every sequence starts from
+
+        Returns:
+            Array of shape (num_sequences, length) with uint8 card ids
+        """
+        if num_sequences < 1 or length < 1:
+            raise ValueError("Number of sequences and length must be at least 1")
+
+        out = np.empty((num_sequences, length), dtype=np.uint8)
+        current = self._first_cards(num_sequences, start)
+        out[:, 0] = current
+        for step in range(1, length):
+            columns = self._rng.integers(0, DECK_SIZE, size=num_sequences)
+            keep = self._rng.random(num_sequences) < self._prob[current, columns]
+            current = np.where(keep, columns, self._alias[current, columns])
+            out[:, step] = current
+        return out
+
+    def generate(self, length: int, start: Optional[int] = None) -> List[int]:
+        """
+        Generate one sequence of card ids.
+
+        Args:
+            length: Number of cards in the sequence
+            start: Optional card id to start from
+
+        Returns:
+            List of card ids
+        """
+        return self.generate_batch(1, length, start)[0].tolist()
+
+    def generate_cards(
+        self, length: int, start: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate one sequence as card dicts with random orientations.
+
+        Args:
+            length: Number of cards in the sequence
+            start: Optional card id to start from
+
+        Returns:
+            List of card dictionaries with name, meaning, and orientation
+        """
+        card_ids = self.generate(length, start)
+        is_reversed = self._rng.random(length) < 0.5
+        return [
+            _build_card_result(self._all_cards[card_id], bool(flag))
+            for card_id, flag in zip(card_ids, is_reversed)
+        ]
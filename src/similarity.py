@@ -0,0 +1,267 @@
+"""
+Similarity index over stored readings.
+
+Each reading is packed into a 78-bit card-presence mask and a 78-bit reversed
+mask, stored as pairs of uint64 words. Jaccard and Hamming top-k queries run
+as vectorized popcounts over NumPy arrays, and optional MinHash banding (LSH)
+restricts Jaccard queries to a small candidate set on very large indexes.
+
+Requires NumPy (``pip install tarot-reader[numpy]``).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .core import _reading_cards
+from .deck import DECK_SIZE, get_card_id
+
+_WORDS = 2  # 78 bits fit into two uint64 words
+_ADD_CHUNK = 4096
+_METRICS = ("jaccard", "hamming")
+
+if hasattr(np, "bitwise_count"):
+
+    def _popcount(words: np.ndarray) -> np.ndarray:
+        return np.bitwise_count(words).astype(np.int64)
+
+else:  # NumPy < 2.0
+    _BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+    def _popcount(words: np.ndarray) -> np.ndarray:
+        words = np.ascontiguousarray(words, dtype=np.uint64)
+        counts = _BYTE_POPCOUNT[words.view(np.uint8)]
+        return counts.reshape(words.shape + (8,)).sum(axis=-1)
+
+
+def encode_reading(reading: Any) -> Tuple[int, int]:
+    """
+    Encode a reading as card-presence and reversed bit masks.
+
+    Args:
+        reading: A card dict, a position -> card dict (e.g., from draw_three)
+                 or a list of card dicts (e.g., from random_drop)
+
+    Returns:
+        Tuple of (presence_mask, reversed_mask) as 78-bit integers
+    """
+    presence = 0
+    reversed_mask = 0
+    for card in _reading_cards(reading):
+        bit = 1 << get_card_id(card["name"])
+        presence |= bit
+        if card["orientation"] == "Reversed":
+            reversed_mask |= bit
+    return presence, reversed_mask
+
+
+def _pack(presence: int, reversed_mask: int) -> np.ndarray:
+    """Pack two 78-bit masks into a row of four uint64 words."""
+    low = (1 << 64) - 1
+    return np.array(
+        [presence & low, presence >> 64, reversed_mask & low, reversed_mask >> 64],
+        dtype=np.uint64,
+    )
+
+
+def _unpack_presence(rows: np.ndarray) -> np.ndarray:
+    """Expand packed presence words of shape (n, 4) to a (n, 78) bool array."""
+    shifts = np.arange(64, dtype=np.uint64)
+    bits = (rows[:, :_WORDS, None] >> shifts) & np.uint64(1)
+    return bits.reshape(len(rows), _WORDS * 64)[:, :DECK_SIZE].astype(bool)
+
+
+class ReadingIndex:
+    """
+    Append-only index of readings answering top-k similarity queries.
+
+    Rows are numbered in insertion order. Jaccard similarity compares the sets
+    of cards drawn; Hamming distance counts differing bits across both the
+    presence and the reversed masks, so orientation changes are penalised too.
+
+    With ``bands > 0`` every row also gets a MinHash signature of
+    ``bands * rows_per_band`` values, bucketed per band. Jaccard queries then
+    score only rows sharing at least one bucket with the query, which keeps
+    top-k sub-linear on large indexes at the cost of being approximate. When
+    fewer than ``k`` candidates are found the query falls back to a full scan.
+    MinHash estimates Jaccard similarity only, so Hamming queries always scan.
+    """
+
+    def __init__(
+        self,
+        bands: int = 0,
+        rows_per_band: int = 4,
+        seed: int = 0,
+        capacity: int = 1024,
+    ):
+        if bands < 0 or rows_per_band < 1:
+            raise ValueError("bands must be >= 0 and rows_per_band >= 1")
+
+        self._rows = np.zeros((max(capacity, 1), 2 * _WORDS), dtype=np.uint64)
+        self._size = 0
+        self.bands = bands
+        self.rows_per_band = rows_per_band
+
+        self._ranks: Optional[np.ndarray] = None
+        self._buckets: List[Dict[bytes, List[int]]] = []
+        if bands:
+            rng = np.random.default_rng(seed)
+            self._ranks = np.stack(
+                [
+                    rng.permutation(DECK_SIZE).astype(np.uint8)
+                    for _ in range(bands * rows_per_band)
+                ]
+            )
+            self._buckets = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def masks(self) -> np.ndarray:
+        """Read-only view of the packed rows, shape (len, 4) of uint64."""
+        view = self._rows[: self._size]
+        view.flags.writeable = False
+        return view
+
+    def _reserve(self, extra: int):
+        needed = self._size + extra
+        if needed <= len(self._rows):
+            return
+        capacity = len(self._rows)
+        while capacity < needed:
+            capacity *= 2
+        grown = np.zeros((capacity, 2 * _WORDS), dtype=np.uint64)
+        grown[: self._size] = self._rows[: self._size]
+        self._rows = grown
+
+    def _signatures(self, rows: np.ndarray) -> np.ndarray:
+        """Compute MinHash signatures of shape (n, bands * rows_per_band)."""
+        assert self._ranks is not None
+        bits = _unpack_presence(rows)
+        ranks = self._ranks[None, :, :]
+        return np.where(bits[:, None, :], ranks, np.uint8(255)).min(axis=2)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        width = self.rows_per_band
+        return [
+            signature[band * width : (band + 1) * width].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, reading: Any) -> int:
+        """
+        Add one reading to the index.
+
+        Args:
+            reading: Any reading shape accepted by encode_reading
+
+        Returns:
+            Row id of the stored reading
+        """
+        return int(self.add_many([reading])[0])
+
+    def add_many(self, readings: Iterable[Any]) -> np.ndarray:
+        """
+        Add a batch of readings to the index.
+
+        Args:
+            readings: Iterable of readings accepted by encode_reading
+
+        Returns:
+            Array of row ids assigned to the readings, in order
+        """
+        packed = [_pack(*encode_reading(reading)) for reading in readings]
+        if not packed:
+            return np.empty(0, dtype=np.int64)
+        return self.add_masks(np.stack(packed))
+
+    def add_masks(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Add already packed rows of (presence_lo, presence_hi, reversed_lo,
+        reversed_hi) uint64 words.
+
+        Args:
+            rows: Array of shape (n, 4) and dtype uint64
+
+        Returns:
+            Array of row ids assigned to the rows, in order
+        """
+        rows = np.asarray(rows, dtype=np.uint64).reshape(-1, 2 * _WORDS)
+        start = self._size
+        self._reserve(len(rows))
+        self._rows[start : start + len(rows)] = rows
+        self._size += len(rows)
+
+        if self.bands:
+            for offset in range(0, len(rows), _ADD_CHUNK):
+                chunk = rows[offset : offset + _ADD_CHUNK]
+                for i, signature in enumerate(self._signatures(chunk)):
+                    row_id = start + offset + i
+                    for band, key in enumerate(self._band_keys(signature)):
+                        self._buckets[band].setdefault(key, []).append(row_id)
+
+        return np.arange(start, self._size, dtype=np.int64)
+
+    def _candidates(self, query: np.ndarray) -> np.ndarray:
+        signature = self._signatures(query[None, :])[0]
+        found: Set[int] = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            found.update(self._buckets[band].get(key, ()))
+        return np.fromiter(found, dtype=np.int64, count=len(found))
+
+    def query(
+        self,
+        reading: Any,
+        k: int = 10,
+        metric: str = "jaccard",
+        exact: bool = False,
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the stored readings most similar to a reading.
+
+        Args:
+            reading: Any reading shape accepted by encode_reading
+            k: Maximum number of results
+            metric: "jaccard" (similarity, higher is closer) or
+                    "hamming" (distance in bits, lower is closer)
+            exact: Scan every row even when LSH banding is enabled (Hamming
+                   queries always do)
+
+        Returns:
+            List of (row_id, score) tuples, closest first
+        """
+        if metric not in _METRICS:
+            raise ValueError(f"metric must be one of {', '.join(_METRICS)}")
+        if k < 1 or not self._size:
+            return []
+
+        query = _pack(*encode_reading(reading))
+        row_ids = None
+        if self.bands and not exact and metric == "jaccard":
+            row_ids = self._candidates(query)
+            if len(row_ids) < k:
+                row_ids = None
+        if row_ids is None:
+            row_ids = np.arange(self._size, dtype=np.int64)
+        rows = self._rows[row_ids]
+
+        if metric == "jaccard":
+            presence = rows[:, :_WORDS]
+            inter = _popcount(presence & query[:_WORDS]).sum(axis=1)
+            union = _popcount(presence | query[:_WORDS]).sum(axis=1)
+            scores = inter / np.maximum(union, 1)
+            order_key = -scores
+        else:
+            scores = _popcount(rows ^ query).sum(axis=1)
+            order_key = scores
+
+        if len(row_ids) > k:
+            top = np.argpartition(order_key, k - 1)[:k]
+        else:
+            top = np.arange(len(row_ids))
+        top = top[np.lexsort((row_ids[top], order_key[top]))]
+
+        if metric == "jaccard":
+            return [(int(row_ids[i]), float(scores[i])) for i in top]
+        return [(int(row_ids[i]), int(scores[i])) for i in top]
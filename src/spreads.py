@@ -0,0 +1,287 @@
+"""
+Spread registry.
+
+Spread shapes are data rather than code. Each definition names a spread, its
+ordered positions and optional per-position constraints, and is compiled once
+into an immutable SpreadLayout shared by the draw engine, the text formatter
+and the API. Built-in spreads live in src/data/spreads.json; more can be
+loaded from JSON or TOML files with load_spreads() or by listing paths in the
+TAROT_READER_SPREADS environment variable.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .deck import CARD_GROUPS, DECK_SIZE, GROUP_CARD_IDS
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib  # type: ignore[no-redef, import-not-found]
+    except ImportError:
+        tomllib = None  # type: ignore[assignment]
+
+SPREADS_ENV_VAR = "TAROT_READER_SPREADS"
+_BUILTIN_SPREADS = Path(__file__).parent / "data" / "spreads.json"
+
+
+class SpreadSlot(NamedTuple):
+    """A compiled position: allowed card ids and forced orientation."""
+
+    name: str
+    pool: Optional[Tuple[int, ...]]  # None means the whole deck
+    reversed: Optional[bool]  # None means a random orientation
+
+
+class SpreadLayout(NamedTuple):
+    """Immutable, compiled spread definition."""
+
+    name: str
+    title: str
+    positions: Tuple[str, ...]
+    slots: Tuple[SpreadSlot, ...]
+    draw_order: Tuple[int, ...]
+    constrained: bool
+    summary: Optional[str]
+    guidance: Optional[str]
+    width: int
+    numbered: bool
+
+    @property
+    def size(self) -> int:
+        """Number of cards in the spread."""
+        return len(self.positions)
+
+
+_REGISTRY: Dict[str, SpreadLayout] = {}
+
+
+def _compile_slot(position: Union[str, Dict[str, Any]]) -> SpreadSlot:
+    if isinstance(position, str):
+        return SpreadSlot(position, None, None)
+
+    name = position.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError("Every spread position needs a name")
+
+    pool = None
+    if "groups" in position:
+        card_ids: List[int] = []
+        for group in position["groups"]:
+            if group not in GROUP_CARD_IDS:
+                raise ValueError(
+                    f"Unknown group '{group}' in position '{name}'. "
+                    f"Valid groups: {', '.join(CARD_GROUPS)}"
+                )
+            card_ids.extend(GROUP_CARD_IDS[group])
+        pool = tuple(sorted(set(card_ids)))
+
+    orientation = position.get("orientation")
+    if orientation is not None and orientation not in ("upright", "reversed"):
+        raise ValueError(
+            f"Orientation of position '{name}' must be upright or reversed"
+        )
+    is_reversed = None if orientation is None else orientation == "reversed"
+
+    return SpreadSlot(name, pool, is_reversed)
+
+
+def _augment(
+    slot: int,
+    pools: List[Sequence[int]],
+    owners: Dict[int, int],
+    seen: Set[int],
+    excluded: AbstractSet[int],
+) -> bool:
+    """Find a card for slot along an augmenting path, moving other slots."""
+    for card in pools[slot]:
+        if card in excluded or card in seen:
+            continue
+        seen.add(card)
+        owner = owners.get(card)
+        if owner is None or _augment(owner, pools, owners, seen, excluded):
+            owners[card] = slot
+            return True
+    return False
+
+
+def _match_slots(pools: List[Sequence[int]]) -> Optional[Dict[int, int]]:
+    """
+    Give every slot a distinct card from its pool.
+
+    Returns:
+        Mapping of card id -> slot index, or None when no such assignment
+        exists (Hall's condition fails for some set of slots)
+    """
+    owners: Dict[int, int] = {}
+    for slot in sorted(range(len(pools)), key=lambda i: len(pools[i])):
+        if not _augment(slot, pools, owners, set(), frozenset()):
+            return None
+    return owners
+
+
+def _slot_pools(slots: Sequence[SpreadSlot]) -> List[Sequence[int]]:
+    return [range(DECK_SIZE) if slot.pool is None else slot.pool for slot in slots]
+
+
+def compile_spread(definition: Dict[str, Any]) -> SpreadLayout:
+    """
+    Compile a spread definition into an immutable layout.
+
+    Args:
+        definition: Dict with "name", "positions" (names or objects with
+                    "name" and optional "groups" and "orientation"), and
+                    optional "title", "summary", "guidance" and "display"
+                    ({"width": int, "numbered": bool})
+
+    Returns:
+        Compiled SpreadLayout
+
+    Raises:
+        ValueError: If the definition is malformed or its constraints cannot
+                    all be satisfied in one draw
+    """
+    name = definition.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError("Spread definitions need a name")
+
+    slots = tuple(
+        _compile_slot(position) for position in definition.get("positions", [])
+    )
+    if not slots or len(slots) > DECK_SIZE:
+        raise ValueError(f"Spread '{name}' must have between 1 and 78 positions")
+    positions = tuple(slot.name for slot in slots)
+    if len(set(positions)) != len(positions):
+        raise ValueError(f"Spread '{name}' has duplicate position names")
+
+    # Every set of positions must fit into the union of their pools
+    if _match_slots(_slot_pools(slots)) is None:
+        raise ValueError(
+            f"Spread '{name}' cannot give every position a distinct card "
+            "from its groups"
+        )
+
+    # Draw the most restricted positions first so they cannot run dry
+    pool_sizes = [DECK_SIZE if slot.pool is None else len(slot.pool) for slot in slots]
+    draw_order = tuple(sorted(range(len(slots)), key=pool_sizes.__getitem__))
+    display = definition.get("display", {})
+
+    return SpreadLayout(
+        name=name,
+        title=definition.get("title", name.upper()),
+        positions=positions,
+        slots=slots,
+        draw_order=draw_order,
+        constrained=any(
+            slot.pool is not None or slot.reversed is not None for slot in slots
+        ),
+        summary=definition.get("summary"),
+        guidance=definition.get("guidance"),
+        width=int(display.get("width", 50)),
+        numbered=bool(display.get("numbered", len(slots) > 3)),
+    )
+
+
+def register_spread(definition: Dict[str, Any]) -> SpreadLayout:
+    """
+    Compile a definition and add it to the registry, replacing any spread
+    with the same name.
+
+    Args:
+        definition: Spread definition (see compile_spread)
+
+    Returns:
+        Compiled SpreadLayout
+    """
+    layout = compile_spread(definition)
+    _REGISTRY[layout.name] = layout
+    return layout
+
+
+def _read_definitions(path: Path) -> List[Dict[str, Any]]:
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise ValueError(
+                f"Cannot read {path}: TOML spreads need Python 3.11+ or tomli"
+            )
+        with open(path, "rb") as f:
+            data: Any = tomllib.load(f)
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+    if isinstance(data, dict):
+        data = data.get("spreads", [data])
+    return list(data)
+
+
+def load_spreads(path: Union[str, Path]) -> List[SpreadLayout]:
+    """
+    Load and register spread definitions.
+
+    JSON files hold one definition, a list of them, or {"spreads": [...]};
+    TOML files use [[spreads]] tables. Directories load every .json and
+    .toml file in name order.
+
+    Args:
+        path: File or directory with spread definitions
+
+    Returns:
+        List of compiled layouts that were registered
+    """
+    path = Path(path)
+    files = (
+        sorted(p for p in path.iterdir() if p.suffix in (".json", ".toml"))
+        if path.is_dir()
+        else [path]
+    )
+    return [
+        register_spread(definition)
+        for file in files
+        for definition in _read_definitions(file)
+    ]
+
+
+def get_spread(name: str) -> SpreadLayout:
+    """
+    Return the compiled layout of a registered spread.
+
+    Args:
+        name: Spread name (e.g., "three", "celtic", "horseshoe")
+
+    Returns:
+        Compiled SpreadLayout
+
+    Raises:
+        ValueError: If no spread with that name is registered
+    """
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown spread '{name}'. Available spreads: {', '.join(list_spreads())}"
+        ) from None
+
+
+def list_spreads() -> List[str]:
+    """Return the names of all registered spreads."""
+    return list(_REGISTRY)
+
+
+load_spreads(_BUILTIN_SPREADS)
+for _extra in filter(None, os.environ.get(SPREADS_ENV_VAR, "").split(os.pathsep)):
+    load_spreads(_extra)
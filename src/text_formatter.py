@@ -1,9 +1,57 @@
 """
 Text formatting utilities for tarot readings - designed for terminal display.
 These functions return formatted text strings for command-line interface display.
+
+render() and render_summary() format a reading that has already been drawn.
+Static pieces (rules, titles, position labels and the text of every card in
+both orientations) are compiled once per spread and cached, so rendering is
+a join over cached strings. Other output formats (Markdown, HTML, JSON
+Lines) are renderers in the same registry; render_to() streams many readings
+in any of them into a file in large chunks. The get_*_text() functions draw
+a new reading and render it.
 """
 
-from .core import draw_single, draw_three, celtic_cross
+import html
+import io
+import json
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    IO,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .core import (
+    draw_single,
+    draw_three,
+    celtic_cross,
+    draw_spread,
+    _build_card_result,
+    _draw_cards,
+    _reading_cards,
+    _reading_spread,
+)
+from .deck import get_all_cards
+from .spreads import SpreadLayout, get_spread, list_spreads
+
+_SINGLE_FOOTER = (
+    "\n\n💫 This card represents your current energy and guidance for today."
+)
+_RANDOM_FOOTER = (
+    "\n\n💫 These cards offer guidance and insight for your current journey."
+)
+_SINGLE_HEADER_TOP = (
+    "╔══════════════════════════════════════════════════╗\n"
+    "║              🔮 DAILY CARD READING               ║\n"
+)
+_SINGLE_HEADER_BOTTOM = "╚══════════════════════════════════════════════════╝"
 
 
 def _format_card_for_display(card):
@@ -22,6 +70,509 @@ def _format_card_for_display(card):
     return f"🎴 {card['name']}{orientation_text}\n   ↳ {card['meaning']}"
 
 
+# Card dict of every (name, orientation, meaning) in the deck, as drawn
+_DECK_CARDS: Dict[Tuple[str, str, str], Dict[str, Any]] = {
+    (result["name"], result["orientation"], result["meaning"]): result
+    for card in get_all_cards()
+    for result in (_build_card_result(card, False), _build_card_result(card, True))
+}
+
+
+class Renderer(ABC):
+    """
+    Base class of output formats for existing readings.
+
+    A renderer formats each of the 156 (card, orientation) pairs once, when
+    it is created, and compiles the static pieces of each spread on first
+    use, so rendering a reading only looks up and joins cached fragments.
+    Subclasses set name and implement format_card(), compile_template() and
+    join().
+    """
+
+    name = ""
+    terminator = "\n\n"  # written after each reading by render_to()
+
+    def __init__(self) -> None:
+        self._fragments = {
+            key: self.format_card(card) for key, card in _DECK_CARDS.items()
+        }
+        # (layout, template) by spread; re-registered spreads are recompiled
+        self._templates: Dict[Union[str, int], Tuple[Optional[SpreadLayout], Any]] = {}
+
+    @abstractmethod
+    def format_card(self, card: Dict[str, Any]) -> Any:
+        """Format one card dict."""
+
+    @abstractmethod
+    def compile_template(
+        self, spread: Union[str, int], layout: Optional[SpreadLayout]
+    ) -> Any:
+        """Build the static pieces of a spread (layout is None for card counts)."""
+
+    @abstractmethod
+    def join(self, template: Any, fragments: List[Any], personal_seed=None) -> Any:
+        """Assemble a compiled template and card fragments into one reading."""
+
+    def card(self, card: Dict[str, Any]) -> Any:
+        """Cached fragment of a card."""
+        key = (card["name"], card["orientation"], card["meaning"])
+        fragment = self._fragments.get(key)
+        # Cards with custom meanings are formatted directly
+        return self.format_card(card) if fragment is None else fragment
+
+    def template(self, spread: Union[str, int]) -> Any:
+        """Compiled template of "single", a spread name or a card count."""
+        layout = None if isinstance(spread, int) else get_spread(spread)
+        cached = self._templates.get(spread)
+        if cached is None or cached[0] is not layout:
+            compiled = self.compile_template(spread, layout)
+            cached = self._templates[spread] = (layout, compiled)
+        return cached[1]
+
+    def render(self, reading: Any, template: Any = None, personal_seed=None) -> str:
+        """
+        Render one reading.
+
+        Args:
+            reading: A reading as returned by draw_single(), a spread
+                     function or random_drop()
+            template: "single", a registered spread name or a card count
+                      (inferred from the reading if omitted)
+            personal_seed: Optional personal seed to show in the header
+
+        Returns:
+            The rendered reading
+        """
+        spread = _reading_spread(reading) if template is None else template
+        fragments = [self.card(card) for card in _reading_cards(reading)]
+        return self.join(self.template(spread), fragments, personal_seed)
+
+    def render_bytes(
+        self, reading: Any, template: Any = None, personal_seed=None
+    ) -> bytes:
+        """Render one reading as UTF-8 bytes."""
+        return self.render(reading, template, personal_seed).encode()
+
+
+class _TerminalTemplate(NamedTuple):
+    """Precompiled static text of one spread's layout."""
+
+    head: str  # rule and title
+    rule: str  # closing rule of the header, with its leading newline
+    labels: Tuple[str, ...]  # text before each card
+    footer: str  # summary closing line
+
+
+class TerminalRenderer(Renderer):
+    """Emoji text for terminals, as printed by the CLI."""
+
+    name = "terminal"
+
+    def format_card(self, card: Dict[str, Any]) -> str:
+        return _format_card_for_display(card)
+
+    def compile_template(
+        self, spread: Union[str, int], layout: Optional[SpreadLayout]
+    ) -> Optional[_TerminalTemplate]:
+        if spread == "single":
+            return None
+        if layout is None:
+            rule = "═" * 50
+            return _TerminalTemplate(
+                head=f"{rule}\n🔮 {spread}-CARD RANDOM DRAW",
+                rule="\n" + rule,
+                labels=tuple(f"\n\n{i:2d}.\n" for i in range(1, int(spread) + 1)),
+                footer=_RANDOM_FOOTER,
+            )
+
+        rule = "═" * layout.width
+        if layout.numbered:
+            labels = [
+                f"\n\n{i:2d}. {position.upper()}:\n"
+                for i, position in enumerate(layout.positions, 1)
+            ]
+        else:
+            labels = [f"\n\n📅 {position.upper()}:\n" for position in layout.positions]
+        return _TerminalTemplate(
+            head=f"{rule}\n🔮 {layout.title}",
+            rule="\n" + rule,
+            labels=tuple(labels),
+            footer=f"\n\n💫 {layout.guidance}",
+        )
+
+    def join(
+        self,
+        template: Optional[_TerminalTemplate],
+        fragments: List[str],
+        personal_seed=None,
+    ) -> str:
+        if template is None:
+            return fragments[0]
+        seed_line = f"\n🎯 Personal Seed: {personal_seed}" if personal_seed else ""
+        body = "".join(
+            [label + fragment for label, fragment in zip(template.labels, fragments)]
+        )
+        return template.head + seed_line + template.rule + body
+
+
+class SummaryRenderer(TerminalRenderer):
+    """Terminal text with the summary header and guidance of get_reading_summary()."""
+
+    name = "summary"
+
+    def join(
+        self,
+        template: Optional[_TerminalTemplate],
+        fragments: List[str],
+        personal_seed=None,
+    ) -> str:
+        text = super().join(template, fragments, personal_seed)
+        if template is not None:
+            return text + template.footer
+
+        header = _SINGLE_HEADER_TOP
+        if personal_seed:
+            header += f"║           🎯 Seed: {personal_seed[:30]:<30} ║\n"
+        return header + _SINGLE_HEADER_BOTTOM + "\n\n" + text + _SINGLE_FOOTER
+
+
+def _markdown_escape(text: str) -> str:
+    return "".join("\\" + char if char in "\\`*_[]<>#" else char for char in text)
+
+
+class MarkdownRenderer(Renderer):
+    """Markdown with a heading per reading and per position."""
+
+    name = "markdown"
+
+    def format_card(self, card: Dict[str, Any]) -> str:
+        orientation = " *(Reversed)*" if card["orientation"] == "Reversed" else ""
+        return (
+            f"**{_markdown_escape(card['name'])}**{orientation}\n\n"
+            f"> {_markdown_escape(card['meaning'])}"
+        )
+
+    def compile_template(
+        self, spread: Union[str, int], layout: Optional[SpreadLayout]
+    ) -> Optional[Tuple[str, Tuple[str, ...]]]:
+        if spread == "single":
+            return None
+        if layout is None:
+            head = f"## 🔮 {spread}-Card Random Draw"
+            labels = [f"\n\n### {i}.\n\n" for i in range(1, int(spread) + 1)]
+        elif layout.numbered:
+            head = f"## 🔮 {_markdown_escape(layout.title)}"
+            labels = [
+                f"\n\n### {i}. {_markdown_escape(position)}\n\n"
+                for i, position in enumerate(layout.positions, 1)
+            ]
+        else:
+            head = f"## 🔮 {_markdown_escape(layout.title)}"
+            labels = [
+                f"\n\n### {_markdown_escape(position)}\n\n"
+                for position in layout.positions
+            ]
+        return head, tuple(labels)
+
+    def join(
+        self,
+        template: Optional[Tuple[str, Tuple[str, ...]]],
+        fragments: List[str],
+        personal_seed=None,
+    ) -> str:
+        if template is None:
+            return fragments[0]
+        head, labels = template
+        if personal_seed:
+            head += f"\n\n*Personal Seed: {_markdown_escape(str(personal_seed))}*"
+        return head + "".join(
+            [label + fragment for label, fragment in zip(labels, fragments)]
+        )
+
+
+class HTMLRenderer(Renderer):
+    """HTML fragments: a <section> per reading and a <div> per card."""
+
+    name = "html"
+    terminator = "\n"
+
+    def format_card(self, card: Dict[str, Any]) -> str:
+        reversed_class = " reversed" if card["orientation"] == "Reversed" else ""
+        return (
+            f'<div class="tarot-card{reversed_class}">'
+            f'<h4 class="name">{html.escape(card["name"])}</h4>'
+            f'<p class="orientation">{html.escape(card["orientation"])}</p>'
+            f'<p class="meaning">{html.escape(card["meaning"])}</p></div>'
+        )
+
+    def compile_template(
+        self, spread: Union[str, int], layout: Optional[SpreadLayout]
+    ) -> Optional[Tuple[str, Tuple[str, ...]]]:
+        if spread == "single":
+            return None
+        if layout is None:
+            title = f"{spread}-Card Random Draw"
+            positions = [f"{i}." for i in range(1, int(spread) + 1)]
+        else:
+            title = layout.title
+            positions = list(layout.positions)
+        head = (
+            f'<section class="tarot-reading" data-spread="{html.escape(str(spread))}">'
+            f"<h2>{html.escape(title)}</h2>"
+        )
+        labels = tuple(f"<h3>{html.escape(position)}</h3>" for position in positions)
+        return head, labels
+
+    def join(
+        self,
+        template: Optional[Tuple[str, Tuple[str, ...]]],
+        fragments: List[str],
+        personal_seed=None,
+    ) -> str:
+        if template is None:
+            return fragments[0]
+        head, labels = template
+        if personal_seed:
+            head += (
+                '<p class="personal-seed">Personal Seed: '
+                f"{html.escape(str(personal_seed))}</p>"
+            )
+        body = "".join([label + fragment for label, fragment in zip(labels, fragments)])
+        return head + body + "</section>"
+
+
+class JSONLinesRenderer(Renderer):
+    """
+    JSON objects identical to json.dumps(reading), built from pre-escaped
+    UTF-8 fragments of every card and position name.
+    """
+
+    name = "jsonl"
+    terminator = "\n"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._keys: Dict[str, bytes] = {}
+        # Fragments keyed by a card's items, so keys, values and their order
+        # must all match the deck card the fragment was encoded from
+        self._exact = {
+            tuple(card.items()): self._fragments[key]
+            for key, card in _DECK_CARDS.items()
+        }
+
+    def format_card(self, card: Dict[str, Any]) -> bytes:
+        return json.dumps(card).encode()
+
+    def card(self, card: Dict[str, Any]) -> bytes:
+        try:
+            return self._exact[tuple(card.items())]
+        except (KeyError, TypeError):
+            # Custom meanings or extra keys, e.g. from consensus_reading()
+            return self.format_card(card)
+
+    def compile_template(
+        self, spread: Union[str, int], layout: Optional[SpreadLayout]
+    ) -> Optional[Tuple[bytes, ...]]:
+        # None for single cards, () for card lists, else position keys
+        if spread == "single":
+            return None
+        if layout is None:
+            return ()
+        return tuple(self._key(position) for position in layout.positions)
+
+    def join(
+        self,
+        template: Optional[Tuple[bytes, ...]],
+        fragments: List[bytes],
+        personal_seed=None,
+    ) -> bytes:
+        if template is None:
+            return fragments[0]
+        if not template:
+            return b"[" + b", ".join(fragments) + b"]"
+        items = [key + fragment for key, fragment in zip(template, fragments)]
+        return b"{" + b", ".join(items) + b"}"
+
+    def _key(self, position: str) -> bytes:
+        fragment = self._keys.get(position)
+        if fragment is None:
+            fragment = self._keys[position] = json.dumps(position).encode() + b": "
+        return fragment
+
+    def render_bytes(
+        self, reading: Any, template: Any = None, personal_seed=None
+    ) -> bytes:
+        if isinstance(reading, dict):
+            if "name" in reading:
+                return self.card(reading)
+            items = [self._key(key) + self.card(card) for key, card in reading.items()]
+            return b"{" + b", ".join(items) + b"}"
+        return b"[" + b", ".join([self.card(card) for card in reading]) + b"]"
+
+    def render(self, reading: Any, template: Any = None, personal_seed=None) -> str:
+        return self.render_bytes(reading).decode()
+
+
+_RENDERERS: Dict[str, Renderer] = {}
+_RENDERER_ALIASES = {"text": "terminal"}
+
+
+def register_renderer(renderer: Renderer) -> Renderer:
+    """
+    Add a renderer to the registry, replacing any with the same name.
+
+    Args:
+        renderer: Renderer instance with a unique name
+
+    Returns:
+        The registered renderer
+    """
+    if not renderer.name:
+        raise ValueError("Renderer must have a name")
+    _RENDERERS[renderer.name] = renderer
+    return renderer
+
+
+def get_renderer(name: str) -> Renderer:
+    """
+    Return a registered renderer.
+
+    Args:
+        name: "terminal" (or "text"), "summary", "markdown", "html", "jsonl"
+              or the name of a registered custom renderer
+
+    Raises:
+        ValueError: If no renderer with that name is registered
+    """
+    try:
+        return _RENDERERS[_RENDERER_ALIASES.get(name, name)]
+    except KeyError:
+        raise ValueError(
+            f"Unknown format '{name}'. Available formats: {', '.join(list_renderers())}"
+        ) from None
+
+
+def list_renderers() -> List[str]:
+    """Return the names of all registered renderers."""
+    return list(_RENDERERS)
+
+
+for _renderer_class in (
+    TerminalRenderer,
+    SummaryRenderer,
+    MarkdownRenderer,
+    HTMLRenderer,
+    JSONLinesRenderer,
+):
+    register_renderer(_renderer_class())
+_TERMINAL = _RENDERERS["terminal"]
+_SUMMARY = _RENDERERS["summary"]
+
+
+def render(reading: Any, template: Any = None, personal_seed=None) -> str:
+    """
+    Format an existing reading as terminal text, without drawing.
+
+    Args:
+        reading: A reading as returned by draw_single(), a spread function
+                 or random_drop()
+        template: "single", a registered spread name or a card count
+                  (inferred from the reading if omitted)
+        personal_seed: Optional personal seed to show in the header
+
+    Returns:
+        The same text the matching get_*_text() function produces
+    """
+    return _TERMINAL.render(reading, template, personal_seed)
+
+
+def render_summary(reading: Any, template: Any = None, personal_seed=None) -> str:
+    """
+    Format an existing reading with its summary header and guidance.
+
+    Args:
+        reading: A reading as returned by draw_single(), a spread function
+                 or random_drop()
+        template: "single", a registered spread name or a card count
+                  (inferred from the reading if omitted)
+        personal_seed: Optional personal seed to show in the header
+
+    Returns:
+        The same text get_reading_summary() produces
+    """
+    return _SUMMARY.render(reading, template, personal_seed)
+
+
+def _is_binary(stream: Any) -> bool:
+    if isinstance(stream, io.TextIOBase):
+        return False
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return "b" in getattr(stream, "mode", "")
+
+
+def render_to(
+    stream: IO[Any],
+    readings: Iterable[Any],
+    fmt: str = "text",
+    template: Any = None,
+    personal_seed=None,
+    chunk_size: int = 1 << 16,
+    flush: bool = False,
+) -> int:
+    """
+    Render readings straight into a text or binary stream.
+
+    Rendered readings are collected into chunks of about chunk_size
+    characters (bytes for binary streams) and written with one call each, so
+    memory use stays constant however many readings the iterable yields.
+    Binary streams receive UTF-8.
+
+    Args:
+        stream: Writable text or binary file-like object
+        readings: Iterable of readings, e.g. a generator
+        fmt: Name of a registered renderer (see list_renderers())
+        template: Spread of every reading (inferred per reading if omitted)
+        personal_seed: Optional personal seed to show in headers
+        chunk_size: Characters collected before each write
+        flush: Flush the stream after every chunk
+
+    Returns:
+        Number of readings written
+    """
+    renderer = get_renderer(fmt)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    binary = _is_binary(stream)
+    render_one: Callable[..., Any] = (
+        renderer.render_bytes if binary else renderer.render
+    )
+    terminator: Any = renderer.terminator.encode() if binary else renderer.terminator
+    empty: Any = b"" if binary else ""
+    pieces: List[Any] = []
+    size = 0
+    count = 0
+
+    for reading in readings:
+        text = render_one(reading, template, personal_seed)
+        pieces.append(text)
+        pieces.append(terminator)
+        size += len(text) + len(terminator)
+        count += 1
+        if size >= chunk_size:
+            stream.write(empty.join(pieces))
+            if flush:
+                stream.flush()
+            pieces.clear()
+            size = 0
+    if pieces:
+        stream.write(empty.join(pieces))
+        if flush:
+            stream.flush()
+    return count
+
+
 def get_single_card_text(personal_seed=None) -> str:
     """
     Get a single card reading as formatted text string.
@@ -32,8 +583,7 @@ def get_single_card_text(personal_seed=None) -> str:
     Returns:
         String containing the card name, orientation, and meaning
     """
-    card = draw_single(personal_seed)
-    return _format_card_for_display(card)
+    return render(draw_single(personal_seed), "single")
 
 
 def get_three_card_text(personal_seed=None) -> str:
@@ -46,20 +596,7 @@ def get_three_card_text(personal_seed=None) -> str:
     Returns:
         String containing Past, Present, Future cards with meanings
     """
-    reading = draw_three(personal_seed)
-    lines = []
-
-    lines.append("═" * 50)
-    lines.append("🔮 THREE CARD SPREAD (Past • Present • Future)")
-    if personal_seed:
-        lines.append(f"🎯 Personal Seed: {personal_seed}")
-    lines.append("═" * 50)
-
-    for position, card in reading.items():
-        lines.append(f"\n📅 {position.upper()}:")
-        lines.append(_format_card_for_display(card))
-
-    return "\n".join(lines)
+    return render(draw_three(personal_seed), "three", personal_seed)
 
 
 def get_celtic_cross_text(personal_seed=None) -> str:
@@ -72,20 +609,21 @@ def get_celtic_cross_text(personal_seed=None) -> str:
     Returns:
         String containing all 10 positions with card names and meanings
     """
-    reading = celtic_cross(personal_seed)
-    lines = []
+    return render(celtic_cross(personal_seed), "celtic", personal_seed)
 
-    lines.append("═" * 60)
-    lines.append("🔮 CELTIC CROSS SPREAD")
-    if personal_seed:
-        lines.append(f"🎯 Personal Seed: {personal_seed}")
-    lines.append("═" * 60)
 
-    for i, (position, card) in enumerate(reading.items(), 1):
-        lines.append(f"\n{i:2d}. {position.upper()}:")
-        lines.append(_format_card_for_display(card))
+def get_spread_text(name: str, personal_seed=None) -> str:
+    """
+    Get any registered spread reading as formatted text string.
 
-    return "\n".join(lines)
+    Args:
+        name: Spread name from the registry (e.g., "horseshoe")
+        personal_seed: Optional personal information to seed the shuffle
+
+    Returns:
+        String containing every position with card names and meanings
+    """
+    return render(draw_spread(name, personal_seed), name, personal_seed)
 
 
 def get_random_cards_text(num_cards: int, personal_seed=None) -> str:
@@ -99,22 +637,8 @@ def get_random_cards_text(num_cards: int, personal_seed=None) -> str:
     Returns:
         String containing the drawn cards with meanings
     """
-    from .core import _draw_cards
-
     cards = _draw_cards(num_cards, personal_seed)
-    lines = []
-
-    lines.append("═" * 50)
-    lines.append(f"🔮 {num_cards}-CARD RANDOM DRAW")
-    if personal_seed:
-        lines.append(f"🎯 Personal Seed: {personal_seed}")
-    lines.append("═" * 50)
-
-    for i, card in enumerate(cards, 1):
-        lines.append(f"\n{i:2d}.")
-        lines.append(_format_card_for_display(card))
-
-    return "\n".join(lines)
+    return render(cards, num_cards, personal_seed)
 
 
 def get_reading_summary(reading_type: str = "single", personal_seed=None) -> str:
@@ -122,32 +646,26 @@ def get_reading_summary(reading_type: str = "single", personal_seed=None) -> str
     Get a complete tarot reading with context for terminal display.
 
     Args:
-        reading_type: Type of reading ("single", "three", "celtic", or number as string)
+        reading_type: Type of reading ("single", "three", "celtic", any registered
+                      spread name, or number as string)
         personal_seed: Optional personal information to seed the shuffle
 
     Returns:
         String containing the full reading with context
     """
+    spread: Union[str, int] = reading_type
     if reading_type == "single":
-        card_text = get_single_card_text(personal_seed)
-        header = "╔══════════════════════════════════════════════════╗\n║              🔮 DAILY CARD READING               ║\n"
-        if personal_seed:
-            header += f"║           🎯 Seed: {personal_seed[:30]:<30} ║\n"
-        header += "╚══════════════════════════════════════════════════╝"
-        return f"{header}\n\n{card_text}\n\n💫 This card represents your current energy and guidance for today."
-
+        reading: Any = draw_single(personal_seed)
     elif reading_type == "three":
-        cards_text = get_three_card_text(personal_seed)
-        return f"{cards_text}\n\n💫 This spread shows the flow of time and how past influences\n   shape your present and future path."
-
+        reading = draw_three(personal_seed)
     elif reading_type == "celtic":
-        cards_text = get_celtic_cross_text(personal_seed)
-        return f"{cards_text}\n\n💫 This comprehensive spread provides deep insight into your\n   situation, challenges, and potential outcomes."
-
+        reading = celtic_cross(personal_seed)
+    elif reading_type in list_spreads():
+        reading = draw_spread(reading_type, personal_seed)
     else:
         try:
-            num_cards = int(reading_type)
-            cards_text = get_random_cards_text(num_cards, personal_seed)
-            return f"{cards_text}\n\n💫 These cards offer guidance and insight for your current journey."
+            spread = int(reading_type)
+            reading = _draw_cards(spread, personal_seed)
         except ValueError:
             return get_single_card_text(personal_seed)
+    return render_summary(reading, spread, personal_seed)
@@ -0,0 +1,83 @@
+"""
+Test cases for vectorized spread analytics.
+"""
+
+import unittest
+from src.core import draw_three, random_drop
+from src.deck import get_card_by_id, get_card_id
+
+try:
+    import numpy as np
+    from src.analytics import analyze_reading, encode_readings, spread_analytics
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _card(name, orientation="Upright"):
+    card = dict(get_card_by_id(get_card_id(name)))
+    card["orientation"] = orientation
+    return card
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestSpreadAnalytics(unittest.TestCase):
+    def test_analyze_reading(self):
+        """Test analytics of a known reading."""
+        reading = [
+            _card("The Fool"),
+            _card("The World", "Reversed"),
+            _card("Ace of Wands"),
+            _card("Ace of Cups", "Reversed"),
+        ]
+        stats = analyze_reading(reading)
+        self.assertEqual(stats["groups"]["Major Arcana"], 2)
+        self.assertEqual(
+            stats["elements"], {"Fire": 1, "Water": 1, "Air": 0, "Earth": 0}
+        )
+        self.assertAlmostEqual(stats["element_balance"], 0.5)
+        self.assertEqual(stats["major_ratio"], 0.5)
+        self.assertEqual(stats["reversed_ratio"], 0.5)
+        self.assertEqual(stats["repeated_ranks"], ["Ace"])
+        self.assertEqual(stats["numerology_sum"], 0 + 21 + 1 + 1)
+        self.assertEqual(stats["numerology_root"], 5)
+
+    def test_court_card_ranks(self):
+        """Test that court cards count as ranks 11 to 14."""
+        stats = analyze_reading([_card("Page of Swords"), _card("King of Pentacles")])
+        self.assertEqual(stats["numerology_sum"], 25)
+        self.assertEqual(stats["elements"]["Air"], 1)
+        self.assertEqual(stats["element_balance"], 0.5)
+
+    def test_batch_matches_single_readings(self):
+        """Test that batch results match per-reading analytics."""
+        readings = [draw_three() for _ in range(20)]
+        card_ids, is_reversed = encode_readings(readings)
+        self.assertEqual(card_ids.shape, (20, 3))
+        stats = spread_analytics(card_ids, is_reversed)
+        for i, reading in enumerate(readings):
+            single = analyze_reading(reading)
+            self.assertEqual(single["numerology_sum"], stats["numerology_sum"][i])
+            self.assertEqual(single["reversed_ratio"], stats["reversed_ratio"][i])
+            self.assertEqual(
+                list(single["groups"].values()), stats["group_counts"][i].tolist()
+            )
+
+    def test_only_majors(self):
+        """Test that spreads without Minor Arcana have zero element balance."""
+        stats = spread_analytics([[0, 1, 2]], [[False, False, True]])
+        self.assertEqual(stats["element_balance"][0], 0.0)
+        self.assertEqual(stats["repeated_ranks"][0], 0)
+        self.assertEqual(stats["numerology_root"][0], 3)
+
+    def test_invalid_input(self):
+        """Test that malformed inputs raise ValueError."""
+        with self.assertRaises(ValueError):
+            spread_analytics([[0, 78]], [[False, False]])
+        with self.assertRaises(ValueError):
+            spread_analytics([[0, 1]], [[False]])
+        with self.assertRaises(ValueError):
+            encode_readings([random_drop(2), random_drop(3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Test cases for balanced corpus generation.
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+def _collect(chunks):
+    chunks = list(chunks)
+    return (
+        np.concatenate([card_ids for card_ids, _ in chunks]),
+        np.concatenate([is_reversed for _, is_reversed in chunks]),
+    )
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestBalancedCorpus(unittest.TestCase):
+    def test_exact_balance(self):
+        """Test card, orientation and position counts over whole periods."""
+        from src.balanced import PERIOD, balanced_corpus
+
+        card_ids, is_reversed = _collect(balanced_corpus("celtic", 3 * PERIOD, seed=1))
+        self.assertEqual(card_ids.shape, (3 * PERIOD, 10))
+
+        by_orientation = np.bincount((card_ids * 2 + is_reversed).ravel())
+        self.assertEqual(set(by_orientation.tolist()), {3 * 10})
+
+        by_position = np.bincount((np.arange(10) * 78 + card_ids).ravel())
+        self.assertEqual(set(by_position.tolist()), {3 * 2})
+
+        by_both = np.bincount(
+            (np.arange(10) * 156 + card_ids * 2 + is_reversed).ravel()
+        )
+        self.assertEqual(set(by_both.tolist()), {3})
+
+    def test_readings_have_distinct_cards(self):
+        """Test that no reading repeats a card, even for the full deck."""
+        from src.balanced import balanced_corpus
+
+        for spread in (3, 78):
+            card_ids, _ = _collect(balanced_corpus(spread, 500, seed=2))
+            sorted_ids = np.sort(card_ids, axis=1)
+            self.assertFalse((sorted_ids[:, 1:] == sorted_ids[:, :-1]).any())
+
+    def test_partial_period(self):
+        """Test corpus sizes that are not a multiple of the period."""
+        from src.balanced import PERIOD, balanced_corpus
+
+        card_ids, _ = _collect(balanced_corpus("three", PERIOD + 50, seed=3))
+        self.assertEqual(len(card_ids), PERIOD + 50)
+        tail = card_ids[PERIOD:]
+        for position in range(3):
+            self.assertEqual(len(set(tail[:, position].tolist())), 50)
+
+    def test_shards_reassemble_corpus(self):
+        """Test that sharded output is the unsharded corpus, period by period."""
+        from src.balanced import PERIOD, balanced_corpus
+
+        count = 7 * PERIOD + 9
+        whole, _ = _collect(balanced_corpus(4, count, seed=4, chunk_size=PERIOD))
+        shards = [
+            list(
+                balanced_corpus(4, count, seed=4, chunk_size=PERIOD, shard=k, shards=3)
+            )
+            for k in range(3)
+        ]
+        periods = [shards[index % 3][index // 3][0] for index in range(8)]
+        np.testing.assert_array_equal(np.concatenate(periods), whole)
+
+    def test_chunking_and_seeds(self):
+        """Test chunk sizes and reproducibility from a seed."""
+        from src.balanced import PERIOD, balanced_corpus
+
+        chunks = list(
+            balanced_corpus("single", 5 * PERIOD, seed=5, chunk_size=2 * PERIOD)
+        )
+        self.assertEqual([len(ids) for ids, _ in chunks], [312, 312, 156])
+        again, _ = _collect(balanced_corpus("single", 5 * PERIOD, seed=5))
+        np.testing.assert_array_equal(np.concatenate([ids for ids, _ in chunks]), again)
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments raise ValueError immediately."""
+        from src.balanced import balanced_corpus
+
+        with self.assertRaises(ValueError):
+            balanced_corpus(3, 0)
+        with self.assertRaises(ValueError):
+            balanced_corpus(3, 10, seed=1, shard=2, shards=2)
+        with self.assertRaises(ValueError):
+            balanced_corpus(3, 10, shards=2)
+        with self.assertRaises(ValueError):
+            balanced_corpus(79, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
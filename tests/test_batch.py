@@ -0,0 +1,103 @@
+"""
+Test cases for vectorized batch drawing and consensus readings.
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestDrawBatch(unittest.TestCase):
+    def test_rows_are_unique_cards(self):
+        """Test that every row is a draw without replacement."""
+        from src.batch import draw_batch
+
+        card_ids, is_reversed = draw_batch(10, 1000, rng=1)
+        self.assertEqual(card_ids.shape, (1000, 10))
+        self.assertEqual(card_ids.dtype, np.uint8)
+        self.assertEqual(is_reversed.dtype, bool)
+        sorted_ids = np.sort(card_ids, axis=1)
+        self.assertFalse((sorted_ids[:, 1:] == sorted_ids[:, :-1]).any())
+
+    def test_positions_are_uniform(self):
+        """Test that each position sees every card about equally often."""
+        from src.batch import draw_batch
+
+        card_ids, _ = draw_batch(3, 78000, rng=2)
+        counts = np.bincount(card_ids[:, 2], minlength=78)
+        self.assertLess(abs(counts - 1000).max(), 150)
+
+    def test_full_deck_is_permutation(self):
+        """Test that drawing 78 cards returns a permutation of the deck."""
+        from src.batch import draw_batch
+
+        card_ids, _ = draw_batch(78, 5, rng=3)
+        for row in card_ids:
+            self.assertEqual(sorted(row.tolist()), list(range(78)))
+
+    def test_weights_exclude_cards(self):
+        """Test that zero weights are respected in batches."""
+        from src.batch import draw_batch
+
+        card_ids, _ = draw_batch(5, 500, weights={"Major Arcana": 0.0}, rng=4)
+        self.assertGreaterEqual(card_ids.min(), 22)
+
+    def test_invalid_arguments(self):
+        """Test that invalid sizes raise ValueError."""
+        from src.batch import draw_batch
+
+        with self.assertRaises(ValueError):
+            draw_batch(79, 10)
+        with self.assertRaises(ValueError):
+            draw_batch(3, 0)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestConsensusReading(unittest.TestCase):
+    def test_celtic_structure(self):
+        """Test that consensus readings keep the spread shape."""
+        from src.batch import consensus_reading
+
+        reading = consensus_reading("celtic", "INFP", trials=2000)
+        self.assertEqual(len(reading), 10)
+        self.assertIn("Final Outcome", reading)
+        for card in reading.values():
+            low, high = card["confidence_interval"]
+            self.assertLessEqual(low, card["frequency"])
+            self.assertLessEqual(card["frequency"], high)
+            self.assertGreaterEqual(card["orientation_frequency"], 0.5)
+            self.assertIn(card["orientation"], ["Upright", "Reversed"])
+
+    def test_weighted_consensus_finds_favoured_card(self):
+        """Test that a heavily weighted card wins the consensus."""
+        from src.batch import consensus_reading
+
+        card = consensus_reading("single", trials=5000, weights={"The Tower": 500.0})
+        self.assertEqual(card["name"], "The Tower")
+        self.assertGreater(card["frequency"], 0.8)
+
+    def test_consensus_cards_are_distinct(self):
+        """Test that a card favoured everywhere fills only one position."""
+        from src.batch import consensus_reading
+
+        reading = consensus_reading(
+            "celtic", trials=2000, weights={"The Tower": 1000.0}
+        )
+        names = [card["name"] for card in reading.values()]
+        self.assertEqual(len(set(names)), 10)
+        self.assertEqual(names.count("The Tower"), 1)
+
+    def test_numeric_spread(self):
+        """Test that numeric spreads return a list."""
+        from src.batch import consensus_reading
+
+        cards = consensus_reading(4, trials=100)
+        self.assertEqual(len(cards), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Test cases for API draw micro-batching.
+"""
+
+import asyncio
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    from api.batcher import DrawBatcher
+except ImportError:  # pragma: no cover - optional dependency
+    DrawBatcher = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+@unittest.skipIf(DrawBatcher is None, "the api extra is not installed")
+class TestDrawBatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_window_collects_requests(self):
+        """Test that requests within one window share a batch draw."""
+        batcher = DrawBatcher(window=0.01, max_batch=1000)
+        readings = await asyncio.gather(*[batcher.draw(3) for _ in range(50)])
+        self.assertEqual(len(readings), 50)
+        for cards in readings:
+            self.assertEqual(len({card["name"] for card in cards}), 3)
+        self.assertEqual(batcher.batches, 1)
+        self.assertEqual(batcher.largest_batch, 50)
+
+    async def test_max_batch_flushes_early(self):
+        """Test that a full batch is drawn without waiting for the window."""
+        batcher = DrawBatcher(window=60.0, max_batch=10)
+        readings = await asyncio.wait_for(
+            asyncio.gather(*[batcher.draw(1) for _ in range(10)]), timeout=5
+        )
+        self.assertEqual(len(readings), 10)
+        self.assertEqual(batcher.stats()["mean_batch"], 10.0)
+
+    async def test_sizes_batched_separately(self):
+        """Test that each reading size gets its own batch."""
+        batcher = DrawBatcher(window=0.001)
+        singles, celtic = await asyncio.gather(batcher.draw(1), batcher.draw(10))
+        self.assertEqual((len(singles), len(celtic)), (1, 10))
+        self.assertEqual(batcher.batches, 2)
+
+    def test_invalid_settings(self):
+        """Test that invalid settings raise ValueError."""
+        with self.assertRaises(ValueError):
+            DrawBatcher(max_batch=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Test cases for the pre-serialized card catalog endpoints.
+"""
+
+import gzip
+import json
+import unittest
+
+try:
+    from fastapi.testclient import TestClient
+    from api.main import app
+except ImportError:  # pragma: no cover - optional dependency
+    TestClient = None
+
+
+@unittest.skipIf(TestClient is None, "the api extra is not installed")
+class TestCatalogEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def get(self, path, **headers):
+        headers.setdefault("Accept-Encoding", "identity")
+        return self.client.get("/api/v1/cards" + path, headers=headers)
+
+    def test_listings(self):
+        """Test the deck info, arcana and suit listings."""
+        self.assertEqual(self.get("/deck-info").json()["total_cards"], 78)
+        major = self.get("/major-arcana").json()
+        self.assertEqual(len(major), 22)
+        self.assertEqual(major[0]["name"], "The Fool")
+        self.assertIsNone(major[0]["suit"])
+
+        minor = self.get("/minor-arcana").json()
+        self.assertEqual(len(minor), 56)
+        self.assertEqual({card["arcana"] for card in minor}, {"minor"})
+        self.assertEqual(
+            {card["suit"] for card in minor}, {"Wands", "Cups", "Swords", "Pentacles"}
+        )
+
+        cups = self.get("/suit/CUPS").json()
+        self.assertEqual(len(cups), 14)
+        self.assertEqual({card["suit"] for card in cups}, {"Cups"})
+        self.assertEqual(self.get("/suit/stars").status_code, 404)
+
+    def test_etag_and_not_modified(self):
+        """Test strong ETags and 304 responses for If-None-Match."""
+        response = self.get("/major-arcana")
+        etag = response.headers["etag"]
+        self.assertFalse(etag.startswith("W/"))
+        self.assertEqual(response.headers["cache-control"], "public, max-age=3600")
+        self.assertEqual(self.get("/major-arcana").headers["etag"], etag)
+        self.assertNotEqual(self.get("/minor-arcana").headers["etag"], etag)
+
+        cached = self.get("/major-arcana", **{"If-None-Match": f'"other", {etag}'})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+        self.assertEqual(cached.headers["etag"], etag)
+        stale = self.get("/major-arcana", **{"If-None-Match": '"other"'})
+        self.assertEqual(stale.status_code, 200)
+
+    def test_gzip_variant(self):
+        """Test that gzip clients get the pre-compressed body."""
+        plain = self.get("/minor-arcana")
+        response = self.client.get(
+            "/api/v1/cards/minor-arcana", headers={"Accept-Encoding": "gzip"}
+        )
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["vary"])
+        self.assertNotEqual(response.headers["etag"], plain.headers["etag"])
+        self.assertEqual(response.content, plain.content)
+        self.assertLess(int(response.headers["content-length"]), len(plain.content))
+
+        refused = self.get("/minor-arcana", **{"Accept-Encoding": "gzip;q=0"})
+        self.assertNotIn("content-encoding", refused.headers)
+
+    def test_bodies_match_models(self):
+        """Test that cached bytes equal the response models' JSON encoding."""
+        from api.catalog import get_catalog
+        from api.models import CardDetailResponse
+
+        body = get_catalog()["major-arcana"].body
+        cards = json.loads(body)
+        self.assertEqual(
+            cards, [CardDetailResponse(**card).model_dump() for card in cards]
+        )
+        self.assertEqual(gzip.decompress(get_catalog()["major-arcana"].gzip_body), body)
+
+
+if __name__ == "__main__":
+    unittest.main()
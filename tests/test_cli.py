@@ -2,10 +2,20 @@
 Test cases for the CLI functionality.
 """
 
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 import sys
-from io import StringIO
+from io import BytesIO, StringIO
+
+from src.core import draw_from_seed
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 
 class TestCLI(unittest.TestCase):
@@ -150,5 +160,106 @@ class TestCLI(unittest.TestCase):
         self.assertNotEqual(output1, output2)
 
 
+class TestBatchCommand(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, *argv):
+        path = os.path.join(self.tmp.name, "out")
+        with patch("sys.argv", ["tarot-reader", "batch", *argv, "--out", path]):
+            with patch("sys.stderr", new_callable=StringIO) as stderr:
+                from src.__main__ import main
+
+                main()
+        with open(path, "rb") as f:
+            return f.read(), stderr.getvalue()
+
+    def test_count_jsonl(self):
+        """Test a counted JSONL corpus with progress on stderr."""
+        data, stderr = self._run("--spread", "celtic", "--count", "2500")
+        readings = [json.loads(line) for line in data.splitlines()]
+        self.assertEqual(len(readings), 2500)
+        self.assertEqual(len(readings[0]), 10)
+        self.assertIn("Wrote 2500 readings", stderr)
+        self.assertIn("readings/s", stderr)
+
+    def test_seeded_output_is_independent_of_workers(self):
+        """Test that --seed output is identical with one or two workers."""
+        args = ("--spread", "three", "--count", "3000", "--seed", "5", "-q")
+        first, stderr = self._run(*args)
+        second, _ = self._run(*args, "--workers", "2")
+        self.assertEqual(first, second)
+        self.assertEqual(stderr, "")
+
+    def test_input_seeds_keep_order(self):
+        """Test one seeded reading per input row, in input order."""
+        seeds = list(range(1500)) + ["alice"]
+        path = os.path.join(self.tmp.name, "seeds.jsonl")
+        with open(path, "w") as f:
+            for seed in seeds:
+                f.write(json.dumps({"seed": seed}) + "\n")
+        data, _ = self._run("--spread", "three", "--input", path, "-w", "2", "-q")
+        readings = [json.loads(line) for line in data.splitlines()]
+        self.assertEqual(
+            readings[:1500], [draw_from_seed("three", s) for s in seeds[:1500]]
+        )
+        self.assertEqual(len(readings), 1501)
+
+    def test_text_format(self):
+        """Test that text output matches the terminal renderer."""
+        from src.text_formatter import render
+
+        path = os.path.join(self.tmp.name, "seeds.jsonl")
+        with open(path, "w") as f:
+            f.write("1\n2\n")
+        data, _ = self._run("--spread", "celtic", "-i", path, "-f", "text", "-q")
+        expected = "".join(
+            render(draw_from_seed("celtic", seed)) + "\n\n" for seed in (1, 2)
+        )
+        self.assertEqual(data.decode(), expected)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_npy_format(self):
+        """Test that npy output loads as card id and orientation records."""
+        from src.deck import get_card_id
+
+        data, _ = self._run("--spread", "5", "--count", "100", "-f", "npy", "-q")
+        records = np.load(BytesIO(data))
+        self.assertEqual(records.shape, (100,))
+        self.assertEqual(records["cards"].shape, (100, 5))
+        self.assertTrue((records["cards"] < 78).all())
+
+        path = os.path.join(self.tmp.name, "seeds.jsonl")
+        with open(path, "w") as f:
+            f.write("7\n")
+        data, _ = self._run("--spread", "three", "-i", path, "-f", "npy", "-q")
+        record = np.load(BytesIO(data))[0]
+        reading = list(draw_from_seed("three", 7).values())
+        self.assertEqual(
+            record["cards"].tolist(), [get_card_id(card["name"]) for card in reading]
+        )
+        self.assertEqual(
+            record["reversed"].tolist(),
+            [card["orientation"] == "Reversed" for card in reading],
+        )
+
+    def test_invalid_arguments(self):
+        """Test that bad spreads and missing sources exit with an error."""
+        for argv in (
+            ["batch", "--spread", "nope", "--count", "1"],
+            ["batch", "--count", "1", "--workers", "0"],
+            ["batch", "--spread", "single"],
+        ):
+            with patch("sys.argv", ["tarot-reader", *argv]):
+                with patch("sys.stderr", new_callable=StringIO):
+                    with self.assertRaises(SystemExit):
+                        from src.__main__ import main
+
+                        main()
+
+
 if __name__ == "__main__":
     unittest.main()
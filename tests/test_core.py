@@ -4,7 +4,19 @@ Test cases for the core tarot reading functionality.
 
 import unittest
 from unittest.mock import patch
-from src.core import draw_single, draw_three, celtic_cross, _draw_cards, random_drop, _create_time_seed
+from src.core import (
+    draw_single,
+    draw_three,
+    celtic_cross,
+    _draw_cards,
+    random_drop,
+    _create_time_seed,
+    draw_constrained,
+    draw_from_seed,
+    Shoe,
+    _AliasTable,
+    _compile_weights,
+)
 
 
 class TestCore(unittest.TestCase):
@@ -237,6 +249,7 @@ class TestCore(unittest.TestCase):
     def test_create_time_seed_changes_over_time(self):
         """Test that _create_time_seed produces different values."""
         import time
+
         seed1 = _create_time_seed()
         time.sleep(0.01)  # Small delay
         seed2 = _create_time_seed()
@@ -244,5 +257,231 @@ class TestCore(unittest.TestCase):
         self.assertNotEqual(seed1, seed2)
 
 
+class TestWeightedDraws(unittest.TestCase):
+    def test_alias_table_matches_distribution(self):
+        """Test that alias table sampling follows the given weights."""
+        import random
+        from collections import Counter
+
+        table = _AliasTable((1.0, 0.0, 3.0))
+        random.seed(7)
+        counts = Counter(table.sample() for _ in range(20000))
+        random.seed()
+        self.assertEqual(counts[1], 0)
+        self.assertAlmostEqual(counts[2] / 20000, 0.75, delta=0.02)
+
+    def test_zero_weight_excludes_cards(self):
+        """Test that zero-weighted suits never appear."""
+        weights = {"Major Arcana": 0.0, "Wands": 0.0, "Swords": 0.0}
+        for _ in range(20):
+            reading = celtic_cross(weights=weights)
+            for card in reading.values():
+                self.assertRegex(card["name"], "of (Cups|Pentacles)$")
+
+    def test_weighted_spread_has_unique_cards(self):
+        """Test that weighted spreads still draw without replacement."""
+        cards = _draw_cards(28, weights={"Cups": 50.0})
+        names = [card["name"] for card in cards]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_weighted_single_card(self):
+        """Test that a profile with one positive card always draws it."""
+        from src.deck import MAJOR_ARCANA, MINOR_ARCANA
+
+        weights = {suit: 0.0 for suit in MINOR_ARCANA}
+        weights.update({card["name"]: 0.0 for card in MAJOR_ARCANA})
+        with self.assertRaises(ValueError):
+            draw_single(weights=weights)
+
+        weights["The Tower"] = 1.0
+        for _ in range(10):
+            self.assertEqual(draw_single(weights=weights)["name"], "The Tower")
+
+    def test_weight_profiles_are_cached(self):
+        """Test that equal profiles reuse the compiled alias table."""
+        _compile_weights.cache_clear()
+        draw_three(weights={"Cups": 2.0, "Wands": 0.5})
+        draw_three(weights={"Wands": 0.5, "Cups": 2.0})
+        self.assertEqual(_compile_weights.cache_info().misses, 1)
+        self.assertEqual(_compile_weights.cache_info().hits, 1)
+
+    def test_invalid_weights(self):
+        """Test that unknown keys and negative weights raise ValueError."""
+        with self.assertRaises(ValueError):
+            draw_single(weights={"The Joker": 2.0})
+        with self.assertRaises(ValueError):
+            draw_single(weights={"Cups": -1.0})
+
+    def test_too_few_weighted_cards(self):
+        """Test that spreads larger than the positive support are rejected."""
+        weights = {"Major Arcana": 0.0, "Wands": 0.0, "Swords": 0.0, "Pentacles": 0.0}
+        with self.assertRaises(ValueError):
+            _draw_cards(15, weights=weights)
+        self.assertEqual(len(_draw_cards(14, weights=weights)), 14)
+
+
+class TestConstrainedDraws(unittest.TestCase):
+    def test_at_least_one_major(self):
+        """Test that min_counts guarantees Major Arcana cards."""
+        for _ in range(50):
+            reading = draw_constrained("three", {"min_counts": {"Major Arcana": 2}})
+            majors = [card for card in reading.values() if "number" in card]
+            self.assertGreaterEqual(len(majors), 2)
+
+    def test_only_selected_suits(self):
+        """Test that groups restrict the card pool."""
+        reading = draw_constrained("celtic", {"groups": ["Cups", "Wands"]})
+        self.assertEqual(len(reading), 10)
+        for card in reading.values():
+            self.assertRegex(card["name"], "of (Cups|Wands)$")
+
+    def test_exact_reversed_count(self):
+        """Test that an exact reversed count is always met."""
+        for _ in range(20):
+            cards = draw_constrained(7, {"reversed": 2})
+            reversed_cards = [c for c in cards if c["orientation"] == "Reversed"]
+            self.assertEqual(len(reversed_cards), 2)
+
+    def test_exclude_previous_reading(self):
+        """Test that cards from a previous reading are not repeated."""
+        previous = celtic_cross()
+        previous_names = {card["name"] for card in previous.values()}
+        cards = draw_constrained(68, {"exclude": previous})
+        self.assertFalse(previous_names & {card["name"] for card in cards})
+
+    def test_single_returns_card(self):
+        """Test that the single spread returns a card dict."""
+        card = draw_constrained("single", {"groups": ["Major Arcana"]})
+        self.assertIn("number", card)
+
+    def test_max_counts(self):
+        """Test that max_counts caps a group."""
+        for _ in range(20):
+            cards = draw_constrained(30, {"max_counts": {"Major Arcana": 0}})
+            self.assertFalse(any("number" in card for card in cards))
+
+    def test_unsatisfiable_constraints(self):
+        """Test that impossible constraints raise ValueError up front."""
+        with self.assertRaises(ValueError):
+            draw_constrained(
+                "celtic",
+                {
+                    "groups": ["Cups"],
+                    "exclude": [
+                        "Ace of Cups",
+                        "Two of Cups",
+                        "Three of Cups",
+                        "Four of Cups",
+                        "Five of Cups",
+                    ],
+                },
+            )
+        with self.assertRaises(ValueError):
+            draw_constrained("three", {"min_counts": {"Cups": 2, "Wands": 2}})
+        with self.assertRaises(ValueError):
+            draw_constrained("three", {"reversed": 4})
+        with self.assertRaises(ValueError):
+            draw_constrained("three", {"min_counts": {"Cups": 1}, "groups": ["Wands"]})
+        with self.assertRaises(ValueError):
+            draw_constrained("three", {"colour": "red"})
+        with self.assertRaises(ValueError):
+            draw_constrained("pentagram")
+
+
+class TestDrawFromSeed(unittest.TestCase):
+    def test_same_seed_same_reading(self):
+        """Test that explicit seeds reproduce readings of every shape."""
+        for spread in ["single", "three", "celtic", "guidance", 7]:
+            self.assertEqual(draw_from_seed(spread, 42), draw_from_seed(spread, 42))
+        self.assertIn("name", draw_from_seed("single", 1))
+        self.assertEqual(len(draw_from_seed(7, 1)), 7)
+
+    def test_matches_seeded_draws(self):
+        """Test that draw_from_seed follows the seeded spread functions."""
+        with patch("src.core._create_personal_seed", return_value=1234):
+            self.assertEqual(draw_three("INFP"), draw_from_seed("three", 1234))
+            self.assertEqual(celtic_cross("INFP"), draw_from_seed("celtic", 1234))
+
+    def test_global_state_untouched(self):
+        """Test that explicit seeds do not reseed the global random module."""
+        import random
+
+        random.seed(5)
+        expected = random.random()
+        random.seed(5)
+        draw_from_seed("celtic", 99)
+        self.assertEqual(random.random(), expected)
+
+
+class TestShoe(unittest.TestCase):
+    def test_deal_respects_card_counts(self):
+        """Test that a full shoe deals each card exactly num_decks times."""
+        from collections import Counter
+
+        shoe = Shoe(num_decks=3, penetration=1.0)
+        cards = shoe.deal(3 * 78)
+        counts = Counter(card["name"] for card in cards)
+        self.assertEqual(len(counts), 78)
+        self.assertEqual(set(counts.values()), {3})
+        self.assertEqual(shoe.remaining, 0)
+        self.assertEqual(shoe.reshuffles, 0)
+
+    def test_reshuffle_at_penetration(self):
+        """Test that the shoe reshuffles before the deal past penetration."""
+        shoe = Shoe(num_decks=2, penetration=0.5)
+        shoe.deal(78)
+        self.assertEqual(shoe.dealt, 78)
+        shoe.deal(1)
+        self.assertEqual(shoe.reshuffles, 1)
+        self.assertEqual(shoe.dealt, 1)
+
+    def test_deal_more_than_shoe(self):
+        """Test that long deals reshuffle mid-deal when the shoe empties."""
+        shoe = Shoe(num_decks=1)
+        cards = shoe.deal(200)
+        self.assertEqual(len(cards), 200)
+        self.assertEqual(shoe.reshuffles, 2)
+
+    def test_deal_with_replacement(self):
+        """Test that replacement draws leave the shoe untouched."""
+        shoe = Shoe(num_decks=1)
+        cards = shoe.deal(500, replace=True)
+        self.assertEqual(len(cards), 500)
+        self.assertEqual(shoe.remaining, 78)
+        self.assertIn(cards[0]["orientation"], ["Upright", "Reversed"])
+
+    def test_invalid_shoe(self):
+        """Test that invalid shoe settings raise ValueError."""
+        with self.assertRaises(ValueError):
+            Shoe(num_decks=0)
+        with self.assertRaises(ValueError):
+            Shoe(penetration=0)
+        with self.assertRaises(ValueError):
+            Shoe().deal(0)
+
+    def test_deal_ids_bulk(self):
+        """Test that bulk deals keep counts consistent with deal()."""
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        from src.deck import get_card_id
+
+        shoe = Shoe(num_decks=2, penetration=1.0)
+        card_ids, is_reversed = shoe.deal_ids(100)
+        self.assertEqual(card_ids.dtype, np.uint8)
+        self.assertEqual(is_reversed.dtype, bool)
+        self.assertLessEqual(np.bincount(card_ids).max(), 2)
+        self.assertEqual(shoe.remaining, 56)
+
+        cards = shoe.deal(56)
+        names = [card["name"] for card in cards]
+        combined = np.bincount(
+            np.concatenate([card_ids, [get_card_id(n) for n in names]]),
+            minlength=78,
+        )
+        self.assertTrue((combined == 2).all())
+
+
 if __name__ == "__main__":
     unittest.main()
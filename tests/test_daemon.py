@@ -0,0 +1,170 @@
+"""
+Test cases for the warm reading daemon.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        from src.daemon import ReadingServer
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "tarot.sock")
+        self.server = ReadingServer(self.path)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.thread.join()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_readings(self):
+        """Test reading, ping and error responses."""
+        from src.daemon import send_request
+
+        response = send_request(self.path, {"type": "celtic", "seed": "INFP"})
+        self.assertIn("CELTIC CROSS", response["output"])
+        self.assertIn("INFP", response["output"])
+        self.assertTrue(send_request(self.path, {"cmd": "ping"})["ok"])
+        self.assertIn("error", send_request(self.path, {"type": "nope"}))
+        self.assertIn("error", send_request(self.path, {"seed": 5}))
+        for reading_type in (["single"], {"a": 1}, 3):
+            response = send_request(self.path, {"type": reading_type})
+            self.assertEqual(response, {"error": "type must be a string"})
+
+    def test_many_requests_per_connection(self):
+        """Test that one connection can send several requests."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.path)
+            sock.sendall(b'{"type": "single"}\n[1]\nnot json\n')
+            with sock.makefile("rb") as stream:
+                lines = [stream.readline() for _ in range(3)]
+        self.assertIn(b'"output"', lines[0])
+        self.assertIn(b"JSON object", lines[1])
+        self.assertIn(b"not valid JSON", lines[2])
+
+    def test_second_daemon_is_refused(self):
+        """Test that a live socket is not replaced."""
+        from src.daemon import ReadingServer
+
+        with self.assertRaises(OSError):
+            ReadingServer(self.path)
+
+    def test_cli_client(self):
+        """Test that --socket prints the daemon's reading."""
+        with patch("sys.argv", ["tarot-reader", "--socket", self.path, "-t", "three"]):
+            with patch("builtins.print") as mock_print:
+                from src.__main__ import main
+
+                main()
+                mock_print.assert_called_once()
+                self.assertIn("PAST", mock_print.call_args[0][0].upper())
+
+    def test_client_loads_no_reading_modules(self):
+        """Test that the --socket client skips the deck and renderers."""
+        code = (
+            "import sys\n"
+            "from src.__main__ import main\n"
+            f"sys.argv = ['tarot-reader', '--socket', {self.path!r}]\n"
+            "main()\n"
+            "print(sorted(m for m in ('src.core', 'src.deck', 'src.text_formatter')"
+            " if m in sys.modules))\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertTrue(result.stdout.rstrip().endswith("[]"), result.stdout)
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+class TestDaemonStartup(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "tarot.sock")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_stale_socket_is_replaced(self):
+        """Test that a socket file left by a dead daemon is replaced."""
+        from src.daemon import ReadingServer
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(self.path)
+        with ReadingServer(self.path):
+            self.assertTrue(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(self.path + ".lock"))
+
+    def test_autostart_and_stop(self):
+        """Test that the client starts a daemon on first use."""
+        from src.daemon import request_reading, send_request
+
+        text = request_reading(self.path, "single")
+        self.assertTrue(text)
+        try:
+            self.assertTrue(send_request(self.path, {"cmd": "ping"})["ok"])
+        finally:
+            send_request(self.path, {"cmd": "stop"})
+
+    def test_fallback_without_daemon(self):
+        """Test that the CLI reads locally when no daemon can be reached."""
+        argv = ["tarot-reader", "--socket", self.path, "-t", "single"]
+        with patch("sys.argv", argv):
+            with patch("src.daemon.start_daemon", return_value=False):
+                with patch("sys.stderr", new_callable=StringIO) as stderr:
+                    with patch("builtins.print") as mock_print:
+                        from src.__main__ import main
+
+                        main()
+                        mock_print.assert_called_once()
+        self.assertIn("reading locally", stderr.getvalue())
+
+
+class TestUnsupportedPlatform(unittest.TestCase):
+    def test_client_reads_locally(self):
+        """Test that --socket falls back where the daemon cannot import."""
+        argv = ["tarot-reader", "--socket", "tarot.sock", "-t", "single"]
+        with patch.dict("sys.modules", {"src.daemon": None}):
+            with patch("sys.argv", argv):
+                with patch("sys.stderr", new_callable=StringIO) as stderr:
+                    with patch("builtins.print") as mock_print:
+                        from src.__main__ import main
+
+                        main()
+                        mock_print.assert_called_once()
+        self.assertIn("unsupported on this platform", stderr.getvalue())
+
+    def test_serve_reports_unsupported(self):
+        """Test that serve exits with an error where the daemon cannot import."""
+        argv = ["tarot-reader", "serve", "--socket", "tarot.sock"]
+        with patch.dict("sys.modules", {"src.daemon": None}):
+            with patch("sys.argv", argv):
+                with patch("sys.stderr", new_callable=StringIO) as stderr:
+                    with self.assertRaises(SystemExit) as cm:
+                        from src.__main__ import main
+
+                        main()
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn("unsupported on this platform", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
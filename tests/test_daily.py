@@ -0,0 +1,77 @@
+"""
+Test cases for the deterministic card of the day and precomputed calendars.
+"""
+
+import os
+import tempfile
+import unittest
+from collections import Counter
+from datetime import date
+from src.daily import DailyCalendar, build_calendar, daily_card
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class TestDailyCard(unittest.TestCase):
+    def test_deterministic_per_seed_and_date(self):
+        """Test that the same seed and date always give the same card."""
+        day = date(2026, 3, 14)
+        self.assertEqual(daily_card("INFP", day), daily_card("INFP", day))
+        self.assertIn(daily_card("INFP", day)["orientation"], ["Upright", "Reversed"])
+
+    def test_varies_across_days(self):
+        """Test that a seed's card changes from day to day."""
+        cards = {daily_card("INFP", date(2026, 1, day))["name"] for day in range(1, 29)}
+        self.assertGreater(len(cards), 10)
+
+    def test_covers_deck(self):
+        """Test that many seeds spread evenly over the whole deck."""
+        counts = Counter(
+            daily_card(f"user{i}", date(2026, 1, 1))["name"] for i in range(7800)
+        )
+        self.assertEqual(len(counts), 78)
+        self.assertLess(max(counts.values()), 200)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestDailyCalendar(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".cal")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_calendar_matches_daily_card(self):
+        """Test that precomputed cards equal live daily cards."""
+        seeds = [f"user{i}" for i in range(500)] + ["user0", ""]
+        written = build_calendar(self.path, seeds, date(2026, 1, 1), days=60)
+        self.assertEqual(written, 501)
+
+        with DailyCalendar(self.path) as calendar:
+            self.assertEqual(calendar.end, date(2026, 3, 1))
+            for seed in seeds[::25]:
+                for day in (date(2026, 1, 1), date(2026, 2, 9), date(2026, 3, 1)):
+                    self.assertEqual(calendar.lookup(seed, day), daily_card(seed, day))
+
+    def test_missing_entries(self):
+        """Test that unknown seeds and dates outside the range return None."""
+        build_calendar(self.path, ["INFP"], date(2026, 1, 1), days=7)
+        with DailyCalendar(self.path) as calendar:
+            self.assertIsNone(calendar.lookup("ENTJ", date(2026, 1, 2)))
+            self.assertIsNone(calendar.lookup("INFP", date(2026, 1, 8)))
+            self.assertIsNone(calendar.lookup("INFP", date(2025, 12, 31)))
+
+    def test_invalid_file(self):
+        """Test that non-calendar files raise ValueError."""
+        with open(self.path, "wb") as f:
+            f.write(b"not a calendar file")
+        with self.assertRaises(ValueError):
+            DailyCalendar(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Test cases for columnar reading datasets.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.core import draw_from_seed
+from src.spreads import register_spread
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestDataset(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "readings.tset")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_batch_round_trip(self):
+        """Test that batch arrays come back unchanged as zero-copy columns."""
+        from src.batch import draw_batch
+        from src.dataset import Dataset, DatasetWriter
+
+        card_ids, is_reversed = draw_batch(10, 1000, rng=1)
+        with DatasetWriter(self.path, width=10, buffer_rows=64) as writer:
+            writer.write_batch(card_ids[:10], is_reversed[:10], "celtic")
+            writer.write_batch(card_ids[10:], is_reversed[10:], "celtic")
+
+        with Dataset(self.path) as dataset:
+            self.assertEqual(len(dataset), 1000)
+            self.assertIsInstance(dataset.card_ids, np.memmap)
+            ids, flags = dataset.arrays()
+            np.testing.assert_array_equal(ids, card_ids)
+            np.testing.assert_array_equal(flags, is_reversed)
+
+            view = dataset[100:200]
+            self.assertEqual(len(view), 100)
+            np.testing.assert_array_equal(view.card_ids, card_ids[100:200])
+            self.assertEqual(list(view[0]), list(dataset[100]))
+
+    def test_readings_keep_their_shape(self):
+        """Test that single, spread and count readings decode as drawn."""
+        from src.dataset import Dataset, DatasetWriter
+
+        readings = [
+            ("single", draw_from_seed("single", 1), 1),
+            ("three", draw_from_seed("three", 2), None),
+            ("celtic", draw_from_seed("celtic", 3), 3),
+            (5, draw_from_seed(5, 4), None),
+        ]
+        with DatasetWriter(self.path, width=10) as writer:
+            for spread, reading, seed in readings:
+                writer.write(reading, seed=seed)
+
+        with Dataset(self.path) as dataset:
+            self.assertEqual(list(dataset), [reading for _, reading, _ in readings])
+            entries = list(dataset.entries())
+            self.assertEqual(
+                [entry["spread"] for entry in entries], ["single", "three", "celtic", 5]
+            )
+            self.assertEqual([entry["seed"] for entry in entries], [1, None, 3, None])
+            self.assertEqual(dataset[-1], readings[-1][1])
+
+    def test_positions_come_from_the_file(self):
+        """Test that spreads decode without, or despite, the registry."""
+        from src import spreads
+        from src.dataset import Dataset, DatasetWriter
+
+        register_spread({"name": "test_pair", "positions": ["First", "Second"]})
+        reading = draw_from_seed("test_pair", 1)
+        with DatasetWriter(self.path, width=3) as writer:
+            writer.write(reading)
+
+        register_spread({"name": "test_pair", "positions": ["Left", "Right"]})
+        with Dataset(self.path) as dataset:
+            self.assertEqual(dataset[0], reading)
+        with patch.dict(spreads._REGISTRY):
+            del spreads._REGISTRY["test_pair"]
+            with Dataset(self.path) as dataset:
+                self.assertEqual(dataset[0], reading)
+
+    def test_width_is_enforced(self):
+        """Test that readings wider than the record are rejected."""
+        from src.dataset import DatasetWriter
+
+        with DatasetWriter(self.path, width=3) as writer:
+            with self.assertRaises(ValueError):
+                writer.write(draw_from_seed("celtic", 1))
+        with self.assertRaises(ValueError):
+            DatasetWriter(self.path, width=79)
+
+    def test_torn_tail_is_ignored(self):
+        """Test that a partial final record does not break reading."""
+        from src.dataset import Dataset, DatasetWriter
+
+        with DatasetWriter(self.path, width=3) as writer:
+            writer.write(draw_from_seed("three", 1))
+            writer.write(draw_from_seed("three", 2))
+        with open(self.path, "ab") as f:
+            f.write(b"\x01\x02")
+        with Dataset(self.path) as dataset:
+            self.assertEqual(len(dataset), 2)
+
+    def test_rejects_other_files(self):
+        """Test that non-dataset files raise ValueError."""
+        from src.dataset import Dataset
+
+        with open(self.path, "wb") as f:
+            f.write(b"not a dataset")
+        with self.assertRaises(ValueError):
+            Dataset(self.path)
+
+    def test_jsonl_round_trip(self):
+        """Test streaming conversion to and from JSONL."""
+        from src.dataset import Dataset, dataset_to_jsonl, jsonl_to_dataset
+
+        lines = [
+            json.dumps(draw_from_seed("three", 1)),
+            json.dumps(
+                {"spread": "celtic", "seed": 7, "reading": draw_from_seed("celtic", 7)}
+            ),
+            "",
+            json.dumps(draw_from_seed(2, 3)),
+        ]
+        count = jsonl_to_dataset(io.StringIO("\n".join(lines)), self.path)
+        self.assertEqual(count, 3)
+
+        output = io.StringIO()
+        self.assertEqual(dataset_to_jsonl(self.path, output), 3)
+        entries = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(entries[1]["seed"], 7)
+        self.assertEqual(entries[1]["reading"], draw_from_seed("celtic", 7))
+        self.assertEqual(entries[2]["spread"], 2)
+
+        copy = os.path.join(self.tmp.name, "copy.tset")
+        output.seek(0)
+        jsonl_to_dataset(output, copy)
+        with Dataset(self.path) as first, Dataset(copy) as second:
+            np.testing.assert_array_equal(first.records, second.records)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Test cases for dealer sessions and the session store.
+"""
+
+import threading
+import unittest
+from src.dealer import Dealer, SessionStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDealer(unittest.TestCase):
+    def test_deals_whole_deck_without_repeats(self):
+        """Test that a dealer deals all 78 cards exactly once."""
+        dealer = Dealer()
+        cards = dealer.deal(30) + dealer.deal(48)
+        self.assertEqual(len({card["name"] for card in cards}), 78)
+        self.assertEqual(dealer.remaining, 0)
+        for card in cards:
+            self.assertIn(card["orientation"], ["Upright", "Reversed"])
+
+    def test_exhausted_deck(self):
+        """Test that dealing past the end of the deck raises ValueError."""
+        dealer = Dealer()
+        dealer.deal(77)
+        with self.assertRaises(ValueError):
+            dealer.deal(2)
+        with self.assertRaises(ValueError):
+            dealer.deal(0)
+
+    def test_state_round_trip(self):
+        """Test that a dealer resumes identically from its 79-byte state."""
+        dealer = Dealer("INFP")
+        dealer.deal(5)
+        state = dealer.to_bytes()
+        self.assertEqual(len(state), 79)
+
+        restored = Dealer.from_bytes(state)
+        self.assertEqual(restored.remaining, 73)
+        self.assertEqual(restored.deal(10), dealer.deal(10))
+
+        with self.assertRaises(ValueError):
+            Dealer.from_bytes(state[:-1])
+
+
+class TestSessionStore(unittest.TestCase):
+    def test_deal_advances_session(self):
+        """Test that dealing through the store persists the cursor."""
+        store = SessionStore()
+        session_id = store.create()
+        first, _ = store.deal(session_id, 3)
+        second, remaining = store.deal(session_id, 3)
+        names = {card["name"] for card in first + second}
+        self.assertEqual(len(names), 6)
+        self.assertEqual(remaining, 72)
+        self.assertEqual(store.get(session_id).remaining, 72)
+
+    def test_unknown_session(self):
+        """Test that unknown sessions raise KeyError."""
+        store = SessionStore()
+        with self.assertRaises(KeyError):
+            store.deal("missing")
+        self.assertFalse(store.delete("missing"))
+
+    def test_ttl_expiry(self):
+        """Test that idle sessions expire and used ones are kept alive."""
+        clock = FakeClock()
+        store = SessionStore(ttl=10.0, clock=clock)
+        idle = store.create()
+        active = store.create()
+
+        clock.now = 8.0
+        store.deal(active)
+        clock.now = 12.0
+        self.assertNotIn(idle, store)
+        self.assertIn(active, store)
+
+        clock.now = 30.0
+        store.create()
+        self.assertEqual(len(store), 1)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used session is evicted first."""
+        store = SessionStore(max_sessions=2)
+        first = store.create()
+        second = store.create()
+        store.get(first)
+        store.deal(first)
+        third = store.create()
+        self.assertIn(first, store)
+        self.assertNotIn(second, store)
+        self.assertIn(third, store)
+        self.assertEqual(store.evictions, 1)
+
+    def test_memory_cap(self):
+        """Test that the estimated memory never exceeds max_bytes."""
+        store = SessionStore(max_bytes=10_000)
+        for _ in range(200):
+            store.create()
+        self.assertLessEqual(store.memory_usage, 10_000)
+        self.assertGreater(store.evictions, 0)
+        self.assertEqual(
+            store.memory_usage,
+            len(store) * (store.memory_usage // len(store)),
+        )
+
+    def test_delete_releases_memory(self):
+        """Test that deleting every session returns usage to zero."""
+        store = SessionStore()
+        ids = [store.create() for _ in range(5)]
+        for session_id in ids:
+            store.deal(session_id, 2)
+            self.assertTrue(store.delete(session_id))
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.memory_usage, 0)
+
+    def test_concurrent_deals(self):
+        """Test that concurrent deals from one session never repeat cards."""
+        store = SessionStore()
+        session_id = store.create()
+        dealt = []
+
+        def deal():
+            for _ in range(13):
+                cards, _ = store.deal(session_id)
+                dealt.extend(card["name"] for card in cards)
+
+        threads = [threading.Thread(target=deal) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(dealt)), 78)
+        self.assertEqual(store.get(session_id).remaining, 0)
+
+    def test_invalid_store(self):
+        """Test that invalid limits raise ValueError."""
+        with self.assertRaises(ValueError):
+            SessionStore(max_sessions=0)
+        with self.assertRaises(ValueError):
+            SessionStore(ttl=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
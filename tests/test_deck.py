@@ -3,7 +3,16 @@ Test cases for the tarot deck data.
 """
 
 import unittest
-from src.deck import MAJOR_ARCANA, MINOR_ARCANA, get_all_cards
+from src.deck import (
+    CARD_GROUPS,
+    GROUP_CARD_IDS,
+    MAJOR_ARCANA,
+    MINOR_ARCANA,
+    get_all_cards,
+    get_card_by_id,
+    get_card_id,
+    get_card_suit,
+)
 
 
 class TestDeck(unittest.TestCase):
@@ -65,6 +74,30 @@ class TestDeck(unittest.TestCase):
         expected_suits = {"Wands", "Cups", "Swords", "Pentacles"}
         self.assertEqual(set(MINOR_ARCANA.keys()), expected_suits)
 
+    def test_card_ids_round_trip(self):
+        """Test that card ids follow get_all_cards() order."""
+        for card_id, card in enumerate(get_all_cards()):
+            self.assertEqual(get_card_id(card["name"]), card_id)
+            self.assertIs(get_card_by_id(card_id), card)
+
+        self.assertEqual(get_card_id("The Fool"), 0)
+        self.assertEqual(get_card_id("Ace of Wands"), 22)
+
+    def test_card_id_invalid(self):
+        """Test that unknown names and out-of-range ids raise ValueError."""
+        with self.assertRaises(ValueError):
+            get_card_id("The Joker")
+        with self.assertRaises(ValueError):
+            get_card_by_id(78)
+
+    def test_card_groups_partition_deck(self):
+        """Test that every card belongs to exactly one group."""
+        card_ids = [i for group in CARD_GROUPS for i in GROUP_CARD_IDS[group]]
+        self.assertEqual(sorted(card_ids), list(range(78)))
+        self.assertEqual(len(GROUP_CARD_IDS["Major Arcana"]), 22)
+        for card_id in GROUP_CARD_IDS["Cups"]:
+            self.assertEqual(get_card_suit(card_id), "Cups")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+"""
+Test cases for duplicate-free batch drawing.
+"""
+
+import unittest
+from unittest.mock import patch
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+def _distinct_rows(card_ids, is_reversed):
+    codes = card_ids.astype(np.int64) * 2 + is_reversed
+    return len(np.unique(codes, axis=0))
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestReadingFilter(unittest.TestCase):
+    def test_exact_for_short_spreads(self):
+        """Test that one- to three-card readings use an exact bitset."""
+        from src.dedupe import ReadingFilter
+
+        self.assertTrue(ReadingFilter(1, 10).exact)
+        self.assertTrue(ReadingFilter(3, 10).exact)
+        self.assertFalse(ReadingFilter(10, 10).exact)
+
+    def test_add_new_marks_repeats(self):
+        """Test that repeats within and across batches are reported."""
+        from src.dedupe import ReadingFilter
+
+        for num_cards in (1, 10):
+            seen = ReadingFilter(num_cards, 100)
+            card_ids = np.array([range(num_cards)] * 3, dtype=np.uint8)
+            is_reversed = np.array([[False] * num_cards] * 3)
+            is_reversed[1, 0] = True
+            new = seen.add_new(card_ids, is_reversed)
+            self.assertEqual(new.tolist(), [True, True, False])
+            new = seen.add_new(card_ids[:2], is_reversed[:2])
+            self.assertEqual(new.tolist(), [False, False])
+
+    def test_bloom_sizing(self):
+        """Test that the Bloom filter grows with capacity and precision."""
+        from src.dedupe import BloomFilter
+
+        loose = BloomFilter(100_000, 1e-3)
+        strict = BloomFilter(100_000, 1e-9)
+        self.assertGreater(strict.nbytes, loose.nbytes)
+        # About 1.8 bytes per item at 0.1%
+        self.assertLess(loose.nbytes, 200_000)
+        with self.assertRaises(ValueError):
+            BloomFilter(0)
+        with self.assertRaises(ValueError):
+            BloomFilter(10, 1.0)
+
+    def test_bloom_false_positive_rate(self):
+        """Test that the measured false-positive rate stays near target."""
+        from src.dedupe import BloomFilter
+
+        rng = np.random.default_rng(4)
+        bloom = BloomFilter(20_000, 0.01)
+        bloom.add(rng.integers(0, 2**63, size=(20_000, 2), dtype=np.uint64))
+        others = rng.integers(0, 2**63, size=(20_000, 2), dtype=np.uint64)
+        self.assertLess(bloom.contains(others).mean(), 0.02)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestUniqueDrawBatch(unittest.TestCase):
+    def test_single_card_space_is_exhausted(self):
+        """Test that all 156 single-card readings can be drawn exactly once."""
+        from src.batch import draw_batch
+
+        card_ids, is_reversed = draw_batch(1, 156, rng=1, unique=True)
+        self.assertEqual(_distinct_rows(card_ids, is_reversed), 156)
+        with self.assertRaises(ValueError):
+            draw_batch(1, 157, unique=True)
+
+    def test_three_card_rows_are_distinct(self):
+        """Test that unique three-card batches contain no repeats."""
+        from src.batch import draw_batch
+
+        card_ids, is_reversed = draw_batch(3, 50_000, rng=2, unique=True)
+        self.assertEqual(card_ids.shape, (50_000, 3))
+        self.assertEqual(_distinct_rows(card_ids, is_reversed), 50_000)
+
+    def test_weighted_long_spreads_are_distinct(self):
+        """Test unique draws of longer, heavily weighted spreads."""
+        from src.batch import draw_batch
+
+        weights = {"The Fool": 1000.0, "The Magician": 1000.0}
+        card_ids, is_reversed = draw_batch(
+            5, 20_000, weights=weights, rng=3, unique=True, error_rate=1e-3
+        )
+        self.assertEqual(_distinct_rows(card_ids, is_reversed), 20_000)
+        sorted_ids = np.sort(card_ids, axis=1)
+        self.assertFalse((sorted_ids[:, 1:] == sorted_ids[:, :-1]).any())
+
+    def test_weighted_space_is_enforced(self):
+        """Test that zero weights shrink the space of unique readings."""
+        from src.batch import draw_batch
+
+        weights = {"Wands": 0, "Cups": 0, "Swords": 0, "Pentacles": 0}
+        card_ids, _ = draw_batch(1, 44, weights=weights, rng=5, unique=True)
+        self.assertTrue((card_ids < 22).all())
+        with self.assertRaises(ValueError):
+            draw_batch(1, 100, weights=weights, unique=True)
+
+    def test_redraw_rounds_are_capped(self):
+        """Test that a batch finding no new readings gives up."""
+        from src import batch
+
+        with patch.object(batch, "_MAX_UNIQUE_ROUNDS", 2):
+            with self.assertRaises(ValueError):
+                batch.draw_batch(1, 156, weights={"The Fool": 1e9}, unique=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
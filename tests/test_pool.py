@@ -0,0 +1,82 @@
+"""
+Test cases for pre-drawn reading pools.
+"""
+
+import threading
+import time
+import unittest
+
+try:
+    import numpy as np
+    from src.pool import ReadingPool
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestReadingPool(unittest.TestCase):
+    def test_pop_readings(self):
+        """Test that pooled readings are full spreads without repeats."""
+        pool = ReadingPool(10, size=32, rng=1)
+        self.assertEqual(pool.fill(), 32)
+        for _ in range(32):
+            cards = pool.pop()
+            self.assertEqual(len({card["name"] for card in cards}), 10)
+            self.assertIn(cards[0]["orientation"], ["Upright", "Reversed"])
+        self.assertEqual(pool.hits, 32)
+
+    def test_exhaustion(self):
+        """Test that an empty pool returns None and counts the event."""
+        pool = ReadingPool(1, size=4, batch_size=4)
+        self.assertIsNone(pool.pop())
+        self.assertEqual(pool.exhaustions, 1)
+        pool.refill()
+        self.assertIsNotNone(pool.pop())
+
+    def test_ring_wraps_around(self):
+        """Test refills across the end of the buffer."""
+        pool = ReadingPool(3, size=5, low_water=1, batch_size=3, rng=2)
+        pool.refill()
+        for _ in range(3):
+            pool.pop()
+        self.assertTrue(pool.needs_refill)
+        self.assertEqual(pool.fill(), 5)
+        self.assertEqual(pool.refill(), 0)
+        popped = [pool.pop() for _ in range(5)]
+        self.assertTrue(all(len(cards) == 3 for cards in popped))
+        self.assertIsNone(pool.pop())
+
+    def test_concurrent_refill(self):
+        """Test one refilling thread alongside one consumer."""
+        pool = ReadingPool(1, size=64, low_water=16, batch_size=16)
+        done = threading.Event()
+
+        def refiller():
+            while not done.is_set():
+                if pool.needs_refill:
+                    pool.refill()
+                time.sleep(0)
+
+        thread = threading.Thread(target=refiller)
+        thread.start()
+        served = 0
+        while served < 2000:
+            if pool.pop() is not None:
+                served += 1
+        done.set()
+        thread.join()
+        self.assertEqual(pool.hits, 2000)
+        self.assertEqual(pool.stats()["hits"], 2000)
+
+    def test_invalid_pool(self):
+        """Test that invalid settings raise ValueError."""
+        with self.assertRaises(ValueError):
+            ReadingPool(0)
+        with self.assertRaises(ValueError):
+            ReadingPool(1, size=8, low_water=8)
+        with self.assertRaises(ValueError):
+            ReadingPool(1, size=8, batch_size=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Test cases for the spread probability engine.
+"""
+
+import asyncio
+import math
+import unittest
+from unittest.mock import patch
+
+from src.deck import DECK_VERSION
+from src.probability import spread_probability
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    from fastapi.testclient import TestClient
+except ImportError:  # pragma: no cover - optional dependency
+    TestClient = None
+
+
+class TestExactProbability(unittest.TestCase):
+    def test_card_in_position(self):
+        """Test positional symmetry for a specific card and orientation."""
+        result = spread_probability(
+            "celtic", card="The Tower", position="Final Outcome", orientation="reversed"
+        )
+        self.assertEqual(result["method"], "exact")
+        self.assertAlmostEqual(result["probability"], 1 / 156)
+        self.assertEqual(result["deck_version"], DECK_VERSION)
+
+    def test_group_count_hypergeometric(self):
+        """Test at-least counts against the hypergeometric formula."""
+        result = spread_probability("celtic", group="Major Arcana", count=3)
+        expected = 1 - sum(
+            math.comb(22, x) * math.comb(56, 10 - x) / math.comb(78, 10)
+            for x in range(3)
+        )
+        self.assertAlmostEqual(result["probability"], expected)
+
+    def test_comparisons(self):
+        """Test that exactly/at_most/at_least partition the outcomes."""
+        kwargs = {"spread": "three", "group": "Cups", "count": 1}
+        exactly = spread_probability(comparison="exactly", **kwargs)["probability"]
+        at_most = spread_probability(comparison="at_most", **kwargs)["probability"]
+        at_least = spread_probability(comparison="at_least", **kwargs)["probability"]
+        self.assertAlmostEqual(at_most + at_least - exactly, 1.0)
+
+    def test_reversed_count_is_binomial(self):
+        """Test that reversed counts over any card follow Binomial(n, 1/2)."""
+        result = spread_probability(
+            "celtic", orientation="reversed", count=5, comparison="exactly"
+        )
+        self.assertAlmostEqual(result["probability"], math.comb(10, 5) / 2**10)
+
+    def test_numbered_position(self):
+        """Test 1-based numeric positions and numeric spreads."""
+        result = spread_probability(5, group="Wands", position=5)
+        self.assertAlmostEqual(result["probability"], 14 / 78)
+
+    def test_invalid_queries(self):
+        """Test that invalid queries raise ValueError."""
+        with self.assertRaises(ValueError):
+            spread_probability("celtic", card="The Fool", group="Cups")
+        with self.assertRaises(ValueError):
+            spread_probability("three", position="Final Outcome")
+        with self.assertRaises(ValueError):
+            spread_probability("three", position=4)
+        with self.assertRaises(ValueError):
+            spread_probability("three", comparison="more")
+        with self.assertRaises(ValueError):
+            spread_probability("three", group="Coins")
+        with self.assertRaises(ValueError):
+            spread_probability("three", weights={"Cups": 2.0}, method="exact")
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestSimulatedProbability(unittest.TestCase):
+    def test_simulation_matches_exact(self):
+        """Test that simulation agrees with the exact value within bounds."""
+        exact = spread_probability("celtic", group="Major Arcana", count=3)
+        simulated = spread_probability(
+            "celtic", group="Major Arcana", count=3, method="simulation", trials=40000
+        )
+        self.assertEqual(simulated["method"], "simulation")
+        self.assertGreater(simulated["standard_error"], 0)
+        self.assertLess(
+            abs(simulated["probability"] - exact["probability"]),
+            5 * simulated["standard_error"],
+        )
+
+    def test_weighted_spreads_are_simulated(self):
+        """Test that weight profiles fall back to simulation."""
+        result = spread_probability(
+            "single", group="Cups", weights={"Major Arcana": 0.0}, trials=20000
+        )
+        self.assertEqual(result["method"], "simulation")
+        self.assertAlmostEqual(result["probability"], 0.25, delta=0.02)
+
+    def test_results_are_cached(self):
+        """Test that repeated queries return the cached estimate."""
+        first = spread_probability("three", card="The Sun", method="simulation")
+        second = spread_probability("three", card="The Sun", method="simulation")
+        self.assertEqual(first, second)
+
+
+@unittest.skipIf(TestClient is None, "fastapi is not installed")
+class TestProbabilityEndpoint(unittest.TestCase):
+    def test_simulation_without_numpy(self):
+        """Test that simulations answer 400 when NumPy is missing."""
+        from api.main import app
+
+        client = TestClient(app)
+        with patch.dict("sys.modules", {"numpy": None, "src.batch": None}):
+            response = client.get(
+                "/api/v1/stats/probability",
+                params={"spread": "three", "method": "simulation", "trials": 1234},
+            )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["detail"], "Simulation requires NumPy")
+
+    def test_runs_off_the_event_loop(self):
+        """Test that probability queries do not block the event loop."""
+        from api.main import app
+
+        loops = []
+
+        def probability(*args, **kwargs):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return spread_probability(*args, **kwargs)
+
+        client = TestClient(app)
+        with patch("api.routers.stats.spread_probability", probability):
+            response = client.get("/api/v1/stats/probability?spread=three")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(loops, [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
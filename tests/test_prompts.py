@@ -0,0 +1,110 @@
+"""
+Test cases for batch LLM prompt building.
+"""
+
+import io
+import json
+import unittest
+
+from src.core import draw_from_seed
+from src.prompts import PromptBuilder, estimate_tokens
+from src.text_formatter import get_renderer, list_renderers
+
+
+class TestEstimateTokens(unittest.TestCase):
+    def test_estimates(self):
+        """Test the heuristic on words, numbers, punctuation and emoji."""
+        self.assertEqual(estimate_tokens(""), 0)
+        self.assertEqual(estimate_tokens("The Fool"), 2)
+        self.assertEqual(estimate_tokens("Manifestation"), 4)
+        self.assertEqual(estimate_tokens("1234567"), 3)
+        self.assertEqual(estimate_tokens("a, b.\n\nc"), 6)
+        self.assertEqual(estimate_tokens("🔮"), 2)
+
+
+class TestPromptBuilder(unittest.TestCase):
+    def setUp(self):
+        self.readings = [draw_from_seed("celtic", seed) for seed in range(40)]
+
+    def test_prompts_fit_budget(self):
+        """Test that every prompt stays within the token budget."""
+        builder = PromptBuilder(max_tokens=1500)
+        prompts = list(builder.build(iter(self.readings)))
+        self.assertGreater(len(prompts), 1)
+        self.assertEqual(sum(prompt.readings for prompt in prompts), 40)
+        for prompt in prompts:
+            self.assertLessEqual(prompt.tokens, 1500)
+            self.assertEqual(prompt.tokens, estimate_tokens(prompt.text))
+
+    def test_every_renderer(self):
+        """Test that prompts build with every registered renderer."""
+        for fmt in list_renderers():
+            with self.subTest(fmt=fmt):
+                builder = PromptBuilder(fmt=fmt, max_tokens=3000)
+                prompts = list(builder.build(self.readings[:10]))
+                self.assertEqual(sum(prompt.readings for prompt in prompts), 10)
+                text = get_renderer(fmt).render(self.readings[0])
+                self.assertIn(text, prompts[0].text)
+                for prompt in prompts:
+                    self.assertLessEqual(prompt.tokens, 3000)
+
+    def test_order_and_numbering(self):
+        """Test that readings keep their order and are numbered per prompt."""
+        builder = PromptBuilder(max_readings=3, fmt="terminal")
+        prompts = list(builder.build(self.readings[:7], "celtic"))
+        self.assertEqual([prompt.readings for prompt in prompts], [3, 3, 1])
+        self.assertEqual([prompt.start for prompt in prompts], [0, 3, 6])
+        second = prompts[1].text
+        self.assertTrue(second.startswith("Interpret each"))
+        self.assertIn(
+            "Reading 1:\n" + get_renderer("terminal").render(self.readings[3]), second
+        )
+        self.assertIn("Reading 3:", second)
+        self.assertNotIn("Reading 4:", second)
+
+    def test_custom_counter_and_template(self):
+        """Test a custom token counter and prompt template."""
+        builder = PromptBuilder(
+            template="Readings:\n{readings}\nEnd.",
+            item="{reading}",
+            fmt="jsonl",
+            max_tokens=3000,
+            separator="\n",
+            token_counter=len,
+        )
+        readings = [draw_from_seed(3, seed) for seed in range(30)]
+        prompts = list(builder.build(readings))
+        for prompt in prompts:
+            self.assertLessEqual(len(prompt.text), 3000)
+            self.assertEqual(prompt.tokens, len(prompt.text))
+            lines = prompt.text.splitlines()[1:-1]
+            self.assertEqual(len(lines), prompt.readings)
+            json.loads(lines[0])
+
+    def test_oversized_reading(self):
+        """Test that a reading larger than the budget raises ValueError."""
+        builder = PromptBuilder(max_tokens=100)
+        with self.assertRaises(ValueError):
+            list(builder.build(self.readings[:1]))
+
+    def test_invalid_templates(self):
+        """Test template validation."""
+        with self.assertRaises(ValueError):
+            PromptBuilder(template="no placeholder")
+        with self.assertRaises(ValueError):
+            PromptBuilder(item="Reading {index}")
+        with self.assertRaises(ValueError):
+            PromptBuilder(max_tokens=5)
+
+    def test_write_to_streams_jsonl(self):
+        """Test streaming prompts as JSON Lines."""
+        builder = PromptBuilder(max_tokens=100_000, max_readings=10)
+        stream = io.BytesIO()
+        self.assertEqual(builder.write_to(stream, self.readings, chunk_size=100), 4)
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([line["start"] for line in lines], [0, 10, 20, 30])
+        self.assertIn("Reading 10:", lines[0]["prompt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
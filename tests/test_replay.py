@@ -0,0 +1,150 @@
+"""
+Test cases for the reading replay log.
+"""
+
+import asyncio
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.core import draw_from_seed, draw_three
+from src import replay as replay_module
+from src.replay import ReplayLog, read_log, replay, verify_log
+
+try:
+    from api import replay as api_replay
+except ImportError:  # pragma: no cover - optional dependency
+    api_replay = None
+
+
+class TestReplayLog(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip_and_verify(self):
+        """Test that logged seeded readings are regenerated exactly."""
+        spreads = ["single", "three", "celtic", "guidance", 5]
+        with ReplayLog(self.directory) as log:
+            readings = []
+            for seed, spread in enumerate(spreads * 4):
+                reading = draw_from_seed(spread, seed)
+                log.record(spread, reading, seed)
+                readings.append(reading)
+
+        entries = list(read_log(self.directory))
+        self.assertEqual(len(entries), 20)
+        for entry, reading in zip(entries, readings):
+            self.assertEqual(entry.reading(), reading)
+            self.assertEqual(replay(entry), reading)
+
+        summary = verify_log(self.directory)
+        self.assertEqual(summary["verified"], 20)
+        self.assertEqual(summary["mismatches"], [])
+
+    def test_unseeded_readings(self):
+        """Test that unseeded readings are stored but not replayable."""
+        reading = draw_three()
+        with ReplayLog(self.directory) as log:
+            log.record("three", reading)
+
+        (entry,) = read_log(self.directory)
+        self.assertIsNone(entry.seed)
+        self.assertEqual(entry.reading(), reading)
+        with self.assertRaises(ValueError):
+            replay(entry)
+        self.assertEqual(verify_log(self.directory)["unseeded"], 1)
+
+    def test_tampered_log_fails_verification(self):
+        """Test that a changed card byte is reported as a mismatch."""
+        with ReplayLog(self.directory) as log:
+            log.record("single", draw_from_seed("single", 7), 7)
+            log.record("single", draw_from_seed("single", 8), 8)
+
+        segment = next(Path(self.directory).glob("*.tlog"))
+        data = bytearray(segment.read_bytes())
+        data[-1] ^= 0x80  # flip the orientation of the last card
+        segment.write_bytes(bytes(data))
+        self.assertEqual(verify_log(self.directory)["mismatches"], [1])
+
+    def test_segments_roll_over(self):
+        """Test that large logs are split into ordered segments."""
+        with ReplayLog(self.directory, segment_bytes=1024, max_pending=16) as log:
+            for seed in range(500):
+                log.record("celtic", draw_from_seed("celtic", seed), seed)
+
+        self.assertGreater(len(list(Path(self.directory).glob("*.tlog"))), 1)
+        entries = list(read_log(self.directory))
+        self.assertEqual([entry.seed for entry in entries], list(range(500)))
+        self.assertEqual(verify_log(self.directory)["verified"], 500)
+
+    def test_out_of_range_seed(self):
+        """Test that seeds outside 32 bits are rejected before queueing."""
+        with ReplayLog(self.directory) as log:
+            log.record("single", draw_from_seed("single", 1), 1)
+            for seed in (-1, 2**32):
+                with self.assertRaises(ValueError):
+                    log.record("single", draw_from_seed("single", seed), seed)
+            log.record("single", draw_from_seed("single", 2), 2)
+
+        self.assertEqual([entry.seed for entry in read_log(self.directory)], [1, 2])
+
+    def test_unloggable_spreads_are_rejected(self):
+        """Test that spreads past the spread table raise before queueing."""
+        from src import spreads
+
+        with patch.object(replay_module, "_MAX_SPREADS", 2), ReplayLog(
+            self.directory
+        ) as log:
+            with self.assertRaises(ValueError):
+                log.record(spreads.list_spreads()[2], draw_three())
+            with self.assertRaises(ValueError):
+                log.record("no_such_spread", draw_three())
+            log.record("three", draw_three())
+        self.assertEqual(len(list(read_log(self.directory))), 1)
+
+    def test_record_after_close(self):
+        """Test that a closed log refuses new readings."""
+        log = ReplayLog(self.directory)
+        log.close()
+        with self.assertRaises(ValueError):
+            log.record("three", draw_three())
+
+    def test_invalid_settings(self):
+        """Test that invalid settings raise ValueError."""
+        with self.assertRaises(ValueError):
+            ReplayLog(self.directory, max_pending=0)
+
+
+@unittest.skipIf(api_replay is None, "the api extra is not installed")
+class TestFlushForever(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_flush_is_not_fatal(self):
+        """Test that the background task survives a failing flush."""
+        calls = []
+
+        def flush():
+            calls.append(None)
+            if len(calls) == 1:
+                raise OSError("disk full")
+
+        with patch.object(api_replay, "log", Mock(flush=flush)):
+            with self.assertLogs("api.replay", level="ERROR"):
+                task = asyncio.create_task(api_replay.flush_forever(0.001))
+
+                async def flushed_again():
+                    while len(calls) < 3 and not task.done():
+                        await asyncio.sleep(0.001)
+
+                await asyncio.wait_for(flushed_again(), timeout=5)
+            self.assertFalse(task.done())
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+
+if __name__ == "__main__":
+    unittest.main()
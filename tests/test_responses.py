@@ -0,0 +1,164 @@
+"""
+Test cases for pre-encoded reading responses.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+
+from src.core import draw_from_seed
+
+try:
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    from fastapi.testclient import TestClient
+    from api.main import app
+    from api.models import CardResponse, ReadingResponse
+    from api.responses import encode_card, encode_reading
+except ImportError:  # pragma: no cover - optional dependency
+    TestClient = None
+
+
+def _model_json(spread_type, cards, timestamp, seed=None, summary=None, analytics=None):
+    """Body FastAPI would send for the equivalent ReadingResponse."""
+    model = ReadingResponse(
+        spread_type=spread_type,
+        cards=[
+            CardResponse(
+                name=card["name"],
+                orientation=card["orientation"].lower(),
+                meaning=card["meaning"],
+                position=position,
+            )
+            for card, position in cards
+        ],
+        timestamp=timestamp,
+        seed=seed,
+        summary=summary,
+        analytics=analytics,
+    )
+    return JSONResponse(jsonable_encoder(model)).body
+
+
+@unittest.skipIf(TestClient is None, "the api extra is not installed")
+class TestEncodeReading(unittest.TestCase):
+    def test_matches_model_encoding(self):
+        """Test byte-identical output to FastAPI's model encoding."""
+        for seed in range(20):
+            reading = draw_from_seed("celtic", seed)
+            cards = [(card, position) for position, card in reading.items()]
+            args = ("celtic_cross", cards, "2025-01-01T00:00:00+00:00")
+            kwargs = {"seed": 'é 🔮 "quoted"\n', "summary": "Summary"}
+            self.assertEqual(
+                encode_reading(*args, **kwargs), _model_json(*args, **kwargs)
+            )
+
+        cards = [(card, None) for card in draw_from_seed(5, 1)]
+        self.assertEqual(
+            encode_reading("random_drop", cards, "now"),
+            _model_json("random_drop", cards, "now"),
+        )
+
+    def test_analytics(self):
+        """Test that analytics dicts encode like SpreadAnalytics."""
+        try:
+            from src.analytics import analyze_reading
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        reading = draw_from_seed("three", 3)
+        cards = [(card, position) for position, card in reading.items()]
+        stats = analyze_reading(reading)
+        self.assertEqual(
+            encode_reading("three_card", cards, "now", analytics=stats),
+            _model_json("three_card", cards, "now", analytics=stats),
+        )
+
+    def test_custom_meaning(self):
+        """Test cards whose meaning is not in the deck."""
+        card = {"name": "The Fool", "orientation": "Upright", "meaning": "Custom"}
+        self.assertEqual(
+            json.loads(encode_card(card, "Past")),
+            {
+                "name": "The Fool",
+                "orientation": "upright",
+                "meaning": "Custom",
+                "position": "Past",
+            },
+        )
+
+
+@unittest.skipIf(TestClient is None, "the api extra is not installed")
+class TestReadingEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_responses_validate(self):
+        """Test that endpoint bodies validate against ReadingResponse."""
+        for path in (
+            "/api/v1/readings/single?seed=INFP",
+            "/api/v1/readings/three",
+            "/api/v1/readings/celtic-cross?seed=x",
+            "/api/v1/readings/random?count=5",
+            "/api/v1/readings/spread/horseshoe",
+        ):
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200, path)
+            self.assertEqual(response.headers["content-type"], "application/json")
+            reading = ReadingResponse.model_validate_json(response.content)
+            self.assertTrue(reading.cards)
+
+    def test_daily_keeps_cache_control(self):
+        """Test that the daily card still sends Cache-Control."""
+        response = self.client.get("/api/v1/readings/daily?seed=x&day=2024-01-01")
+        self.assertEqual(response.headers["cache-control"], "public, max-age=86400")
+
+    def test_single_with_predrawn_and_replayed_readings(self):
+        """Test single-card endpoints with the pool, batcher and replay log."""
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        from api import batcher, pool, replay
+
+        def enable_pool():
+            pool.configure(size=8, card_counts=[1])
+
+        def enable_batcher():
+            batcher.configure(enabled=True, window=0.001)
+
+        def enable_replay():
+            self.addCleanup(shutil.rmtree, directory)
+            replay.configure(directory)
+
+        directory = tempfile.mkdtemp()
+        for enable in (enable_pool, enable_batcher, enable_replay):
+            with self.subTest(enable.__name__):
+                enable()
+                try:
+                    for path, position in (
+                        ("/api/v1/readings/spread/single", "Card"),
+                        ("/api/v1/readings/single", None),
+                    ):
+                        response = self.client.get(path)
+                        self.assertEqual(response.status_code, 200, path)
+                        cards = response.json()["cards"]
+                        self.assertEqual(len(cards), 1)
+                        self.assertEqual(cards[0]["position"], position)
+                finally:
+                    pool.configure(size=0)
+                    batcher.configure(enabled=False)
+                    replay.close()
+                    replay.log = None
+
+    def test_openapi_schema_unchanged(self):
+        """Test that reading endpoints still document ReadingResponse."""
+        schema = app.openapi()["paths"]["/api/v1/readings/celtic-cross"]["get"]
+        content = schema["responses"]["200"]["content"]["application/json"]
+        self.assertEqual(
+            content["schema"]["$ref"], "#/components/schemas/ReadingResponse"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
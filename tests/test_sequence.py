@@ -0,0 +1,79 @@
+"""
+Test cases for the Markov-chain card sequence generator.
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestCardSequencer(unittest.TestCase):
+    def setUp(self):
+        from src.sequence import CardSequencer
+
+        self.CardSequencer = CardSequencer
+
+    def test_deterministic_chain(self):
+        """Test that a permutation matrix is followed exactly."""
+        transitions = np.zeros((78, 78))
+        for card_id in range(78):
+            transitions[card_id, (card_id + 1) % 78] = 1.0
+        sequencer = self.CardSequencer(transitions, seed=3)
+        self.assertEqual(sequencer.generate(5, start=76), [76, 77, 0, 1, 2])
+
+    def test_batch_matches_transition_probabilities(self):
+        """Test that vectorized steps follow the row distribution."""
+        transitions = np.ones((78, 78))
+        transitions[0] = 0.0
+        transitions[0, 1] = 3.0
+        transitions[0, 2] = 1.0
+        sequencer = self.CardSequencer(transitions, seed=5)
+        batch = sequencer.generate_batch(20000, 2, start=0)
+        self.assertEqual(batch.shape, (20000, 2))
+        self.assertEqual(batch.dtype, np.uint8)
+        self.assertEqual(set(np.unique(batch[:, 1])), {1, 2})
+        self.assertAlmostEqual((batch[:, 1] == 1).mean(), 0.75, delta=0.02)
+
+    def test_deck_structure_never_repeats(self):
+        """Test that the structural matrix has no self transitions."""
+        sequencer = self.CardSequencer.from_deck_structure(seed=1)
+        batch = sequencer.generate_batch(500, 30)
+        self.assertFalse((batch[:, 1:] == batch[:, :-1]).any())
+
+    def test_from_corpus(self):
+        """Test that transitions are learned from consecutive cards."""
+        corpus = [
+            [{"name": "The Fool"}, {"name": "The Magician"}],
+            {"Past": {"name": "The Fool"}, "Present": {"name": "The Magician"}},
+        ]
+        sequencer = self.CardSequencer.from_corpus(corpus, smoothing=1e-9)
+        self.assertGreater(sequencer.transitions[0, 1], 0.99)
+        self.assertEqual(sequencer.generate(2), [0, 1])
+
+    def test_generate_cards(self):
+        """Test that card sequences come back as reading dicts."""
+        sequencer = self.CardSequencer.from_deck_structure()
+        cards = sequencer.generate_cards(8, start=0)
+        self.assertEqual(len(cards), 8)
+        self.assertEqual(cards[0]["name"], "The Fool")
+        for card in cards:
+            self.assertIn(card["orientation"], ["Upright", "Reversed"])
+
+    def test_invalid_matrix(self):
+        """Test that malformed matrices raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.CardSequencer(np.ones((10, 10)))
+        with self.assertRaises(ValueError):
+            self.CardSequencer(-np.ones((78, 78)))
+        transitions = np.ones((78, 78))
+        transitions[5] = 0.0
+        with self.assertRaises(ValueError):
+            self.CardSequencer(transitions)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Test cases for the reading similarity index.
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from src.core import _draw_cards, draw_three
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestSimilarity(unittest.TestCase):
+    def setUp(self):
+        from src.similarity import ReadingIndex, encode_reading
+
+        self.ReadingIndex = ReadingIndex
+        self.encode_reading = encode_reading
+
+    def test_encode_reading_masks(self):
+        """Test that presence and reversed masks use stable card ids."""
+        reading = [
+            {"name": "The Fool", "orientation": "Reversed"},
+            {"name": "Ace of Wands", "orientation": "Upright"},
+        ]
+        presence, reversed_mask = self.encode_reading(reading)
+        self.assertEqual(presence, (1 << 0) | (1 << 22))
+        self.assertEqual(reversed_mask, 1 << 0)
+
+    def test_encode_reading_accepts_spread_dict(self):
+        """Test that position -> card dicts are encoded like card lists."""
+        reading = draw_three()
+        self.assertEqual(
+            self.encode_reading(reading),
+            self.encode_reading(list(reading.values())),
+        )
+
+    def test_exact_match_ranks_first(self):
+        """Test that a stored reading is its own nearest neighbour."""
+        index = self.ReadingIndex()
+        readings = [_draw_cards(10) for _ in range(200)]
+        index.add_many(readings)
+        self.assertEqual(len(index), 200)
+
+        jaccard = index.query(readings[42], k=3)
+        self.assertEqual(jaccard[0], (42, 1.0))
+        self.assertEqual(len(jaccard), 3)
+
+        hamming = index.query(readings[42], k=1, metric="hamming")
+        self.assertEqual(hamming, [(42, 0)])
+
+    def test_scores_match_python_reference(self):
+        """Test vectorized scores against a set-based computation."""
+        index = self.ReadingIndex(capacity=1)
+        readings = [_draw_cards(5) for _ in range(50)]
+        index.add_many(readings)
+        query = _draw_cards(5)
+        query_names = {card["name"] for card in query}
+
+        for row_id, score in index.query(query, k=50):
+            names = {card["name"] for card in readings[row_id]}
+            expected = len(names & query_names) / len(names | query_names)
+            self.assertAlmostEqual(score, expected)
+
+    def test_lsh_finds_duplicates(self):
+        """Test that banded queries still find exact repeats."""
+        index = self.ReadingIndex(bands=8, rows_per_band=2, seed=1)
+        readings = [_draw_cards(10) for _ in range(300)]
+        index.add_many(readings)
+        for row_id in (0, 150, 299):
+            self.assertEqual(index.query(readings[row_id], k=1)[0][0], row_id)
+
+    def test_hamming_ignores_bands(self):
+        """Test that Hamming queries scan every row even with banding."""
+        index = self.ReadingIndex(bands=8, rows_per_band=2, seed=1)
+        index.add_many([_draw_cards(10) for _ in range(300)])
+        query = _draw_cards(10)
+        self.assertEqual(
+            index.query(query, k=20, metric="hamming"),
+            index.query(query, k=20, metric="hamming", exact=True),
+        )
+
+    def test_masks_view_is_read_only(self):
+        """Test that packed rows are exposed without allowing mutation."""
+        index = self.ReadingIndex()
+        index.add(draw_three())
+        self.assertEqual(index.masks.shape, (1, 4))
+        self.assertEqual(index.masks.dtype, np.uint64)
+        with self.assertRaises(ValueError):
+            index.masks[0, 0] = 1
+
+    def test_invalid_metric(self):
+        """Test that unknown metrics are rejected."""
+        index = self.ReadingIndex()
+        with self.assertRaises(ValueError):
+            index.query(draw_three(), metric="cosine")
+
+
+if __name__ == "__main__":
+    unittest.main()
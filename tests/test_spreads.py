@@ -0,0 +1,186 @@
+"""
+Test cases for the data-driven spread registry.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from src.core import CELTIC_CROSS_POSITIONS, draw_constrained, draw_spread
+from src.spreads import (
+    compile_spread,
+    get_spread,
+    list_spreads,
+    load_spreads,
+    register_spread,
+)
+from src.text_formatter import get_reading_summary, get_spread_text
+
+
+class TestSpreadRegistry(unittest.TestCase):
+    def test_builtin_spreads(self):
+        """Test that the built-in spreads are registered and compiled."""
+        for name in ("single", "three", "celtic", "horseshoe", "guidance"):
+            self.assertIn(name, list_spreads())
+        self.assertEqual(get_spread("three").positions, ("Past", "Present", "Future"))
+        self.assertEqual(get_spread("celtic").positions, CELTIC_CROSS_POSITIONS)
+        self.assertEqual(get_spread("celtic").size, 10)
+
+    def test_layouts_are_immutable(self):
+        """Test that compiled layouts cannot be modified."""
+        layout = get_spread("three")
+        with self.assertRaises(AttributeError):
+            layout.title = "changed"
+        self.assertIsInstance(layout.positions, tuple)
+
+    def test_unknown_spread(self):
+        """Test that unknown spread names raise ValueError."""
+        with self.assertRaises(ValueError):
+            get_spread("pentagram")
+
+    def test_compile_errors(self):
+        """Test that malformed definitions are rejected."""
+        with self.assertRaises(ValueError):
+            compile_spread({"positions": ["A"]})
+        with self.assertRaises(ValueError):
+            compile_spread({"name": "empty", "positions": []})
+        with self.assertRaises(ValueError):
+            compile_spread({"name": "dupes", "positions": ["A", "A"]})
+        with self.assertRaises(ValueError):
+            compile_spread(
+                {"name": "bad", "positions": [{"name": "A", "groups": ["Coins"]}]}
+            )
+        with self.assertRaises(ValueError):
+            compile_spread(
+                {"name": "bad", "positions": [{"name": "A", "orientation": "sideways"}]}
+            )
+        with self.assertRaises(ValueError):
+            compile_spread(
+                {
+                    "name": "too_many",
+                    "positions": [
+                        {"name": str(i), "groups": ["Cups"]} for i in range(15)
+                    ],
+                }
+            )
+        with self.assertRaises(ValueError):
+            # Three overlapping pools of 28 cards, 60 positions, 42 cards
+            compile_spread(
+                {
+                    "name": "overlapping",
+                    "positions": [
+                        {"name": f"{i}{j}", "groups": groups}
+                        for i, groups in enumerate(
+                            [["Wands", "Cups"], ["Cups", "Swords"], ["Wands", "Swords"]]
+                        )
+                        for j in range(20)
+                    ],
+                }
+            )
+
+    def test_load_json_file(self):
+        """Test that spreads load from JSON files without code changes."""
+        definition = {
+            "name": "test_two_paths",
+            "title": "TWO PATHS",
+            "positions": ["Path A", "Path B"],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "spreads.json")
+            with open(path, "w") as f:
+                json.dump({"spreads": [definition]}, f)
+            layouts = load_spreads(tmp)
+
+        self.assertEqual(layouts[0].name, "test_two_paths")
+        reading = draw_spread("test_two_paths")
+        self.assertEqual(list(reading), ["Path A", "Path B"])
+
+    def test_load_toml_file(self):
+        """Test that spreads load from TOML files."""
+        from src import spreads
+
+        if spreads.tomllib is None:
+            self.skipTest("tomllib is not available")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "spreads.toml")
+            with open(path, "w") as f:
+                f.write(
+                    '[[spreads]]\nname = "test_toml"\n'
+                    'positions = ["Mind", "Body", "Spirit"]\n'
+                )
+            load_spreads(path)
+
+        self.assertEqual(get_spread("test_toml").positions, ("Mind", "Body", "Spirit"))
+
+
+class TestDrawSpread(unittest.TestCase):
+    def test_position_constraints(self):
+        """Test that per-position groups and orientations are honoured."""
+        for _ in range(30):
+            reading = draw_spread("guidance")
+            self.assertIn("number", reading["Lesson"])
+            self.assertEqual(reading["Next Step"]["orientation"], "Upright")
+            names = [card["name"] for card in reading.values()]
+            self.assertEqual(len(names), len(set(names)))
+
+    def test_tight_pools(self):
+        """Test that exactly-filled pools always succeed."""
+        register_spread(
+            {
+                "name": "test_all_cups",
+                "positions": [{"name": str(i), "groups": ["Cups"]} for i in range(14)]
+                + ["Any"],
+            }
+        )
+        reading = draw_spread("test_all_cups", personal_seed="INFP")
+        cups = [card for position, card in reading.items() if position != "Any"]
+        self.assertEqual(len({card["name"] for card in cups}), 14)
+        self.assertNotIn("Cups", reading["Any"]["name"])
+
+    def test_overlapping_pools(self):
+        """Test that overlapping pools never run out of cards mid-draw."""
+        register_spread(
+            {
+                "name": "test_overlap",
+                # Drawn first, these must leave every Wands and Cups card free
+                "positions": [
+                    {"name": f"CS{i}", "groups": ["Cups", "Swords"]} for i in range(14)
+                ]
+                + [{"name": f"WC{i}", "groups": ["Wands", "Cups"]} for i in range(28)],
+            }
+        )
+        for seed in range(20):
+            reading = draw_spread("test_overlap", personal_seed=str(seed))
+            names = [card["name"] for card in reading.values()]
+            self.assertEqual(len(set(names)), 42)
+            for i in range(14):
+                self.assertIn("Swords", reading[f"CS{i}"]["name"])
+
+    def test_constrained_spreads_need_draw_spread(self):
+        """Test that other engines reject per-position constraints."""
+        with self.assertRaises(ValueError):
+            draw_constrained("guidance")
+        with self.assertRaises(ValueError):
+            draw_spread("guidance", weights={"Cups": 2.0})
+
+    def test_registered_spreads_in_draw_constrained(self):
+        """Test that unconstrained registered spreads work everywhere."""
+        reading = draw_constrained("horseshoe", {"groups": ["Major Arcana"]})
+        self.assertEqual(len(reading), 7)
+
+    def test_spread_text(self):
+        """Test that registered spreads render through the text formatter."""
+        text = get_spread_text("horseshoe", "INFP")
+        self.assertIn("HORSESHOE SPREAD", text)
+        self.assertIn(" 7. OUTCOME:", text)
+        self.assertIn("INFP", text)
+
+        summary = get_reading_summary("guidance")
+        self.assertIn("📅 LESSON:", summary)
+        self.assertIn("💫", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@
 Test cases for the text formatting functions.
 """
 
+import io
+import json
 import unittest
 from src.text_formatter import (
     get_single_card_text,
@@ -9,7 +11,15 @@ from src.text_formatter import (
     get_celtic_cross_text,
     get_random_cards_text,
     get_reading_summary,
+    render,
+    render_summary,
+    render_to,
+    get_renderer,
+    list_renderers,
+    register_renderer,
+    Renderer,
 )
+from src.core import _reading_cards, draw_from_seed
 
 
 class TestTextFormatter(unittest.TestCase):
@@ -78,5 +88,186 @@ class TestTextFormatter(unittest.TestCase):
         self.assertIn("🎴", result)
 
 
+class TestRender(unittest.TestCase):
+    def test_render_does_not_draw(self):
+        """Test that rendering the same reading twice gives the same text."""
+        reading = draw_from_seed("celtic", 1)
+        text = render(reading)
+        self.assertEqual(text, render(reading, "celtic"))
+        for card in reading.values():
+            self.assertIn(card["name"], text)
+        self.assertIn("10. FINAL OUTCOME:", text)
+
+    def test_render_spread_matches_layout(self):
+        """Test header, seed line and position labels of a spread."""
+        reading = draw_from_seed("three", 2)
+        lines = render(reading, personal_seed="INTJ").split("\n")
+        self.assertEqual(lines[0], "═" * 50)
+        self.assertIn("THREE CARD SPREAD", lines[1])
+        self.assertEqual(lines[2], "🎯 Personal Seed: INTJ")
+        self.assertEqual(lines[3], "═" * 50)
+        self.assertEqual(lines[5], "📅 PAST:")
+        self.assertTrue(lines[6].startswith("🎴 " + reading["Past"]["name"]))
+
+    def test_render_single_and_counts(self):
+        """Test single cards and plain lists of cards."""
+        card = draw_from_seed("single", 3)
+        self.assertTrue(render(card).startswith("🎴 " + card["name"]))
+        cards = draw_from_seed(4, 4)
+        text = render(cards)
+        self.assertIn("4-CARD RANDOM DRAW", text)
+        self.assertIn("\n 4.\n🎴 " + cards[3]["name"], text)
+
+    def test_custom_meanings_are_kept(self):
+        """Test that cards outside the deck cache are formatted directly."""
+        card = dict(draw_from_seed("single", 5), meaning="Custom meaning")
+        self.assertIn("↳ Custom meaning", render(card))
+
+    def test_render_summary(self):
+        """Test summary headers and guidance footers."""
+        card = draw_from_seed("single", 6)
+        summary = render_summary(card, personal_seed="INFP")
+        self.assertIn("DAILY CARD READING", summary)
+        self.assertIn("🎯 Seed: INFP", summary)
+        self.assertTrue(summary.endswith("guidance for today."))
+
+        reading = draw_from_seed("celtic", 7)
+        summary = render_summary(reading)
+        self.assertTrue(summary.startswith(render(reading)))
+        self.assertIn("💫", summary)
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+    def flush(self):
+        self.flushes += 1
+
+
+class TestRenderTo(unittest.TestCase):
+    def test_text_matches_render(self):
+        """Test that streamed text is each rendering followed by a blank line."""
+        readings = [draw_from_seed("three", seed) for seed in range(5)]
+        stream = io.StringIO()
+        self.assertEqual(render_to(stream, iter(readings)), 5)
+        expected = "".join(render(reading) + "\n\n" for reading in readings)
+        self.assertEqual(stream.getvalue(), expected)
+
+    def test_chunked_writes_and_flush(self):
+        """Test that output is written in chunks and flushed on request."""
+        readings = (draw_from_seed("celtic", seed) for seed in range(50))
+        stream = _CountingStream()
+        render_to(stream, readings, "summary", "celtic", chunk_size=4000, flush=True)
+        self.assertGreater(stream.writes, 1)
+        self.assertLess(stream.writes, 50)
+        self.assertEqual(stream.flushes, stream.writes)
+
+    def test_binary_jsonl(self):
+        """Test JSON Lines output into a binary stream."""
+        readings = [draw_from_seed(3, seed) for seed in range(3)]
+        stream = io.BytesIO()
+        render_to(stream, readings, "jsonl")
+        lines = stream.getvalue().decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], readings)
+
+    def test_invalid_format(self):
+        """Test that unknown formats raise ValueError."""
+        with self.assertRaises(ValueError):
+            render_to(io.StringIO(), [], "yaml")
+
+
+class TestRenderers(unittest.TestCase):
+    def test_builtin_formats(self):
+        """Test that every built-in format is registered."""
+        for name in ("terminal", "summary", "markdown", "html", "jsonl"):
+            self.assertIn(name, list_renderers())
+        self.assertIs(get_renderer("text"), get_renderer("terminal"))
+        with self.assertRaises(ValueError):
+            get_renderer("yaml")
+
+    def test_jsonl_matches_json_dumps(self):
+        """Test that pre-encoded JSON equals json.dumps for every shape."""
+        renderer = get_renderer("jsonl")
+        for spread in ("single", "three", "celtic", 6):
+            reading = draw_from_seed(spread, 1)
+            self.assertEqual(
+                renderer.render_bytes(reading), json.dumps(reading).encode()
+            )
+        card = dict(draw_from_seed("single", 2), frequency=0.5)
+        self.assertEqual(renderer.render(card), json.dumps(card))
+
+    def test_jsonl_cache_needs_identical_cards(self):
+        """Test that reordered or changed cards are not served from cache."""
+        renderer = get_renderer("jsonl")
+        card = next(c for c in draw_from_seed(78, 1) if "number" in c)
+        reordered = dict(reversed(list(card.items())))
+        renumbered = dict(card, number=card["number"] + 1)
+        for variant in (reordered, renumbered):
+            self.assertEqual(renderer.render(variant), json.dumps(variant))
+
+    def test_jsonl_templates(self):
+        """Test that join() over a template matches render_bytes()."""
+        renderer = get_renderer("jsonl")
+        for spread in ("single", "three", 4):
+            reading = draw_from_seed(spread, 5)
+            fragments = [renderer.card(card) for card in _reading_cards(reading)]
+            self.assertEqual(
+                renderer.join(renderer.template(spread), fragments),
+                renderer.render_bytes(reading),
+            )
+
+    def test_markdown(self):
+        """Test Markdown headings and card fragments."""
+        reading = draw_from_seed("three", 3)
+        text = get_renderer("markdown").render(reading, personal_seed="a_b")
+        self.assertTrue(text.startswith("## 🔮 THREE CARD SPREAD"))
+        self.assertIn("*Personal Seed: a\\_b*", text)
+        self.assertIn("### Future\n\n**" + reading["Future"]["name"] + "**", text)
+
+    def test_html_is_escaped(self):
+        """Test HTML structure and escaping of user-supplied text."""
+        reading = draw_from_seed("celtic", 4)
+        text = get_renderer("html").render(reading, personal_seed="<b>&")
+        self.assertTrue(text.startswith('<section class="tarot-reading"'))
+        self.assertTrue(text.endswith("</section>"))
+        self.assertEqual(text.count('<div class="tarot-card'), 10)
+        self.assertIn("&lt;b&gt;&amp;", text)
+
+    def test_renderer_is_abstract(self):
+        """Test that renderers must implement the formatting hooks."""
+        with self.assertRaises(TypeError):
+            Renderer()
+
+    def test_custom_renderer(self):
+        """Test registering a renderer and streaming with it."""
+
+        class NamesRenderer(Renderer):
+            name = "names"
+            terminator = "\n"
+
+            def format_card(self, card):
+                return card["name"]
+
+            def compile_template(self, spread, layout):
+                return None
+
+            def join(self, template, fragments, personal_seed=None):
+                return ",".join(fragments)
+
+        register_renderer(NamesRenderer())
+        readings = [draw_from_seed(2, seed) for seed in range(3)]
+        stream = io.BytesIO()
+        render_to(stream, readings, "names")
+        lines = stream.getvalue().decode().splitlines()
+        self.assertEqual(lines[0], ",".join(card["name"] for card in readings[0]))
+
+
 if __name__ == "__main__":
     unittest.main()